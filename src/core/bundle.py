@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""Compiled content bundle: every JSON file under src/data in one SQLite file.
+
+Usage:
+    python -m src.core.bundle build     # validate and compile src/data
+    python -m src.core.bundle bench     # compare loose-file and bundle loading
+
+The bundle stores each document's text with the (mtime_ns, size) of the file
+it came from. Loaders ask lookup() first; a document is served from the
+bundle when its loose file is absent (shipped builds) or unchanged, and
+otherwise the loader falls back to the loose file (authoring).
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+BUNDLE_PATH = DATA_DIR / "content.bundle"
+
+# Per-user state and derived indexes are never bundled.
+EXCLUDE = {"progress.json", "settings.json", "search_index.json"}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE docs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+"""
+
+
+class BundleError(ValueError):
+    """Raised when content fails validation during a build."""
+
+
+def _require(cond: bool, rel: str, msg: str) -> None:
+    if not cond:
+        raise BundleError(f"{rel}: {msg}")
+
+
+def _validate_course(rel: str, doc: Dict[str, Any]) -> None:
+    _require(isinstance(doc.get("modules"), list), rel, "'modules' must be a list")
+    for i, m in enumerate(doc["modules"]):
+        _require(isinstance(m, dict) and "id" in m, rel, f"module {i} has no 'id'")
+
+
+def _validate_quiz(rel: str, doc: Dict[str, Any]) -> None:
+    _require(isinstance(doc.get("questions"), list), rel, "'questions' must be a list")
+    for i, q in enumerate(doc["questions"]):
+        choices = q.get("choices")
+        _require(isinstance(choices, list) and choices, rel, f"question {i} has no choices")
+        _require(isinstance(q.get("answer_index"), int) and 0 <= q["answer_index"] < len(choices),
+                 rel, f"question {i} answer_index out of range")
+
+
+def _validate_tests(key: str) -> Callable[[str, Dict[str, Any]], None]:
+    def check(rel: str, doc: Dict[str, Any]) -> None:
+        _require(isinstance(doc.get(key), str), rel, f"missing '{key}'")
+        _require(isinstance(doc.get("tests"), list), rel, "'tests' must be a list")
+    return check
+
+
+def _validate_stage(rel: str, doc: Dict[str, Any]) -> None:
+    stage = Path(rel).stem
+    if stage == "quiz":
+        for i, q in enumerate(doc.get("quiz", {}).get("mcq", [])):
+            choices = q.get("choices")
+            _require(isinstance(choices, list) and choices, rel, f"mcq {i} has no choices")
+            _require(isinstance(q.get("correct_index"), int) and 0 <= q["correct_index"] < len(choices),
+                     rel, f"mcq {i} correct_index out of range")
+    elif stage == "debug":
+        for i, err in enumerate(doc.get("error_pack", [])):
+            _require(isinstance(err.get("code"), str) and isinstance(err.get("error"), str),
+                     rel, f"error_pack {i} needs 'code' and 'error'")
+    elif stage == "challenge":
+        _require(isinstance(doc.get("coding_challenge", {}).get("tests"), list), rel, "challenge 'tests' must be a list")
+    elif stage == "lesson":
+        for i, ex in enumerate(doc.get("examples", [])):
+            _require(isinstance(ex.get("code"), str), rel, f"example {i} has no 'code'")
+
+
+VALIDATORS: Dict[str, Callable[[str, Dict[str, Any]], None]] = {
+    "course.json": _validate_course,
+    "quizzes": _validate_quiz,
+    "problems": _validate_tests("function"),
+    "debugs": _validate_tests("required_function"),
+    "lessons": _validate_stage,
+}
+
+
+def validate_document(rel: str, doc: Any) -> None:
+    """
+    Schema-check one content document.
+
+    Args:
+        rel: Path relative to the data directory (selects the schema)
+        doc: Parsed JSON
+
+    Raises:
+        BundleError: If the document is malformed
+    """
+    _require(isinstance(doc, dict), rel, "top level must be an object")
+    validate = VALIDATORS.get(rel) or VALIDATORS.get(rel.split("/", 1)[0])
+    if validate:
+        validate(rel, doc)
+
+
+def content_files(data_dir: Path = DATA_DIR) -> List[Path]:
+    """Every bundled content file under data_dir, sorted."""
+    return sorted(p for p in data_dir.rglob("*.json") if p.name not in EXCLUDE)
+
+
+def build_bundle(data_dir: Path = DATA_DIR, out: Path = BUNDLE_PATH) -> int:
+    """
+    Validate every content file and write the bundle atomically.
+
+    Returns:
+        Number of documents bundled
+
+    Raises:
+        BundleError: If a file is not valid JSON or fails its schema check
+    """
+    rows: List[Tuple[str, int, int, str]] = []
+    for src in content_files(data_dir):
+        rel = src.relative_to(data_dir).as_posix()
+        text = src.read_text(encoding="utf-8-sig")
+        try:
+            doc = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise BundleError(f"{rel}: invalid JSON: {e}")
+        validate_document(rel, doc)
+        st = src.stat()
+        # Re-serialise compactly: smaller file, and the text is known-good JSON.
+        rows.append((rel, st.st_mtime_ns, st.st_size, json.dumps(doc, ensure_ascii=False, separators=(",", ":"))))
+
+    tmp = out.with_name(out.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    con = sqlite3.connect(tmp)
+    try:
+        con.executescript(SCHEMA)
+        con.executemany("INSERT INTO docs VALUES (?, ?, ?, ?)", rows)
+        con.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("version", str(BUNDLE_VERSION)),
+            ("built_at", str(int(time.time()))),
+            ("documents", str(len(rows))),
+        ])
+        con.commit()
+    finally:
+        con.close()
+    os.replace(tmp, out)
+    logger.info(f"Built content bundle {out} with {len(rows)} documents")
+    return len(rows)
+
+
+class ContentBundle:
+    """Read-only, lazily queried view of a built bundle."""
+
+    def __init__(self, path: Path = BUNDLE_PATH, data_dir: Path = DATA_DIR):
+        self.path = Path(path)
+        self.data_dir = Path(data_dir).resolve()
+        self._con = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._docs: Dict[str, Any] = {}
+        version = self._con.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if not version or int(version[0]) != BUNDLE_VERSION:
+            self._con.close()
+            raise BundleError(f"Unsupported bundle version in {self.path}: {version}")
+
+    def _rel(self, path: str) -> Optional[str]:
+        try:
+            return Path(path).resolve().relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return None
+
+    def lookup(self, path: str) -> Optional[Any]:
+        """Parsed document for a loose-file path, or None to fall back to the file."""
+        rel = self._rel(path)
+        if rel is None:
+            return None
+        with self._lock:
+            row = self._con.execute("SELECT mtime_ns, size, body FROM docs WHERE path = ?", (rel,)).fetchone()
+            if row is None:
+                return None
+            try:
+                st = os.stat(self.data_dir / rel)
+                if (st.st_mtime_ns, st.st_size) != (row[0], row[1]):
+                    logger.debug(f"Loose file newer than bundle, using it: {rel}")
+                    return None
+            except FileNotFoundError:
+                pass
+            doc = self._docs.get(rel)
+            if doc is None:
+                doc = self._docs[rel] = json.loads(row[2])
+            return doc
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._con.execute("SELECT path FROM docs ORDER BY path")]
+
+    def close(self) -> None:
+        self._con.close()
+
+
+_bundle: Optional[ContentBundle] = None
+_bundle_checked = False
+_bundle_lock = threading.Lock()
+
+
+def get_bundle() -> Optional[ContentBundle]:
+    """The process-wide bundle, or None when none has been built."""
+    global _bundle, _bundle_checked
+    with _bundle_lock:
+        if not _bundle_checked:
+            _bundle_checked = True
+            if BUNDLE_PATH.exists():
+                try:
+                    _bundle = ContentBundle()
+                    logger.info(f"Using content bundle {BUNDLE_PATH}")
+                except (sqlite3.Error, BundleError) as e:
+                    logger.warning(f"Ignoring unusable content bundle: {e}")
+        return _bundle
+
+
+def bundled(path: str) -> Optional[Any]:
+    """Shorthand for get_bundle().lookup(path) that tolerates a missing bundle."""
+    bundle = get_bundle()
+    return bundle.lookup(path) if bundle else None
+
+
+def _bench(data_dir: Path, out: Path, rounds: int) -> None:
+    sources = content_files(data_dir)
+
+    def loose() -> None:
+        for p in sources:
+            json.loads(p.read_text(encoding="utf-8-sig"))
+
+    def from_bundle() -> None:
+        b = ContentBundle(out, data_dir)
+        for rel in b.paths():
+            b.lookup(str(data_dir / rel))
+        b.close()
+
+    for name, fn in (("loose files", loose), ("bundle", from_bundle)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        ms = (time.perf_counter() - start) * 1000 / rounds
+        print(f"{name:<12} {ms:8.2f} ms per cold load of {len(sources)} documents")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or benchmark the compiled content bundle.")
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("--data", default=str(DATA_DIR), help="Content directory (default: src/data)")
+    parser.add_argument("--out", default=None, help="Bundle path (default: <data>/content.bundle)")
+    parser.add_argument("--rounds", type=int, default=50, help="Benchmark rounds")
+    args = parser.parse_args(argv)
+
+    data_dir = Path(args.data).resolve()
+    out = Path(args.out) if args.out else data_dir / BUNDLE_PATH.name
+    if args.command == "build":
+        try:
+            n = build_bundle(data_dir, out)
+        except BundleError as e:
+            print(f"Build failed: {e}", file=sys.stderr)
+            return 1
+        print(f"Bundled {n} documents -> {out}")
+        # Refresh the persisted search index alongside the bundle.
+        from src.engine.search import SearchIndex
+        index = SearchIndex(data_dir)
+        index.update()
+        index.save()
+        print(f"Search index: {len(index)} documents")
+        return 0
+
+    if not out.exists():
+        build_bundle(data_dir, out)
+    _bench(data_dir, out, args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Shared, stat-validated cache for parsed content files."""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters for a ContentCache."""
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def __str__(self) -> str:
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, stale={self.stale}, "
+                f"evictions={self.evictions}, entries={self.entries}, bytes={self.bytes})")
+
+
+class ContentCache:
+    """
+    LRU cache of parsed files keyed by path.
+
+    An entry is reused only while the file's (mtime_ns, size) is unchanged, so
+    edits on disk are picked up on the next call. Memory is bounded by entry
+    count and by the total size of the source files. Cached objects are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # path -> ((mtime_ns, size), value)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, load: Callable[[str], Any]) -> Any:
+        """
+        Return the parsed content of path, calling load(path) on a miss.
+
+        Raises:
+            Whatever os.stat or load raise (nothing is cached on failure)
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        sig = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == sig:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry[1]
+                self._drop(key)
+                self._stats.stale += 1
+            self._stats.misses += 1
+
+        value = load(path)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (sig, value)
+            self._stats.bytes += sig[1]
+            self._stats.entries = len(self._entries)
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries
+                                              or self._stats.bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self._stats.evictions += 1
+        return value
+
+    def _drop(self, key: str) -> None:
+        sig, _ = self._entries.pop(key)
+        self._stats.bytes -= sig[1]
+        self._stats.entries = len(self._entries)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget one path, or everything when path is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._stats.bytes = 0
+                self._stats.entries = 0
+            elif os.path.abspath(path) in self._entries:
+                self._drop(os.path.abspath(path))
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+
+_cache: Optional[ContentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> ContentCache:
+    """Get the process-wide content cache shared by all loaders."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ContentCache()
+        return _cache
+
+
+def cached_load(path: Path, load: Callable[[str], Any]) -> Any:
+    """Shorthand for get_content_cache().get(str(path), load)."""
+    return get_content_cache().get(str(path), load)
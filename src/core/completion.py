@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Completion tracking as bitsets over stable content ordinals.
+
+Every completable item (lesson, quiz, debug, problem set, hackathon) has an
+ordinal within its kind, taken from the ordinal registry (src/data/ordinals.json).
+The registry is append-only: items new in course.json are added at the end and
+removed items keep their slot, so a saved bitset always means the same items.
+Completion of a kind is one bit per ordinal in a bytearray: O(1) to test or
+set, and a few bytes to store however large the course gets.
+
+Saved form (the "completed" key of progress.json):
+
+    {"v": 1, "bits": {"lessons": "<base64>", ...}, "extra": {"lessons": ["old_id"]}}
+
+"extra" keeps ids the registry doesn't know, so converting from the old
+{kind: [ids]} lists is lossless (apart from list order, which becomes ordinal
+order).
+"""
+
+import base64
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.io import write_json
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("lessons", "quizzes", "debugs", "problemsets", "hackathons")
+# Item id per module when course.json doesn't list a kind's items explicitly.
+DEFAULT_ITEMS = {"lessons": "{}_lesson", "quizzes": "{}_quiz", "debugs": "{}_debug", "problemsets": "{}_ps1"}
+FORMAT_VERSION = 1
+
+DATA = Path(__file__).resolve().parent.parent / "data"
+COURSE_PATH = DATA / "course.json"
+ORDINALS_PATH = DATA / "ordinals.json"
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def course_items(course: Dict[str, Any]) -> Dict[str, List[Tuple[str, str]]]:
+    """(module id, item id) pairs of each kind, in course order."""
+    items: Dict[str, List[Tuple[str, str]]] = {kind: [] for kind in KINDS}
+    for module in course.get("modules", []):
+        mid = module.get("id", "")
+        for kind in KINDS:
+            ids = module.get(kind)
+            if ids is None:
+                ids = [DEFAULT_ITEMS[kind].format(mid)] if kind in DEFAULT_ITEMS and mid else []
+            items[kind].extend((mid, item) for item in ids)
+    return items
+
+
+class Catalog:
+    """Ordinal of every registered item, and which items the current course contains."""
+
+    def __init__(self, ordinals: Dict[str, List[str]],
+                 items: Optional[Dict[str, List[Tuple[str, str]]]] = None):
+        self.ids = {kind: list(ordinals.get(kind, [])) for kind in KINDS}
+        self._ordinal = {kind: {item: n for n, item in enumerate(ids)} for kind, ids in self.ids.items()}
+        self.live: Dict[str, int] = {}
+        self.modules: Dict[str, Dict[str, int]] = {}
+        self._module: Dict[Tuple[str, str], str] = {}
+        for kind in KINDS:
+            if items is None:
+                self.live[kind] = (1 << len(self.ids[kind])) - 1
+                continue
+            mask = 0
+            for mid, item in items.get(kind, []):
+                bit = 1 << self._ordinal[kind][item]
+                mask |= bit
+                per_module = self.modules.setdefault(mid, {})
+                per_module[kind] = per_module.get(kind, 0) | bit
+                self._module[(kind, item)] = mid
+            self.live[kind] = mask
+        self.totals = {kind: _popcount(mask) for kind, mask in self.live.items()}
+
+    def ordinal(self, kind: str, item: str) -> Optional[int]:
+        return self._ordinal.get(kind, {}).get(item)
+
+    def module_of(self, kind: str, item: str) -> Optional[str]:
+        """Id of the module an item belongs to in the current course."""
+        return self._module.get((kind, item))
+
+
+def load_catalog(course_path: Path = COURSE_PATH, ordinals_path: Path = ORDINALS_PATH) -> Catalog:
+    """Registry plus course; items new in the course are appended to the registry."""
+    try:
+        ordinals = json.loads(Path(ordinals_path).read_text(encoding="utf-8-sig"))
+    except FileNotFoundError:
+        ordinals = {}
+    try:
+        course = json.loads(Path(course_path).read_text(encoding="utf-8-sig"))
+    except FileNotFoundError:
+        logger.warning(f"Course file not found: {course_path}; using registered ordinals only")
+        return Catalog(ordinals)
+    items = course_items(course)
+    changed = False
+    for kind in KINDS:
+        known = ordinals.setdefault(kind, [])
+        seen = set(known)
+        for _, item in items[kind]:
+            if item not in seen:
+                known.append(item)
+                seen.add(item)
+                changed = True
+    if changed:
+        try:
+            write_json(str(ordinals_path), ordinals)
+        except IOError as e:  # read-only install: ordinals still hold for this session
+            logger.warning(f"Could not update {ordinals_path}: {e}")
+    return Catalog(ordinals, items)
+
+
+_catalog: Optional[Catalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = load_catalog()
+        return _catalog
+
+
+class Completion:
+    """Completed items of every kind: a bitset over the catalog plus unknown ids."""
+
+    def __init__(self, catalog: Optional[Catalog] = None):
+        self.catalog = catalog or get_catalog()
+        self._bits: Dict[str, bytearray] = {}
+        self._extra: Dict[str, List[str]] = {}
+        self._done: Dict[str, int] = {}       # live items completed, per kind
+
+    def kinds(self) -> List[str]:
+        return list(dict.fromkeys(list(self._bits) + list(self._extra)))
+
+    def _kind(self, kind: str) -> bytearray:
+        bits = self._bits.get(kind)
+        if bits is None:
+            bits = self._bits[kind] = bytearray()
+            self._done.setdefault(kind, 0)
+        return bits
+
+    def add(self, kind: str, item: str) -> bool:
+        """Mark an item completed. Returns False if it already was."""
+        bits = self._kind(kind)
+        n = self.catalog.ordinal(kind, item)
+        if n is None:
+            extra = self._extra.setdefault(kind, [])
+            if item in extra:
+                return False
+            extra.append(item)
+            return True
+        byte, bit = divmod(n, 8)
+        if byte >= len(bits):
+            bits.extend(bytes(byte + 1 - len(bits)))
+        if bits[byte] >> bit & 1:
+            return False
+        bits[byte] |= 1 << bit
+        if self.catalog.live.get(kind, 0) >> n & 1:
+            self._done[kind] += 1
+        return True
+
+    def has(self, kind: str, item: str) -> bool:
+        n = self.catalog.ordinal(kind, item)
+        if n is None:
+            return item in self._extra.get(kind, ())
+        bits = self._bits.get(kind)
+        byte, bit = divmod(n, 8)
+        return bits is not None and byte < len(bits) and bool(bits[byte] >> bit & 1)
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Completed items of the current course (of one kind, or all)."""
+        return self._done.get(kind, 0) if kind else sum(self._done.values())
+
+    def percent(self, kind: Optional[str] = None) -> float:
+        """Share of the current course completed, 0-100."""
+        total = self.catalog.totals.get(kind, 0) if kind else sum(self.catalog.totals.values())
+        return 100.0 * self.count(kind) / total if total else 0.0
+
+    def module_percent(self, module_id: str) -> float:
+        """Share of one module's items completed, 0-100."""
+        masks = self.catalog.modules.get(module_id, {})
+        total = sum(_popcount(m) for m in masks.values())
+        if not total:
+            return 0.0
+        done = sum(_popcount(int.from_bytes(self._bits.get(kind, b""), "little") & m) for kind, m in masks.items())
+        return 100.0 * done / total
+
+    # -------------------- conversion --------------------
+
+    @classmethod
+    def from_lists(cls, completed: Dict[str, Iterable[str]], catalog: Optional[Catalog] = None) -> "Completion":
+        c = cls(catalog)
+        for kind, items in completed.items():
+            c._kind(kind)
+            for item in items:
+                c.add(kind, str(item))
+        return c
+
+    def to_lists(self) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for kind in self.kinds():
+            value = int.from_bytes(self._bits.get(kind, b""), "little")
+            ids = self.catalog.ids.get(kind, [])
+            out[kind] = [item for n, item in enumerate(ids) if value >> n & 1] + list(self._extra.get(kind, []))
+        return out
+
+    def encode(self) -> Dict[str, Any]:
+        """Compact JSON form (see module docstring)."""
+        data: Dict[str, Any] = {
+            "v": FORMAT_VERSION,
+            "bits": {kind: base64.b64encode(bytes(bits).rstrip(b"\0")).decode("ascii")
+                     for kind, bits in self._bits.items()},
+        }
+        extra = {kind: list(ids) for kind, ids in self._extra.items() if ids}
+        if extra:
+            data["extra"] = extra
+        return data
+
+    @classmethod
+    def decode(cls, data: Dict[str, Any], catalog: Optional[Catalog] = None) -> "Completion":
+        """Either saved form: encoded bitsets, or the old {kind: [ids]} lists."""
+        if not is_encoded(data):
+            return cls.from_lists(data, catalog)
+        if data.get("v") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported completion format: {data.get('v')}")
+        c = cls(catalog)
+        for kind, text in data.get("bits", {}).items():
+            bits = c._bits[kind] = bytearray(base64.b64decode(text))
+            value = int.from_bytes(bits, "little")
+            c._done[kind] = _popcount(value & c.catalog.live.get(kind, 0))
+        for kind, ids in data.get("extra", {}).items():
+            c._kind(kind)
+            c._extra[kind] = list(ids)
+        return c
+
+
+def is_encoded(completed: Any) -> bool:
+    return isinstance(completed, dict) and "bits" in completed and "v" in completed
+
+
+def as_lists(completed: Dict[str, Any], catalog: Optional[Catalog] = None) -> Dict[str, List[str]]:
+    """{kind: [ids]} for either saved form."""
+    if not is_encoded(completed):
+        return {kind: list(items) for kind, items in completed.items()}
+    return Completion.decode(completed, catalog).to_lists()
@@ -31,6 +31,11 @@ DEFAULT_CONFIG = {
         "quizzes_dir": "src/data/quizzes",
         "debugs_dir": "src/data/debugs",
     },
+    "progress": {
+        "backend": "json",
+        "db_path": "",
+        "recent_attempts": 20,
+    },
     "logging": {
         "level": "INFO",
         "enable_file_logging": True,
@@ -6,6 +6,9 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from src.core.bundle import bundled
+from src.core.cache import cached_load
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +40,12 @@ def load_lesson(path: str) -> str:
         raise IOError(f"Cannot read lesson file {path}: {e}")
 
 
+def _parse_problem(path: str) -> Dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8-sig"))
+    logger.info(f"Successfully loaded problem from {path}")
+    return data
+
+
 def load_problem(problem_id: str, base_dir: str = "src/data/problems") -> Dict[str, Any]:
     """
     Load problem definition from JSON file.
@@ -46,7 +55,8 @@ def load_problem(problem_id: str, base_dir: str = "src/data/problems") -> Dict[s
         base_dir: Base directory containing problem files
         
     Returns:
-        Problem definition as dictionary
+        Problem definition as dictionary (shared via the content cache;
+        do not mutate)
         
     Raises:
         FileNotFoundError: If problem file doesn't exist
@@ -59,13 +69,15 @@ def load_problem(problem_id: str, base_dir: str = "src/data/problems") -> Dict[s
     
     try:
         p = Path(base_dir) / f"{problem_id}.json"
+        problem_data = bundled(str(p))
+        if problem_data is not None:
+            return problem_data
         if not p.exists():
             logger.error(f"Problem file not found: {p}")
             raise FileNotFoundError(f"Problem file not found: {p}")
         
-        content = p.read_text(encoding="utf-8-sig")
-        problem_data = json.loads(content)
-        logger.info(f"Successfully loaded problem {problem_id}")
+        problem_data = cached_load(p, _parse_problem)
+        logger.debug(f"Loaded problem {problem_id}")
         return problem_data
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in problem file {problem_id}: {e}")
@@ -1,5 +1,21 @@
 ﻿# -*- coding: utf-8 -*-
-import io, contextlib, traceback
+import io, contextlib, reprlib, traceback
+
+from src.engine.fixtures import FixtureError, fixture_path
+from src.engine.scratch import get_scratch_pool
+from src.engine.shrink import shrink_args
+from src.engine.worker import WorkerError, WorkerSession, WorkerTimeout
+
+SHRINK_BUDGET_SEC = 2.0
+
+_short = reprlib.Repr()
+_short.maxlist = _short.maxtuple = 8
+_short.maxstring = _short.maxother = 60
+_short.maxlevel = 3
+
+def _show(value):
+    """Bounded repr so huge hidden-test inputs don't flood the feedback pane."""
+    return _short.repr(value)
 
 def run_code_capture_stdout(code: str):
     buf = io.StringIO()
@@ -10,35 +26,133 @@ def run_code_capture_stdout(code: str):
     except Exception:
         return False, buf.getvalue() + "\n" + traceback.format_exc()
 
-def grade_problem(code: str, spec: dict):
-    env = {}
-    try:
-        exec(code, {}, env)
-    except Exception as e:
-        return False, f"❌ Your code crashed before tests ran:\n{e}"
+def _as_args(inp):
+    return list(inp) if isinstance(inp, (list, tuple)) else [inp]
 
+def minimal_reproducer(session: WorkerSession, spec: dict, inp, error_type=None):
+    """
+    Shrink a failing input by re-running the student function in the same worker session.
+
+    A crash is reproduced when a smaller input raises the same exception type.
+    A wrong answer can only be reproduced against spec["reference_solution"],
+    since the spec has no expected value for the smaller inputs.
+    Returns the shrunk argument list, or None if nothing could be shrunk.
+    """
     fn_name = spec.get("function")
-    if fn_name and fn_name not in env:
-        return False, f"❌ Missing required function: {fn_name}()"
+    args = _as_args(inp)
+    if not fn_name or not any(isinstance(a, (list, str)) and len(a) > 1 for a in args):
+        return None
+    reference = spec.get("reference_solution")
+    if error_type is None and not reference:
+        return None
+
+    try:
+        if reference and not session.load(reference, ns="reference").get("ok"):
+            return None
+
+        def fails(candidate):
+            try:
+                r = session.probe(fn_name, candidate, ref_fn=None if error_type else fn_name)
+            except WorkerError:
+                return False
+            if error_type:
+                return r.get("kind") == "error" and r.get("error") == error_type
+            return r.get("kind") == "mismatch"
+
+        result = shrink_args(args, fails, budget_sec=float(spec.get("shrink_budget_sec", SHRINK_BUDGET_SEC)))
+    except WorkerError:
+        return None
+    return result.args if result.args != args else None
 
-    func = env.get(fn_name) if fn_name else None
+def _worker_test(t):
+    """
+    A spec test as sent to the worker. "input_fixture" / "expected_fixture"
+    ("sha256:...") are sent as file paths; the worker maps them itself.
+    """
+    wt = {}
+    if "input_fixture" in t:
+        wt["args_fixture"] = {"path": str(fixture_path(t["input_fixture"])), "decode": t.get("decode", "text")}
+    else:
+        wt["args"] = _as_args(t.get("input"))
+    if "expected_fixture" in t:
+        wt["expected_fixture"] = {"path": str(fixture_path(t["expected_fixture"])),
+                                  "decode": t.get("expected_decode", t.get("decode", "text"))}
+    else:
+        wt["expected"] = t.get("expected")
+    return wt
 
-    # Optional: forbid early features (simple keyword checks)
-    forbidden = spec.get("forbidden_keywords", [])
-    lowered = code.lower()
-    for kw in forbidden:
-        if kw.lower() in lowered:
-            return False, f"❌ This problem forbids using: {kw}"
+def _fixture_label(ref):
+    return f"<fixture {ref[:19]}…>"
 
+def _repro_note(session, spec, inp, error_type=None):
+    shrunk = minimal_reproducer(session, spec, inp, error_type)
+    if shrunk is None:
+        return ""
+    shown = shrunk if isinstance(inp, (list, tuple)) else shrunk[0]
+    return f"\nMinimal failing input: {_show(shown)}"
+
+def _describe(verdict):
+    # Large return values never leave the worker: only a bounded summary + digest does.
+    got = verdict.get("summary", "?")
+    if "len" in verdict and "..." in got:
+        got += f" (len {verdict['len']}, digest {verdict.get('digest')})"
+    return got
+
+def grade_problem(code: str, spec: dict):
+    """
+    Grade a function problem. The student's code is loaded once into a worker
+    session, the expected values are preloaded there, and each test is compared
+    inside the worker so only a verdict crosses the process boundary. The
+    worker runs in a scratch directory leased from the pool, never the app's own.
+    """
+    fn_name = spec.get("function")
     tests = spec.get("tests", [])
-    for t in tests:
-        inp = t.get("input")
-        expected = t.get("expected")
+
+    with get_scratch_pool().lease() as scratch, \
+            WorkerSession(timeout_sec=float(spec.get("timeout_sec", 2.0)), cwd=str(scratch)) as session:
         try:
-            out = func(*inp) if isinstance(inp, (list, tuple)) else func(inp)
-        except Exception as e:
-            return False, f"❌ Failed on input {inp}. Error: {e}"
-        if out != expected:
-            return False, f"❌ Failed on input {inp}. Expected {expected}, got {out}"
+            loaded = session.load(code)
+        except WorkerTimeout:
+            return False, "❌ Your code took too long before tests ran (possible infinite loop)."
+        except WorkerError as e:
+            return False, f"❌ Could not start the grader: {e}"
+        if not loaded.get("ok"):
+            return False, f"❌ Your code crashed before tests ran:\n{loaded.get('message', loaded.get('error'))}"
+
+        if fn_name and fn_name not in loaded.get("functions", []):
+            return False, f"❌ Missing required function: {fn_name}()"
+
+        # Optional: forbid early features (simple keyword checks)
+        forbidden = spec.get("forbidden_keywords", [])
+        lowered = code.lower()
+        for kw in forbidden:
+            if kw.lower() in lowered:
+                return False, f"❌ This problem forbids using: {kw}"
+
+        try:
+            session.expect(fn_name, [_worker_test(t) for t in tests])
+        except FixtureError as e:
+            return False, f"❌ Problem misconfigured: {e}"
+        for i, t in enumerate(tests):
+            inp = _fixture_label(t["input_fixture"]) if "input_fixture" in t else t.get("input")
+            expected = _fixture_label(t["expected_fixture"]) if "expected_fixture" in t else t.get("expected")
+            shrinkable = "input_fixture" not in t
+            try:
+                verdict = session.check(fn_name, i)
+            except WorkerTimeout:
+                return False, f"❌ Failed on input {_show(inp)}. Timed out (possible infinite loop)."
+            except WorkerError as e:
+                return False, f"❌ Failed on input {_show(inp)}. Error: {e}"
+
+            kind = verdict.get("kind")
+            if not verdict.get("ok"):
+                return False, f"❌ Failed on input {_show(inp)}. Error: {verdict.get('error')}"
+            if kind == "error":
+                err = verdict.get("message") or verdict.get("error")
+                note = _repro_note(session, spec, inp, verdict.get("error")) if shrinkable else ""
+                return False, f"❌ Failed on input {_show(inp)}. Error: {err}" + note
+            if kind == "mismatch":
+                msg = f"❌ Failed on input {_show(inp)}. Expected {_show(expected)}, got {_describe(verdict)}"
+                return False, msg + (_repro_note(session, spec, inp) if shrinkable else "")
 
     return True, "✅ All tests passed!"
@@ -3,9 +3,13 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from src.core.bundle import bundled
+from src.core.cache import cached_load
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,12 +41,27 @@ def read_text_utf8(path: str) -> str:
         raise IOError(f"Cannot read file {path}: {e}")
 
 
-def load_json(path: str) -> Dict[str, Any]:
+def _parse_json_file(path: str) -> Dict[str, Any]:
+    try:
+        content = read_text_utf8(path)
+        data = json.loads(content)
+        logger.info(f"Successfully loaded JSON from {path}")
+        return data
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in {path}: {e}")
+        raise json.JSONDecodeError(f"Invalid JSON in {path}", e.doc, e.pos)
+
+
+def load_json(path: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Load JSON file with error handling.
     
     Args:
         path: Path to JSON file
+        use_cache: Serve from the content bundle or the shared content
+                   cache while the file is unchanged. The result is then
+                   shared and must not be mutated; pass False for data the
+                   caller edits.
         
     Returns:
         Parsed JSON data as dictionary
@@ -51,14 +70,15 @@ def load_json(path: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is invalid JSON
     """
-    try:
-        content = read_text_utf8(path)
-        data = json.loads(content)
-        logger.info(f"Successfully loaded JSON from {path}")
+    if not use_cache:
+        return _parse_json_file(path)
+    data = bundled(path)
+    if data is not None:
         return data
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {path}: {e}")
-        raise json.JSONDecodeError(f"Invalid JSON in {path}", e.doc, e.pos)
+    if not Path(path).exists():
+        logger.error(f"File not found: {path}")
+        raise FileNotFoundError(f"File not found: {path}")
+    return cached_load(path, _parse_json_file)
 
 
 def write_json(path: str, data: Dict[str, Any]) -> None:
@@ -80,7 +100,11 @@ def write_json(path: str, data: Dict[str, Any]) -> None:
     try:
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Write a sibling temp file and rename it over the target, so readers
+        # (and a crash mid-write) never see a truncated file.
+        tmp = file_path.with_name(file_path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, file_path)
         logger.info(f"Successfully wrote JSON to {path}")
     except (IOError, OSError) as e:
         logger.error(f"Error writing JSON to {path}: {e}")
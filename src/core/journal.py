@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Crash-safe JSON state files: a snapshot plus an append-only journal.
+
+    progress.json           snapshot, only ever replaced atomically
+    progress.json.journal   one JSON record per save, fsync'd
+
+A save appends only what changed since the last save (set/delete operations
+on key paths), so its cost follows the size of the change, not of the state.
+Loading reads the snapshot and replays the journal. Operations hold absolute
+values, so replaying records that are already in the snapshot (after a crash
+between compaction's rename and the journal truncation) is harmless. A torn
+last record from a crash mid-append is skipped. Once the journal has grown
+enough, compaction writes a fresh snapshot (temp file, fsync, rename) and
+empties the journal.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COMPACT_RECORDS = 200        # compact after this many journal records...
+COMPACT_MIN_BYTES = 64 * 1024  # ...or once the journal outgrows the snapshot and this
+
+Op = Dict[str, Any]          # {"p": [key, ...], "v": value} or {"p": [...], "d": 1}
+
+
+def diff(old: Any, new: Any, path: Optional[List[str]] = None) -> List[Op]:
+    """Operations turning old into new, descending into nested dicts."""
+    path = path or []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Op] = []
+        for key in old.keys() - new.keys():
+            ops.append({"p": path + [key], "d": 1})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"p": path + [key], "v": value})
+            elif old[key] != value:
+                ops.extend(diff(old[key], value, path + [key]))
+        return ops
+    return [] if old == new else [{"p": path, "v": new}]
+
+
+def apply(state: Dict[str, Any], ops: List[Op]) -> Dict[str, Any]:
+    """Apply operations in order; returns the (possibly replaced) state."""
+    for op in ops:
+        *parents, last = op["p"] or [None]
+        if last is None:                      # whole-state replacement
+            state = copy.deepcopy(op["v"]) if isinstance(op.get("v"), dict) else {}
+            continue
+        node = state
+        for key in parents:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        if op.get("d"):
+            node.pop(last, None)
+        else:
+            node[last] = copy.deepcopy(op["v"])
+    return state
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:  # not supported on Windows; the rename itself is still atomic
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class Journal:
+    """Snapshot + journal persistence for one JSON state file."""
+
+    def __init__(self, path: Path, compact_records: int = COMPACT_RECORDS):
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.compact_records = compact_records
+        self._lock = threading.Lock()
+        self._last: Optional[Dict[str, Any]] = None
+        self._records = 0
+
+    def exists(self) -> bool:
+        return self.path.exists() or self.journal_path.exists()
+
+    def load(self, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Current state: snapshot plus replayed journal (default if neither exists).
+
+        An unreadable snapshot (e.g. truncated by an older, non-atomic writer) is
+        moved aside as <name>.corrupt-<time> instead of being overwritten, and so
+        is a journal with a bad record before valid ones; a torn last record is
+        just dropped.
+        """
+        with self._lock:
+            state = self._read_snapshot(default)
+            records, damaged, lost = 0, False, False
+            if self.journal_path.exists():
+                with open(self.journal_path, "rb") as f:
+                    lines = f.read().split(b"\n")
+                for n, line in enumerate(lines):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        if any(rest.strip() for rest in lines[n + 1:]):
+                            logger.error(f"Corrupt record {n + 1} in {self.journal_path}; later records ignored")
+                            lost = True
+                        else:
+                            logger.warning(f"Ignoring torn last record in {self.journal_path}")
+                        damaged = True
+                        break
+                    state = apply(state, record.get("ops", []))
+                    records += 1
+            self._last = copy.deepcopy(state)
+            self._records = records
+            if lost:  # the records after the bad line may still be recovered by hand
+                aside = self.journal_path.with_name(f"{self.journal_path.name}.corrupt-{int(time.time())}")
+                os.replace(self.journal_path, aside)
+                logger.error(f"Kept the damaged journal as {aside.name}")
+            if damaged:  # new records must not land behind a bad line
+                self._compact(state)
+            return state
+
+    def _read_snapshot(self, default: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if not self.path.exists():
+            return copy.deepcopy(default) if default is not None else {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8-sig"))
+            if not isinstance(data, dict):
+                raise ValueError("snapshot is not an object")
+            return data
+        except (ValueError, UnicodeDecodeError) as e:
+            aside = self.path.with_name(f"{self.path.name}.corrupt-{int(time.time())}")
+            os.replace(self.path, aside)
+            logger.error(f"Unreadable {self.path.name} ({e}); kept as {aside.name}, starting from defaults")
+            return copy.deepcopy(default) if default is not None else {}
+
+    def save(self, state: Dict[str, Any]) -> int:
+        """
+        Persist state by journaling what changed since the last load/save.
+
+        Returns:
+            Number of operations written (0 if nothing changed)
+        """
+        with self._lock:
+            if self._last is None:  # nothing known to diff against: start a fresh snapshot
+                self._compact(state)
+                return 1
+            ops = diff(self._last, state)
+            if not ops:
+                return 0
+            line = (json.dumps({"ops": ops}, ensure_ascii=False) + "\n").encode("utf-8")
+            with open(self.journal_path, "ab") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._last = copy.deepcopy(state)
+            self._records += 1
+            if self._should_compact():
+                self._compact(state)
+            return len(ops)
+
+    def _should_compact(self) -> bool:
+        if self._records >= self.compact_records:
+            return True
+        try:
+            size = self.journal_path.stat().st_size
+            return size > COMPACT_MIN_BYTES and size > self.path.stat().st_size
+        except OSError:
+            return False
+
+    def compact(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Write a fresh snapshot and empty the journal."""
+        with self._lock:
+            if state is None:
+                state = self._last if self._last is not None else {}
+            self._compact(state)
+
+    def _compact(self, state: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(state, indent=2, ensure_ascii=False))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        _fsync_dir(self.path.parent)
+        # A crash here leaves records the snapshot already contains; replay is idempotent.
+        with open(self.journal_path, "wb") as f:
+            os.fsync(f.fileno())
+        self._last = copy.deepcopy(state)
+        self._records = 0
+        logger.info(f"Compacted {self.path.name}")
+
+
+_journals: Dict[str, Journal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(path: Path) -> Journal:
+    """The process-wide Journal for a state file."""
+    key = os.path.abspath(path)
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = Journal(Path(path))
+        return _journals[key]
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-profile progress in SQLite, for machines shared by many students.
+
+Enable it in config.json:
+
+    "progress": {"backend": "sqlite", "db_path": "D:/CodeQuest/profiles.db"}
+
+(db_path defaults to %PROGRAMDATA%/CodeQuest on Windows, which all accounts
+share, and to the per-user XDG data directory elsewhere; point it at a shared
+location when students log in with separate OS accounts.)
+Both progress schemas map onto one profile: the page app's
+last_route / unlocked_module / completed and the main window's
+module_index / history / terminal_unlocked. The first time a profile is
+used, an existing progress.json (and its journal) is migrated into it.
+
+The database runs in WAL mode so several app instances can read while one
+writes; every save is a short BEGIN IMMEDIATE transaction. Saves merge rather
+than overwrite: completions and attempts are only ever added, and
+unlocked_module / module_index only move forward, so two instances on one
+profile don't undo each other's progress.
+
+The active profile is the one last chosen with `switch` (or in the app);
+CODEQUEST_PROFILE overrides it for a single session, and then the profile
+can't be switched from inside the app.
+
+Usage:
+    python -m src.core.profiles list
+    python -m src.core.profiles switch NAME
+    python -m src.core.profiles migrate [--from src/data/progress.json] [--profile NAME]
+    python -m src.core.profiles delete NAME
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.completion import as_lists
+from src.core.config import get_config
+from src.core.journal import Journal, get_journal
+from src.engine.progress import recent_attempts
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+DEFAULT_PROFILE = "default"
+LEGACY_PROGRESS = Path(__file__).resolve().parent.parent / "data" / "progress.json"
+
+# Scalars that only ever increase; a save never moves them back.
+MONOTONIC = ("unlocked_module", "module_index")
+# Keys with their own tables/columns; everything else is kept in profiles.extra.
+STRUCTURED = MONOTONIC + ("last_route", "completed", "history", "attempts")
+BUSY_TIMEOUT_SEC = 10.0  # wait this long for another instance's write lock
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    last_route TEXT,
+    unlocked_module INTEGER,
+    module_index INTEGER,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS completions (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    item TEXT NOT NULL,
+    at REAL NOT NULL,
+    UNIQUE (profile_id, kind, item)
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+    module_index INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    ts TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_by_profile ON attempts (profile_id, module_index, id);
+"""
+
+
+class ProfileError(ValueError):
+    """Raised for unknown or invalid profile names."""
+
+
+def default_db_path() -> Path:
+    """config progress.db_path, else %PROGRAMDATA% (Windows) or the per-user XDG data directory."""
+    configured = get_config().get("progress.db_path")
+    if configured:
+        return Path(configured)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("PROGRAMDATA", Path.home()))
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+    return base / "CodeQuest" / "profiles.db"
+
+
+class ProfileDB:
+    """
+    Progress for any number of named profiles in one SQLite file.
+
+    One connection is shared by the threads of this process (guarded by a
+    lock); other processes coordinate through SQLite's own locking.
+    """
+
+    def __init__(self, path: Path, timeout: float = BUSY_TIMEOUT_SEC):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        # Attempt number ("n") up to which each profile's history is stored.
+        self._saved_history: Dict[int, int] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @contextlib.contextmanager
+    def _write(self):
+        """One write transaction; BEGIN IMMEDIATE takes SQLite's write lock up front."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # -------------------- profiles --------------------
+
+    def profiles(self) -> List[str]:
+        with self._lock:
+            return [r["name"] for r in self._conn.execute("SELECT name FROM profiles ORDER BY last_used DESC")]
+
+    def _id(self, name: str, create: bool = False) -> int:
+        row = self._conn.execute("SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is not None:
+            return row["id"]
+        if not create:
+            raise ProfileError(f"Unknown profile: {name}")
+        if not name or not name.strip():
+            raise ProfileError("Profile name must not be empty")
+        now = time.time()
+        cur = self._conn.execute("INSERT INTO profiles (name, created, last_used) VALUES (?, ?, ?)", (name, now, now))
+        return cur.lastrowid
+
+    def create(self, name: str) -> None:
+        with self._write():
+            self._id(name, create=True)
+
+    def delete(self, name: str) -> None:
+        with self._write() as conn:
+            pid = self._id(name)
+            conn.execute("DELETE FROM profiles WHERE id = ?", (pid,))
+            self._saved_history.pop(pid, None)
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM profiles WHERE name = ?", (name,)).fetchone() is not None
+
+    def active(self) -> str:
+        """CODEQUEST_PROFILE, else the profile last switched to on this machine."""
+        env = os.environ.get("CODEQUEST_PROFILE")
+        if env:
+            return env
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'active_profile'").fetchone()
+        return row["value"] if row else DEFAULT_PROFILE
+
+    def set_active(self, name: str) -> None:
+        with self._write() as conn:
+            self._id(name, create=True)
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('active_profile', ?)", (name,))
+
+    # -------------------- progress --------------------
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """Progress of a profile in the (merged) dict form both apps use."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM profiles WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                raise ProfileError(f"Unknown profile: {name}")
+            pid = row["id"]
+            state: Dict[str, Any] = json.loads(row["extra"])
+            for key in ("last_route",) + MONOTONIC:
+                if row[key] is not None:
+                    state[key] = row[key]
+            completed: Dict[str, List[str]] = {}
+            for r in self._conn.execute("SELECT kind, item FROM completions WHERE profile_id = ? ORDER BY rowid", (pid,)):
+                completed.setdefault(r["kind"], []).append(r["item"])
+            if completed or "completed" in state:
+                state["completed"] = {**state.pop("completed", {}), **completed}
+            total = self._conn.execute("SELECT COUNT(*) FROM attempts WHERE profile_id = ?", (pid,)).fetchone()[0]
+            # Only the recent attempts, once the app keeps rolled-up stats; all of them before that
+            # (the table keeps them all).
+            limit = recent_attempts() if "stats" in state else -1
+            rows = self._conn.execute("SELECT module_index, score, ts FROM attempts WHERE profile_id = ? "
+                                      "ORDER BY id DESC LIMIT ?", (pid, limit)).fetchall()
+            history = [{"n": total - k, "module_index": r["module_index"], "score": r["score"], "ts": r["ts"]}
+                       for k, r in enumerate(rows)][::-1]
+            if history:
+                state["history"] = history
+                state["attempts"] = total
+            self._saved_history[pid] = total
+            self._conn.execute("UPDATE profiles SET last_used = ? WHERE id = ?", (time.time(), pid))
+            return state
+
+    def save(self, name: str, state: Dict[str, Any]) -> None:
+        """Merge a progress dict into a profile (created if missing)."""
+        with self._write() as conn:
+            self._save(conn, name, state)
+
+    def _save(self, conn: sqlite3.Connection, name: str, state: Dict[str, Any]) -> None:
+        pid = self._id(name, create=True)
+        extra = {k: v for k, v in state.items() if k not in STRUCTURED}
+        # Empty completion kinds have no rows; keep them so the dict shape survives a round trip.
+        completed = as_lists(state.get("completed", {}))
+        if "completed" in state:
+            extra["completed"] = {k: [] for k in completed}
+        conn.execute(
+            "UPDATE profiles SET last_used = ?, last_route = COALESCE(?, last_route), "
+            "unlocked_module = MAX(COALESCE(unlocked_module, ?), COALESCE(?, unlocked_module)), "
+            "module_index = MAX(COALESCE(module_index, ?), COALESCE(?, module_index)), "
+            "extra = ? WHERE id = ?",
+            (time.time(), state.get("last_route"),
+             state.get("unlocked_module"), state.get("unlocked_module"),
+             state.get("module_index"), state.get("module_index"),
+             json.dumps(extra, ensure_ascii=False), pid))
+        now = time.time()
+        conn.executemany("INSERT OR IGNORE INTO completions VALUES (?, ?, ?, ?)",
+                         [(pid, kind, str(item), now)
+                          for kind, items in completed.items() for item in items])
+        # Attempts numbered past what this instance has stored are new (older
+        # entries without "n" are numbered by position).
+        done = self._saved_history.get(pid, 0)
+        numbered = [(int(h.get("n", i)), h) for i, h in enumerate(state.get("history", []), 1)]
+        conn.executemany("INSERT INTO attempts (profile_id, module_index, score, ts) VALUES (?, ?, ?, ?)",
+                         [(pid, int(h.get("module_index", 0)), int(h.get("score", 0)), str(h.get("ts", "")))
+                          for n, h in numbered if n > done])
+        self._saved_history[pid] = max([done] + [n for n, _ in numbered])
+
+    def migrate_json(self, path: Path, name: str, once: bool = False) -> bool:
+        """
+        Import a progress.json (either schema, plus its journal) into a profile.
+
+        Every import is recorded in meta; with once=True nothing is imported if
+        one was already done, so a single-user file seeds only the first profile.
+        """
+        if not Journal(path).exists():
+            return False
+        state = Journal(path).load()
+        with self._write() as conn:
+            if once and conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_migrated'").fetchone():
+                return False
+            self._save(conn, name, state)
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('legacy_migrated', ?)", (name,))
+        logger.info(f"Migrated {path} into profile {name!r}")
+        return True
+
+
+@contextlib.contextmanager
+def _as_os_error():
+    """Report SQLite failures (e.g. "database is locked") as the OSError a Journal would raise."""
+    try:
+        yield
+    except sqlite3.Error as e:
+        raise OSError(f"Profile database error: {e}") from e
+
+
+class ProfileBackend:
+    """Adapter giving ProgressStore / content_loader a Journal-like view of one profile."""
+
+    def __init__(self, db: ProfileDB, name: str):
+        self.db = db
+        self.name = name
+
+    def exists(self) -> bool:
+        with _as_os_error():
+            return self.db.exists(self.name)
+
+    def load(self, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with _as_os_error():
+            if not self.db.exists(self.name):
+                if not self.db.migrate_json(LEGACY_PROGRESS, self.name, once=True):
+                    self.db.save(self.name, dict(default or {}))
+            state = self.db.load(self.name)
+        for key, value in (default or {}).items():
+            state.setdefault(key, json.loads(json.dumps(value)))
+        return state
+
+    def save(self, state: Dict[str, Any]) -> int:
+        with _as_os_error():
+            self.db.save(self.name, state)
+        return 1
+
+    def compact(self, state: Optional[Dict[str, Any]] = None) -> None:
+        if state is not None:
+            with _as_os_error():
+                self.db.save(self.name, state)
+
+
+_db: Optional[ProfileDB] = None
+_db_lock = threading.Lock()
+
+
+def get_profile_db() -> ProfileDB:
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = ProfileDB(default_db_path())
+        return _db
+
+
+def progress_backend(path: Path):
+    """Where progress for path lives: the active SQLite profile or the JSON journal."""
+    if get_config().get("progress.backend", "json") == "sqlite":
+        db = get_profile_db()
+        return ProfileBackend(db, db.active())
+    return get_journal(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage student progress profiles.")
+    parser.add_argument("--db", default=None, help="Profile database (default: from config)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List profiles, most recently used first")
+    for cmd, text in (("switch", "Make a profile active on this machine"), ("delete", "Delete a profile")):
+        sub.add_parser(cmd, help=text).add_argument("name")
+    mig = sub.add_parser("migrate", help="Import a progress.json into a profile")
+    mig.add_argument("--from", dest="source", default=str(LEGACY_PROGRESS))
+    mig.add_argument("--profile", default=None, help="Target profile (default: the active one)")
+    args = parser.parse_args(argv)
+
+    db = ProfileDB(Path(args.db)) if args.db else get_profile_db()
+    if args.command == "list":
+        active = db.active()
+        for name in db.profiles():
+            print(("* " if name == active else "  ") + name)
+    elif args.command == "switch":
+        db.set_active(args.name)
+        print(f"Active profile: {args.name}")
+    elif args.command == "delete":
+        db.delete(args.name)
+        print(f"Deleted profile: {args.name}")
+    elif args.command == "migrate":
+        name = args.profile or db.active()
+        if not db.migrate_json(Path(args.source), name):
+            print(f"Nothing to migrate: {args.source} not found")
+            return 1
+        print(f"Migrated {args.source} into profile {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,33 @@
 ﻿# -*- coding: utf-8 -*-
+"""
+Student progress for the page-based app, kept in memory by one
+process-wide ProgressStore. Reads never touch the disk; changes are
+coalesced and written behind on a short debounce, and flushed at exit.
+Writes are journaled (see core.journal), so a crash can't lose progress;
+with the sqlite backend they go to the active profile (see core.profiles).
+Completions are held as bitsets over content ordinals (see core.completion).
+
+Listeners added with add_listener(fn) are called as fn(event, *args) after
+each change made through the helpers below, on the caller's thread:
+
+    ("completed", kind, id_)   an item was completed for the first time
+    ("unlocked", module)       unlocked_module rose to module
+    ("route_changed", route)   last_route changed
+    ("reset",)                 progress was replaced (save_progress, profile switch)
+"""
+import atexit
+import copy
+import logging
+import os
+import threading
+import time
 from pathlib import Path
-from src.core.io import load_json, write_json
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.completion import Completion
+from src.core.profiles import ProfileBackend, ProfileError, get_profile_db, progress_backend
+
+logger = logging.getLogger(__name__)
 
 PROGRESS_PATH = Path("src/data/progress.json")
 
@@ -11,32 +38,200 @@ DEFAULT_PROGRESS = {
   "hackathons_unlock_after_module": 3
 }
 
+WRITE_DELAY_SEC = 0.5     # quiet period before a write
+MAX_WRITE_DELAY_SEC = 3.0 # upper bound while changes keep coming
+RETRY_DELAY_SEC = 5.0     # after a failed write (e.g. the profile database is locked)
+
+class ProgressStore:
+    """
+    In-memory progress backed by a JSON file or a profile database.
+
+    Every change marks the state dirty and (re)starts a timer; the file is
+    written once the changes stop for delay_sec, or at the latest max_delay_sec
+    after the first unsaved change. flush() writes immediately and is
+    registered to run at interpreter exit. A write appends only the changed
+    keys to the progress journal (or merges them into the active profile).
+    """
+
+    def __init__(self, path: Path = PROGRESS_PATH, delay_sec: float = WRITE_DELAY_SEC,
+                 max_delay_sec: float = MAX_WRITE_DELAY_SEC):
+        self.path = Path(path)
+        self._backend = progress_backend(self.path)
+        self.delay_sec = delay_sec
+        self.max_delay_sec = max_delay_sec
+        self._lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None      # everything but "completed"
+        self._completion: Optional[Completion] = None
+        self._dirty_since: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self.writes = 0
+
+    def _data(self) -> Dict[str, Any]:
+        if self._state is None:
+            created = not self._backend.exists()
+            self._state = self._backend.load(DEFAULT_PROGRESS)
+            self._completion = Completion.decode(self._state.pop("completed", {}))
+            if created:
+                self._backend.compact(self._serialized())
+        return self._state
+
+    def _serialized(self) -> Dict[str, Any]:
+        return {**self._state, "completed": self._completion.encode()}
+
+    @property
+    def completion(self) -> Completion:
+        """Live completion bitsets; change them only inside update()."""
+        with self._lock:
+            self._data()
+            return self._completion
+
+    def read(self, fn: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Apply fn to the live state under the lock (fn must not mutate it)."""
+        with self._lock:
+            return fn(self._data())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A private copy of the current progress (completions as {kind: [ids]})."""
+        with self._lock:
+            data = copy.deepcopy(self._data())
+            data["completed"] = self._completion.to_lists()
+            return data
+
+    def update(self, fn: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Mutate the state in place via fn and schedule a write (skipped if fn returns False)."""
+        with self._lock:
+            result = fn(self._data())
+            if result is not False:
+                self._schedule()
+            return result
+
+    def replace(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._state = copy.deepcopy(data)
+            self._completion = Completion.decode(self._state.pop("completed", {}))
+            self._schedule()
+
+    def _schedule(self) -> None:
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = min(self.delay_sec, max(0.0, self._dirty_since + self.max_delay_sec - now))
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now. Returns True if anything was written."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty_since is None or self._state is None:
+                return False
+            try:
+                self._write()
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not save progress, retrying in {RETRY_DELAY_SEC:g}s: {e}")
+                self._timer = threading.Timer(RETRY_DELAY_SEC, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                return False
+            return True
+
+    def rebind(self, backend) -> None:
+        """Save pending changes, then serve progress from another backend."""
+        with self._lock:
+            self.flush()
+            self._backend = backend
+            self._state = None
+            self._completion = None
+
+    def _write(self) -> None:
+        self._backend.save(self._serialized())
+        self._dirty_since = None
+        self.writes += 1
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty_since is not None
+
+_store: Optional[ProgressStore] = None
+_store_lock = threading.Lock()
+
+def get_progress_store() -> ProgressStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ProgressStore()
+            atexit.register(_store.flush)
+        return _store
+
+_listeners: List[Callable[..., None]] = []
+
+def add_listener(fn: Callable[..., None]) -> Callable[[], None]:
+    """Call fn(event, *args) after every progress change; returns a function that removes it."""
+    _listeners.append(fn)
+    def remove():
+        if fn in _listeners:
+            _listeners.remove(fn)
+    return remove
+
+def _notify(event: str, *args) -> None:
+    for fn in list(_listeners):
+        try:
+            fn(event, *args)
+        except Exception:
+            logger.exception(f"Progress listener failed on {event!r}")
+
+def switch_profile(name: str) -> None:
+    """Make name the active profile and load its progress (sqlite backend)."""
+    if os.environ.get("CODEQUEST_PROFILE"):
+        # content_loader would keep resolving the environment's profile
+        raise ProfileError("The profile is fixed by CODEQUEST_PROFILE for this session")
+    db = get_profile_db()
+    db.set_active(name)
+    get_progress_store().rebind(ProfileBackend(db, name))
+    _notify("reset")
+
 def load_progress():
-    if not PROGRESS_PATH.exists():
-        write_json(PROGRESS_PATH.as_posix(), DEFAULT_PROGRESS)
-    return load_json(PROGRESS_PATH.as_posix())
+    # Callers may edit the result, so hand out a copy of the in-memory state.
+    return get_progress_store().snapshot()
 
 def save_progress(data: dict):
-    write_json(PROGRESS_PATH.as_posix(), data)
+    get_progress_store().replace(data)
+    _notify("reset")
 
 def set_last_route(route: str):
-    p = load_progress()
-    p["last_route"] = route
-    save_progress(p)
+    def apply(p):
+        if p.get("last_route") == route:
+            return False
+        p["last_route"] = route
+    if get_progress_store().update(apply) is not False:
+        _notify("route_changed", route)
 
 def mark_completed(kind: str, id_: str):
-    p = load_progress()
-    p["completed"].setdefault(kind, [])
-    if id_ not in p["completed"][kind]:
-        p["completed"][kind].append(id_)
-    save_progress(p)
+    store = get_progress_store()
+    if store.update(lambda p: store.completion.add(kind, id_)):
+        _notify("completed", kind, id_)
+
+def is_completed(kind: str, id_: str) -> bool:
+    store = get_progress_store()
+    return store.read(lambda p: store.completion.has(kind, id_))
+
+def percent_complete(kind: Optional[str] = None) -> float:
+    store = get_progress_store()
+    return store.read(lambda p: store.completion.percent(kind))
 
 def unlock_next_module(current_module: int):
-    p = load_progress()
-    if p.get("unlocked_module", 1) <= current_module:
+    def apply(p):
+        if p.get("unlocked_module", 1) > current_module:
+            return False
         p["unlocked_module"] = current_module + 1
-    save_progress(p)
+    if get_progress_store().update(apply) is not False:
+        _notify("unlocked", current_module + 1)
 
 def hackathons_unlocked() -> bool:
-    p = load_progress()
-    return p.get("unlocked_module", 1) > p.get("hackathons_unlock_after_module", 3)
+    return get_progress_store().read(
+        lambda p: p.get("unlocked_module", 1) > p.get("hackathons_unlock_after_module", 3))
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""Indexed question banks with lazy loading and stratified quiz assembly.
+
+A bank is a JSON-lines file, one question per line:
+
+    {"id": "q1", "module": "m1", "tags": ["print"], "difficulty": "easy",
+     "prompt": "...", "choices": ["...", "..."], "answer_index": 1}
+
+Next to it lives an index (<bank>.idx.json) holding each question's byte
+offset plus postings by module, tag and difficulty, so filtering and sampling
+never parse question bodies; only the sampled questions are read.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_DIFFICULTY = "medium"
+
+
+def index_path_for(bank_path: str) -> Path:
+    """Path of the index file for a bank."""
+    p = Path(bank_path)
+    return p.with_name(p.name + ".idx.json")
+
+
+def build_index(bank_path: str) -> Dict[str, Any]:
+    """
+    Scan a bank once and write its index file.
+
+    Args:
+        bank_path: Path to the .jsonl bank
+
+    Returns:
+        The index dictionary
+
+    Raises:
+        FileNotFoundError: If the bank doesn't exist
+        ValueError: If a line is not a valid question
+    """
+    src = Path(bank_path)
+    if not src.exists():
+        logger.error(f"Question bank not found: {bank_path}")
+        raise FileNotFoundError(f"Question bank not found: {bank_path}")
+
+    offsets: List[int] = []
+    lengths: List[int] = []
+    ids: List[str] = []
+    by_module: Dict[str, List[int]] = {}
+    by_tag: Dict[str, List[int]] = {}
+    by_difficulty: Dict[str, List[int]] = {}
+
+    with open(src, "rb") as f:
+        pos = 0
+        for line_no, raw in enumerate(f, start=1):
+            start, pos = pos, pos + len(raw)
+            if line_no == 1 and raw.startswith(b"\xef\xbb\xbf"):
+                raw, start = raw[3:], start + 3
+            if not raw.strip():
+                continue
+            try:
+                q = json.loads(raw)
+                if not isinstance(q.get("choices"), list) or "answer_index" not in q:
+                    raise ValueError("needs 'choices' and 'answer_index'")
+            except ValueError as e:
+                logger.error(f"Invalid question on line {line_no} of {bank_path}: {e}")
+                raise ValueError(f"Invalid question on line {line_no} of {bank_path}: {e}")
+
+            i = len(offsets)
+            offsets.append(start)
+            lengths.append(len(raw))
+            ids.append(str(q.get("id", f"q{line_no}")))
+            by_module.setdefault(str(q.get("module", "")), []).append(i)
+            by_difficulty.setdefault(str(q.get("difficulty", DEFAULT_DIFFICULTY)), []).append(i)
+            for tag in q.get("tags", []):
+                by_tag.setdefault(str(tag), []).append(i)
+
+    st = src.stat()
+    index = {
+        "version": INDEX_VERSION,
+        "source_size": st.st_size,
+        "source_mtime_ns": st.st_mtime_ns,
+        "offsets": offsets,
+        "lengths": lengths,
+        "ids": ids,
+        "by_module": by_module,
+        "by_tag": by_tag,
+        "by_difficulty": by_difficulty,
+    }
+    index_path_for(bank_path).write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    logger.info(f"Indexed {len(offsets)} questions in {bank_path}")
+    return index
+
+
+class QuestionBank:
+    """A bank opened through its index; question bodies are read on demand."""
+
+    def __init__(self, bank_path: str):
+        self.path = Path(bank_path)
+        self.index = self._load_index()
+        self._offsets = self.index["offsets"]
+        self._lengths = self.index["lengths"]
+        self.get = lru_cache(maxsize=1024)(self._read)
+
+    def _load_index(self) -> Dict[str, Any]:
+        idx_path = index_path_for(str(self.path))
+        try:
+            st = self.path.stat()
+            index = json.loads(idx_path.read_text(encoding="utf-8"))
+            if (index.get("version") == INDEX_VERSION
+                    and index.get("source_size") == st.st_size
+                    and index.get("source_mtime_ns") == st.st_mtime_ns):
+                return index
+            logger.info(f"Index for {self.path} is stale, rebuilding")
+        except (OSError, ValueError):
+            logger.info(f"No usable index for {self.path}, building one")
+        return build_index(str(self.path))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _read(self, i: int) -> Dict[str, Any]:
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[i])
+            return json.loads(f.read(self._lengths[i]))
+
+    def select(self, module: Optional[str] = None, tags: Optional[Iterable[str]] = None,
+               difficulty: Optional[str] = None) -> List[int]:
+        """Positions of questions matching every given filter (tags: any of)."""
+        pool: Optional[Set[int]] = None
+
+        def narrow(ids: Iterable[int]) -> None:
+            nonlocal pool
+            pool = set(ids) if pool is None else pool & set(ids)
+
+        if module is not None:
+            narrow(self.index["by_module"].get(str(module), []))
+        if tags:
+            hit: Set[int] = set()
+            for tag in tags:
+                hit.update(self.index["by_tag"].get(str(tag), []))
+            narrow(hit)
+        if difficulty is not None:
+            narrow(self.index["by_difficulty"].get(str(difficulty), []))
+        return sorted(range(len(self)) if pool is None else pool)
+
+    def difficulty_of(self, positions: Iterable[int]) -> Dict[str, List[int]]:
+        """Group positions by difficulty using the index only."""
+        wanted = set(positions)
+        return {d: [i for i in ids if i in wanted]
+                for d, ids in self.index["by_difficulty"].items()}
+
+
+def attempt_seed(student_id: str, quiz_id: str, attempt: int) -> int:
+    """Reproducible seed for one student's attempt at one quiz."""
+    digest = hashlib.sha256(f"{student_id}|{quiz_id}|{attempt}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _allocate(n: int, sizes: Dict[str, int]) -> Dict[str, int]:
+    """Split n draws across strata in proportion to their size (largest remainder)."""
+    total = sum(sizes.values())
+    if total == 0:
+        return {k: 0 for k in sizes}
+    exact = {k: n * v / total for k, v in sizes.items()}
+    alloc = {k: min(sizes[k], int(x)) for k, x in exact.items()}
+    for k in sorted(exact, key=lambda k: (exact[k] - int(exact[k]), k), reverse=True):
+        if sum(alloc.values()) >= n:
+            break
+        if alloc[k] < sizes[k]:
+            alloc[k] += 1
+    return alloc
+
+
+def assemble_quiz(
+    bank: QuestionBank,
+    n: int,
+    seed: int,
+    module: Optional[str] = None,
+    tags: Optional[Iterable[str]] = None,
+    strata: Optional[Dict[str, int]] = None,
+    title: str = "Quiz",
+    pass_score: int = 80,
+) -> Dict[str, Any]:
+    """
+    Assemble a random quiz stratified by difficulty.
+
+    Args:
+        bank: Opened question bank
+        n: Number of questions (ignored when strata is given)
+        seed: Seed for this attempt (see attempt_seed)
+        module: Only questions from this module
+        tags: Only questions with any of these tags
+        strata: Exact count per difficulty, e.g. {"easy": 3, "hard": 2};
+                default is proportional to the filtered pool
+        title: Quiz title
+        pass_score: Passing percentage
+
+    Returns:
+        Quiz spec in the src/data/quizzes format, usable by core.quiz.grade_quiz
+
+    Raises:
+        ValueError: If the pool can't supply the requested questions
+    """
+    rng = random.Random(seed)
+    groups = bank.difficulty_of(bank.select(module=module, tags=tags))
+    sizes = {d: len(ids) for d, ids in groups.items() if ids}
+
+    if not sizes:
+        raise ValueError(f"No questions match module={module!r}, tags={tags!r}")
+    if strata is None:
+        if sum(sizes.values()) < n:
+            raise ValueError(f"Only {sum(sizes.values())} questions available, {n} requested")
+        strata = _allocate(n, sizes)
+    for d, k in strata.items():
+        if k > sizes.get(d, 0):
+            raise ValueError(f"Only {sizes.get(d, 0)} '{d}' questions available, {k} requested")
+
+    picked: List[int] = []
+    for d in sorted(strata):
+        picked.extend(rng.sample(groups[d], strata[d]) if strata[d] else [])
+    rng.shuffle(picked)
+
+    questions = []
+    for i in picked:
+        q = bank.get(i)
+        questions.append({
+            "id": q.get("id"),
+            "prompt": q.get("prompt", ""),
+            "choices": q["choices"],
+            "answer_index": q["answer_index"],
+        })
+    logger.info(f"Assembled quiz of {len(questions)} questions from {bank.path.name} (seed={seed})")
+    return {"title": title, "pass_score": pass_score, "seed": seed, "questions": questions}
+
+
+def as_course_quiz(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an assembled quiz to the course format used by engine.grading.grade_quiz."""
+    return {"mcq": [{"question": q["prompt"], "choices": q["choices"], "correct_index": q["answer_index"]}
+                    for q in spec.get("questions", [])]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index a question bank or sample a quiz from it.")
+    parser.add_argument("bank", help="Path to a .jsonl question bank")
+    parser.add_argument("--sample", type=int, help="Print a sampled quiz with this many questions")
+    parser.add_argument("--module")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.sample is None:
+        index = build_index(args.bank)
+        print(f"Indexed {len(index['offsets'])} questions -> {index_path_for(args.bank)}")
+        return 0
+    bank = QuestionBank(args.bank)
+    print(json.dumps(assemble_quiz(bank, args.sample, args.seed, module=args.module), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
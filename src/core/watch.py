@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Change detection for content files under src/data, used for hot reload."""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from src.core.bundle import DATA_DIR, EXCLUDE
+from src.core.cache import get_content_cache
+
+logger = logging.getLogger(__name__)
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def snapshot(root: Path = DATA_DIR) -> Snapshot:
+    """(mtime_ns, size) of every content JSON file under root, by relative path."""
+    snap: Snapshot = {}
+    for p in Path(root).rglob("*.json"):
+        if p.name in EXCLUDE:
+            continue
+        try:
+            st = p.stat()
+        except FileNotFoundError:  # removed mid-scan
+            continue
+        snap[p.relative_to(root).as_posix()] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+def changed_paths(old: Snapshot, new: Snapshot) -> Set[str]:
+    """Relative paths added, removed or modified between two snapshots."""
+    return {rel for rel in old.keys() | new.keys() if old.get(rel) != new.get(rel)}
+
+
+def invalidate(root: Path, rels: Iterable[str]) -> None:
+    """Drop exactly these files from the shared content cache."""
+    cache = get_content_cache()
+    for rel in rels:
+        cache.invalidate(str(Path(root) / rel))
+
+
+class PollingWatcher:
+    """
+    Polls root on a background thread and reports changes after a quiet period.
+
+    An editor's save burst (write, rename, touch) arrives as one callback:
+    changes are collected until nothing has changed for debounce_sec. Affected
+    cache entries are invalidated before on_change(rels) is called (on the
+    watcher thread).
+    """
+
+    def __init__(self, on_change: Callable[[Set[str]], None], root: Path = DATA_DIR,
+                 interval_sec: float = 0.5, debounce_sec: float = 0.3):
+        self.root = Path(root)
+        self.on_change = on_change
+        self.interval_sec = interval_sec
+        self.debounce_sec = debounce_sec
+        self._snap = snapshot(self.root)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="content-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_sec * 4)
+            self._thread = None
+
+    def poll(self) -> Set[str]:
+        """Files changed since the last poll (also usable without the thread)."""
+        new = snapshot(self.root)
+        rels = changed_paths(self._snap, new)
+        self._snap = new
+        return rels
+
+    def _run(self) -> None:
+        pending: Set[str] = set()
+        last_change = 0.0
+        while not self._stop.wait(self.interval_sec if not pending else min(self.interval_sec, self.debounce_sec)):
+            rels = self.poll()
+            now = time.monotonic()
+            if rels:
+                pending |= rels
+                last_change = now
+            elif pending and now - last_change >= self.debounce_sec:
+                batch, pending = pending, set()
+                invalidate(self.root, batch)
+                logger.info(f"Content changed: {sorted(batch)}")
+                try:
+                    self.on_change(batch)
+                except Exception as e:
+                    logger.error(f"Content reload handler failed: {e}")
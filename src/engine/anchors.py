@@ -0,0 +1,58 @@
+"""Map lesson table-of-contents entries to positions in a rendered document.
+
+TOC entries are written by hand and rarely match headings exactly
+("if statements" vs "1) if statements (decision making)"), so both sides
+are reduced to a key of lowercase words before matching.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def section_key(text: str) -> str:
+    """Lowercase words only: "1) What is print()?" -> "1 what is print"."""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+class AnchorIndex:
+    """
+    Section name -> document position, built once per document.
+
+    Lookup order: exact heading or anchor name, then the first heading (in
+    document order) containing the section's words, then an optional full
+    text search. Every answer, including a miss, is memoized, so repeat
+    jumps are a dict lookup.
+    """
+
+    def __init__(self, headings: Iterable[Tuple[str, int]],
+                 search: Optional[Callable[[str], Optional[int]]] = None):
+        self._headings: List[Tuple[str, int]] = []
+        self._exact: Dict[str, int] = {}
+        for text, pos in headings:
+            key = section_key(text)
+            if key:
+                self._headings.append((key, pos))
+                self._exact.setdefault(key, pos)
+        self._search = search
+        self._resolved: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._headings)
+
+    def resolve(self, section: str) -> Optional[int]:
+        """Position of a section's heading, or None if the document lacks it."""
+        key = section_key(section)
+        if key in self._resolved:
+            return self._resolved[key]
+        pos = self._exact.get(key)
+        if pos is None and key:
+            padded = f" {key} "
+            pos = next((p for k, p in self._headings if padded in f" {k} "), None)
+        if pos is None and self._search is not None:
+            pos = self._search(section.strip())
+        self._resolved[key] = pos
+        return pos
@@ -0,0 +1,103 @@
+"""Lesson assets (images) referenced from lesson HTML.
+
+Assets live under src/data/assets and are referenced relative to src/data:
+
+    <img src="assets/m1/print.png" width="320">
+
+This module is Qt-free: it finds and resolves asset references and provides
+the byte-bounded LRU the UI keeps decoded images in.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .content_loader import DATA
+
+ASSETS_DIR = DATA / "assets"
+
+_IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\bsrc\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+
+
+def asset_urls(html: str) -> List[str]:
+    """Local image references in an HTML string, in order, without duplicates."""
+    seen: Dict[str, None] = {}
+    for m in _IMG_SRC_RE.finditer(html or ""):
+        url = m.group(1) if m.group(1) is not None else m.group(2)
+        if resolve_asset(url) is not None:
+            seen.setdefault(url, None)
+    return list(seen)
+
+
+def resolve_asset(url: str, root: Optional[Path] = None) -> Optional[Path]:
+    """File for a relative asset URL, or None for remote, data: or escaping URLs."""
+    if not url or ":" in url or url.startswith(("/", "\\")):
+        return None
+    base = (Path(root) if root else DATA).resolve()
+    path = (base / url.split("#", 1)[0].split("?", 1)[0]).resolve()
+    try:
+        path.relative_to(base)
+    except ValueError:
+        return None
+    return path
+
+
+class ByteLRU:
+    """
+    Least-recently-used mapping bounded by the total size of its values.
+
+    Sizes are given by the caller (e.g. bytes of decoded pixels). A value
+    larger than the whole budget is not stored. Thread-safe.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> bool:
+        """Store value; returns False if it is too large to cache at all."""
+        with self._lock:
+            self._pop(key)
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
@@ -1,8 +1,15 @@
 from __future__ import annotations
+import mmap
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .runner import run_python
+from .fixtures import FixtureError, as_stdin_file, content_equals, fixture_path, stream_equals
+from .interactive import judge_script, run_interactive
+from .runner import RunResult, run_python
+from .scratch import get_scratch_pool
+
+CHUNK = 1 << 16
 
 @dataclass
 class GradeResult:
@@ -15,21 +22,129 @@ class GradeResult:
 def _norm(s: str) -> str:
     return s.replace("\r\n", "\n")
 
+def _output_file(workdir: Path, rel: str) -> Optional[Path]:
+    """Resolve a test's output path inside the run directory (None if it escapes)."""
+    path = (workdir / rel).resolve()
+    try:
+        path.relative_to(workdir.resolve())
+    except ValueError:
+        return None
+    return path
+
+def _variants(value: str) -> List[bytes]:
+    # Files written in text mode on Windows use CRLF; accept either form.
+    raw = value.encode("utf-8")
+    crlf = raw.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+    return [raw] if crlf == raw else [raw, crlf]
+
+def _file_equals(path: Path, value: str) -> bool:
+    size = path.stat().st_size
+    candidates = [v for v in _variants(value) if len(v) == size]
+    if not candidates:
+        return False
+    if size == 0:
+        return True
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for expected in candidates:
+            if all(mm[i:i + CHUNK] == expected[i:i + CHUNK] for i in range(0, size, CHUNK)):
+                return True
+    return False
+
+def _file_contains(path: Path, value: str) -> bool:
+    if path.stat().st_size == 0:
+        return value == ""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return any(mm.find(v) != -1 for v in _variants(value))
+
+def _lf_chunks(path: Path) -> Iterator[bytes]:
+    # the file in CHUNK blocks with CRLF turned into LF; a CR ending one block waits for the next
+    with open(path, "rb") as f:
+        carry = b""
+        for block in iter(lambda: f.read(CHUNK), b""):
+            block = carry + block
+            carry = b"\r" if block.endswith(b"\r") else b""
+            yield (block[:-1] if carry else block).replace(b"\r\n", b"\n")
+        yield carry
+
+def _check_file(workdir: Path, t: Dict[str, Any]) -> Tuple[bool, str]:
+    rel = str(t.get("path", ""))
+    val = str(t.get("value", ""))
+    path = _output_file(workdir, rel) if rel else None
+    if path is None:
+        return False, f"Invalid output file path in test: {repr(rel)}"
+    if not path.is_file():
+        return False, f"Expected your program to write the file {rel}"
+    if t.get("type") == "file_equals" and "fixture" in t:
+        if stream_equals(fixture_path(t["fixture"]), _lf_chunks(path)):
+            return True, ""
+        return False, f"File {rel} does not match the expected contents"
+    if t.get("type") == "file_equals":
+        if _file_equals(path, val):
+            return True, ""
+        return False, f"File {rel} does not match the expected contents"
+    if _file_contains(path, val):
+        return True, ""
+    return False, f"Expected file {rel} to contain: {repr(val)}"
+
 def grade_code(challenge: Dict[str, Any], code: str) -> GradeResult:
     """
     Simple safe autograder:
-    - runs code
+    - runs code in an isolated scratch directory
     - checks tests
     Supported tests:
       {"type":"stdout_exact","value":"..."}
       {"type":"stdout_contains","value":"..."}
       {"type":"exit_code","value":0}
+      {"type":"file_equals","path":"out.txt","value":"..."}
+      {"type":"file_contains","path":"out.txt","value":"..."}
+      {"type":"interactive","judge":"<script>" | "judge_function":"<def judge(send, recv)>",
+       "turn_timeout":1.0,"timeout":10.0}
+    Large data can live in fixtures (see engine.fixtures): "stdin_fixture":"sha256:..."
+    on the challenge feeds the program's stdin, and stdout_exact / file_equals
+    accept "fixture":"sha256:..." in place of "value".
     """
-    res = run_python(code, timeout_sec=float(challenge.get("timeout_sec", 2.0)))
-    stdout = res.stdout or ""
-    stderr = res.stderr or ""
+    with get_scratch_pool().lease() as workdir:
+        return _grade_in(challenge, code, workdir)
+
+def _check_interactive(code: str, t: Dict[str, Any]) -> Tuple[bool, str]:
+    source = judge_script(t.get("judge"), t.get("judge_function"))
+    if not source:
+        return False, "Interactive test has no judge configured"
+    r = run_interactive(
+        code,
+        source,
+        turn_timeout=float(t.get("turn_timeout", 1.0)),
+        total_timeout=float(t.get("timeout", 10.0)),
+    )
+    if r.passed:
+        return True, ""
+    msg = f"Interactive session {r.verdict}: {r.message}"
+    if r.transcript:
+        msg += "\n  Transcript (last turns):\n  " + r.format_transcript(last=10).replace("\n", "\n  ")
+    if r.stderr.strip():
+        msg += "\n  Your program's errors:\n  " + r.stderr.strip()[-500:]
+    return False, msg
 
+def _grade_in(challenge: Dict[str, Any], code: str, workdir: Path) -> GradeResult:
     tests = challenge.get("tests", [])
+
+    # Interactive tests start their own runs; only run the program plainly when
+    # some other test needs its output (a plain run would hit EOF on input()).
+    if tests and all(t.get("type") == "interactive" for t in tests):
+        res = RunResult(ok=True, stdout="", stderr="", exit_code=0)
+    else:
+        timeout = float(challenge.get("timeout_sec", 2.0))
+        try:
+            stdin_fixture = fixture_path(challenge["stdin_fixture"]) if challenge.get("stdin_fixture") else None
+        except FixtureError as e:
+            return GradeResult(passed=False, score=0, feedback=f"Challenge misconfigured: {e}", stdout="", stderr="")
+        if stdin_fixture is None:
+            res = run_python(code, timeout_sec=timeout, cwd=str(workdir))
+        else:
+            with as_stdin_file(stdin_fixture, workdir) as stdin_path:
+                res = run_python(code, timeout_sec=timeout, cwd=str(workdir), stdin_path=stdin_path)
+    stdout = res.stdout or ""
+    stderr = res.stderr or ""
     if not tests:
         # If no tests provided, require no crash
         passed = (res.exit_code == 0)
@@ -44,7 +159,17 @@ def grade_code(challenge: Dict[str, Any], code: str) -> GradeResult:
     for t in tests:
         ttype = t.get("type")
         val = t.get("value", "")
-        if ttype == "stdout_exact":
+        try:
+            expected_fixture = fixture_path(t["fixture"]) if ttype in ("stdout_exact", "file_equals") and "fixture" in t else None
+        except FixtureError as e:
+            msgs.append(f"Test misconfigured: {e}")
+            continue
+        if ttype == "stdout_exact" and expected_fixture is not None:
+            if content_equals(expected_fixture, _norm(stdout).encode("utf-8")):
+                ok += 1
+            else:
+                msgs.append(f"Output ({len(stdout)} characters) does not match the expected output")
+        elif ttype == "stdout_exact":
             if _norm(stdout) == _norm(str(val)):
                 ok += 1
             else:
@@ -59,6 +184,18 @@ def grade_code(challenge: Dict[str, Any], code: str) -> GradeResult:
                 ok += 1
             else:
                 msgs.append(f"Expected exit code {val}, got {res.exit_code}")
+        elif ttype in ("file_equals", "file_contains"):
+            good, msg = _check_file(workdir, t)
+            if good:
+                ok += 1
+            else:
+                msgs.append(msg)
+        elif ttype == "interactive":
+            good, msg = _check_interactive(code, t)
+            if good:
+                ok += 1
+            else:
+                msgs.append(msg)
         else:
             msgs.append(f"Unknown test type: {ttype}")
 
@@ -0,0 +1,269 @@
+"""Bulk multiple-choice grading and item analysis for a whole class.
+
+Usage:
+    python -m src.engine.bulk_grading answers.csv --quiz src/data/quizzes/m1_quiz.json
+
+answers.csv has one row per student: an id column followed by one column per
+question holding the chosen index (0-based) or letter (A, B, ...). Blank
+cells count as unanswered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array fallback gives identical results
+    np = None
+
+logger = logging.getLogger(__name__)
+
+UNANSWERED = -1
+GROUP_FRACTION = 0.27  # Kelley's upper/lower 27% groups for discrimination
+
+
+@dataclass
+class BulkResult:
+    """Scores for every student plus per-item statistics."""
+    scores: List[int]
+    correct: List[int]
+    passed: List[bool]
+    difficulty: List[float]          # proportion correct per item (p-value)
+    discrimination: List[float]      # upper-group p minus lower-group p
+    distractors: List[List[int]]     # [item][choice] pick counts
+    omitted: List[int]               # unanswered count per item
+    pass_score: int
+
+    @property
+    def n_students(self) -> int:
+        return len(self.scores)
+
+    @property
+    def n_items(self) -> int:
+        return len(self.difficulty)
+
+
+def key_from_quiz(quiz: Dict[str, Any]) -> List[int]:
+    """
+    Extract the answer key from either quiz format.
+
+    Supports file quizzes ({"questions": [{"answer_index": ...}]}) and course
+    quizzes ({"mcq": [{"correct_index": ...}]}).
+    """
+    if "questions" in quiz:
+        return [int(q.get("answer_index", 0)) for q in quiz["questions"]]
+    return [int(q.get("correct_index", 0)) for q in quiz.get("mcq", [])]
+
+
+def _group_size(n: int) -> int:
+    return max(1, int(round(GROUP_FRACTION * n)))
+
+
+def _grade_numpy(answers: Sequence[Sequence[int]], key: Sequence[int], n_choices: int, pass_score: int) -> BulkResult:
+    A = np.asarray(answers, dtype=np.int16).reshape(len(answers), len(key))
+    K = np.asarray(key, dtype=np.int16)
+    n_students, n_items = A.shape
+
+    C = A == K
+    correct = C.sum(axis=1)
+    scores = np.rint(100.0 * correct / max(1, n_items)).astype(int)
+
+    difficulty = C.mean(axis=0) if n_students else np.zeros(n_items)
+    if n_students:
+        order = np.argsort(correct, kind="stable")
+        g = _group_size(n_students)
+        discrimination = C[order[-g:]].mean(axis=0) - C[order[:g]].mean(axis=0)
+    else:
+        discrimination = np.zeros(n_items)
+
+    # One bincount over (item, choice) cells instead of a loop per item.
+    answered = A >= 0
+    cells = (np.arange(n_items) * n_choices + A)[answered]
+    distractors = np.bincount(cells, minlength=n_items * n_choices).reshape(n_items, n_choices)
+    omitted = (~answered).sum(axis=0)
+
+    return BulkResult(
+        scores=scores.tolist(),
+        correct=correct.tolist(),
+        passed=(scores >= pass_score).tolist(),
+        difficulty=[round(float(x), 4) for x in difficulty],
+        discrimination=[round(float(x), 4) for x in discrimination],
+        distractors=distractors.tolist(),
+        omitted=omitted.tolist(),
+        pass_score=pass_score,
+    )
+
+
+def _grade_array(answers: Sequence[Sequence[int]], key: Sequence[int], n_choices: int, pass_score: int) -> BulkResult:
+    n_items = len(key)
+    n_students = len(answers)
+    flat = array("h")
+    for row in answers:
+        flat.extend(row)
+    hits = array("b", (1 if flat[i] == key[i % n_items] else 0 for i in range(len(flat))))
+
+    correct = [sum(hits[s * n_items:(s + 1) * n_items]) for s in range(n_students)]
+    scores = [int(round(100 * c / max(1, n_items))) for c in correct]
+
+    item_hits = [sum(hits[j::n_items]) for j in range(n_items)]
+    difficulty = [h / n_students if n_students else 0.0 for h in item_hits]
+
+    discrimination = [0.0] * n_items
+    if n_students:
+        order = sorted(range(n_students), key=lambda s: correct[s])
+        g = _group_size(n_students)
+        lower, upper = order[:g], order[-g:]
+        for j in range(n_items):
+            hi = sum(hits[s * n_items + j] for s in upper) / g
+            lo = sum(hits[s * n_items + j] for s in lower) / g
+            discrimination[j] = hi - lo
+
+    distractors = [[0] * n_choices for _ in range(n_items)]
+    omitted = [0] * n_items
+    for i, pick in enumerate(flat):
+        j = i % n_items
+        if pick < 0:
+            omitted[j] += 1
+        else:
+            distractors[j][pick] += 1
+
+    return BulkResult(
+        scores=scores,
+        correct=correct,
+        passed=[s >= pass_score for s in scores],
+        difficulty=[round(x, 4) for x in difficulty],
+        discrimination=[round(x, 4) for x in discrimination],
+        distractors=distractors,
+        omitted=omitted,
+        pass_score=pass_score,
+    )
+
+
+def grade_bulk(
+    answers: Sequence[Sequence[int]],
+    key: Sequence[int],
+    pass_score: int = 80,
+    n_choices: Optional[int] = None,
+    use_numpy: Optional[bool] = None,
+) -> BulkResult:
+    """
+    Grade a students x questions answer matrix against an answer key.
+
+    Args:
+        answers: One row per student of chosen indices (-1 = unanswered)
+        key: Correct index per question
+        pass_score: Minimum percentage to pass (default: 80)
+        n_choices: Choices per question (default: inferred from the data)
+        use_numpy: Force or disable NumPy (default: use it when installed)
+
+    Returns:
+        BulkResult with per-student scores and per-item statistics
+
+    Raises:
+        ValueError: If a row has the wrong length or an index is out of range
+    """
+    n_items = len(key)
+    for s, row in enumerate(answers):
+        if len(row) != n_items:
+            raise ValueError(f"Row {s} has {len(row)} answers, expected {n_items}")
+
+    observed = max([max(key, default=0)] + [max(row, default=0) for row in answers])
+    n_choices = max(n_choices or 0, observed + 1)
+    if any(a < UNANSWERED or a >= n_choices for row in answers for a in row):
+        raise ValueError("Answer index out of range")
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ValueError("NumPy is not installed")
+
+    grade = _grade_numpy if use_numpy else _grade_array
+    result = grade(answers, key, n_choices, pass_score)
+    logger.info(f"Bulk graded {result.n_students} students x {result.n_items} items (numpy={use_numpy})")
+    return result
+
+
+def _parse_cell(cell: str) -> int:
+    cell = cell.strip()
+    if not cell:
+        return UNANSWERED
+    if cell.isalpha() and len(cell) == 1:
+        return ord(cell.upper()) - ord("A")
+    return int(cell)
+
+
+def read_answers_csv(path: str) -> Dict[str, Any]:
+    """Read an answers CSV into {"students": [...], "answers": [[...], ...]}."""
+    students: List[str] = []
+    rows: List[List[int]] = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        for line_no, rec in enumerate(reader, start=1):
+            if not rec or not any(c.strip() for c in rec):
+                continue
+            try:
+                parsed = [_parse_cell(c) for c in rec[1:]]
+            except ValueError:
+                if line_no == 1:
+                    continue  # header row
+                raise ValueError(f"Invalid answer on line {line_no} of {path}")
+            students.append(rec[0])
+            rows.append(parsed)
+    return {"students": students, "answers": rows}
+
+
+def format_report(result: BulkResult, students: Optional[List[str]] = None) -> str:
+    """Human-readable class report."""
+    lines = []
+    n = result.n_students
+    mean = sum(result.scores) / n if n else 0.0
+    lines.append(f"Students: {n}   Items: {result.n_items}   Pass score: {result.pass_score}%")
+    lines.append(f"Mean score: {mean:.1f}%   Passed: {sum(result.passed)}/{n}")
+    lines.append("")
+    lines.append("Item  Difficulty  Discrimination  Omitted  Choice counts")
+    for j in range(result.n_items):
+        counts = " ".join(f"{chr(65 + c)}={k}" for c, k in enumerate(result.distractors[j]))
+        flag = "  <- review" if result.discrimination[j] < 0.2 else ""
+        lines.append(f"{j + 1:>4}  {result.difficulty[j]:>10.2f}  {result.discrimination[j]:>14.2f}  "
+                     f"{result.omitted[j]:>7}  {counts}{flag}")
+    if students:
+        lines.append("")
+        lines.append("Student  Score  Result")
+        for name, score, ok in zip(students, result.scores, result.passed):
+            lines.append(f"{name}  {score}%  {'PASS' if ok else 'FAIL'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Grade a class's quiz answers and report item statistics.")
+    parser.add_argument("answers", help="CSV file: student id, then one answer per question")
+    parser.add_argument("--quiz", required=True, help="Quiz JSON with the answer key")
+    parser.add_argument("--pass-score", type=int, help="Override the quiz's pass score")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a text report")
+    args = parser.parse_args(argv)
+
+    with open(args.quiz, encoding="utf-8-sig") as f:
+        quiz = json.load(f)
+    data = read_answers_csv(args.answers)
+    pass_score = args.pass_score if args.pass_score is not None else int(quiz.get("pass_score", 80))
+    result = grade_bulk(data["answers"], key_from_quiz(quiz), pass_score=pass_score)
+
+    if args.json:
+        out = asdict(result)
+        out["students"] = data["students"]
+        print(json.dumps(out, indent=2))
+    else:
+        print(format_report(result, data["students"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
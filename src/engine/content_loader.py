@@ -3,7 +3,12 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from ..core.bundle import bundled
+from ..core.cache import cached_load
+from ..core.config import get_config
+from ..core.profiles import progress_backend
 
 logger = logging.getLogger(__name__)
 
@@ -20,26 +25,33 @@ DEFAULT_PROGRESS = {
 }
 
 
+def _parse_course(path: str) -> Dict[str, Any]:
+    course_data = json.loads(Path(path).read_text(encoding="utf-8-sig"))
+    logger.info("Successfully loaded course data")
+    return course_data
+
+
 def load_course() -> Dict[str, Any]:
     """
     Load course definition from course.json.
     
     Returns:
-        Course data dictionary
+        Course data dictionary (shared via the content cache; do not mutate)
         
     Raises:
         FileNotFoundError: If course.json doesn't exist
         json.JSONDecodeError: If file is invalid JSON
     """
     p = DATA / "course.json"
+    course_data = bundled(str(p))
+    if course_data is not None:
+        return course_data
     try:
         if not p.exists():
             logger.error(f"Course file not found: {p}")
             raise FileNotFoundError(f"Course file not found: {p}")
         
-        course_data = json.loads(p.read_text(encoding="utf-8-sig"))
-        logger.info("Successfully loaded course data")
-        return course_data
+        return cached_load(p, _parse_course)
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in course.json: {e}")
         raise json.JSONDecodeError("Invalid JSON in course.json", e.doc, e.pos)
@@ -50,23 +62,17 @@ def load_course() -> Dict[str, Any]:
 
 def load_progress() -> Dict[str, Any]:
     """
-    Load user progress from progress.json.
+    Load user progress from progress.json and its journal (or from the
+    active profile when the sqlite backend is configured).
     
     Returns:
         Progress data dictionary, or default if file missing/invalid
+        (an unreadable snapshot is kept aside, not overwritten)
     """
-    p = DATA / "progress.json"
     try:
-        if not p.exists():
-            logger.info("Progress file not found, using defaults")
-            return DEFAULT_PROGRESS.copy()
-        
-        progress_data = json.loads(p.read_text(encoding="utf-8-sig"))
+        progress_data = progress_backend(DATA / "progress.json").load(DEFAULT_PROGRESS)
         logger.info("Successfully loaded progress data")
         return progress_data
-    except json.JSONDecodeError as e:
-        logger.warning(f"Invalid JSON in progress.json, using defaults: {e}")
-        return DEFAULT_PROGRESS.copy()
     except (IOError, OSError) as e:
         logger.warning(f"Error reading progress.json, using defaults: {e}")
         return DEFAULT_PROGRESS.copy()
@@ -74,7 +80,8 @@ def load_progress() -> Dict[str, Any]:
 
 def save_progress(progress: Dict[str, Any]) -> None:
     """
-    Save user progress to progress.json.
+    Save user progress: only the changes since the last load/save are
+    appended (fsync'd) to the progress journal.
     
     Args:
         progress: Progress data to save
@@ -87,9 +94,21 @@ def save_progress(progress: Dict[str, Any]) -> None:
         raise ValueError("Progress must be a dictionary")
     
     try:
-        p = DATA / "progress.json"
-        p.write_text(json.dumps(progress, indent=2), encoding="utf-8")
+        progress_backend(DATA / "progress.json").save(progress)
         logger.info("Successfully saved progress data")
     except (IOError, OSError) as e:
         logger.error(f"Error writing progress.json: {e}")
-        raise IOError(f"Cannot save progress: {e}")
\ No newline at end of file
+        raise IOError(f"Cannot save progress: {e}")
+
+
+def history_archive() -> Optional[Path]:
+    """
+    Where attempts rolled out of progress["history"] are archived.
+    
+    Returns:
+        Path of the gzip archive, or None when the profile database
+        (which keeps every attempt) is the progress backend
+    """
+    if get_config().get("progress.backend", "json") == "sqlite":
+        return None
+    return DATA / "progress.json.history.gz"
@@ -0,0 +1,185 @@
+"""Content-addressed test fixtures for data-heavy problems.
+
+Large test inputs and expected values live outside the spec JSON, in
+src/data/fixtures, named by the sha256 of their (uncompressed) content:
+
+    fixtures/<sha256>.bin   raw, memory-mapped at grade time
+    fixtures/<sha256>.gz    gzip-compressed, streamed through a decompressor
+
+Specs refer to them as "sha256:<hex>", so identical data is stored once and
+a spec stays small; a fixture is only opened when its test runs.
+
+Usage:
+    python -m src.engine.fixtures add big_input.txt [--compress]
+    python -m src.engine.fixtures verify
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional
+
+from .content_loader import DATA
+
+FIXTURES_DIR = DATA / "fixtures"
+PREFIX = "sha256:"
+CHUNK = 1 << 16
+
+
+class FixtureError(ValueError):
+    """Raised for malformed references and missing or corrupt fixtures."""
+
+
+def _digest_of(ref: str) -> str:
+    if not isinstance(ref, str) or not ref.startswith(PREFIX):
+        raise FixtureError(f"Invalid fixture reference: {ref!r}")
+    digest = ref[len(PREFIX):].lower()
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise FixtureError(f"Invalid fixture reference: {ref!r}")
+    return digest
+
+
+def fixture_path(ref: str, root: Optional[Path] = None) -> Path:
+    """Stored file for a reference (raw preferred over compressed)."""
+    digest = _digest_of(ref)
+    base = Path(root) if root else FIXTURES_DIR
+    for suffix in (".bin", ".gz"):
+        p = base / f"{digest}{suffix}"
+        if p.exists():
+            return p
+    raise FixtureError(f"Fixture not found: {ref}")
+
+
+def is_compressed(path: Path) -> bool:
+    return Path(path).suffix == ".gz"
+
+
+def add_fixture(source: Path, compress: bool = False, root: Optional[Path] = None) -> str:
+    """
+    Store a file as a fixture and return its reference. Adding content that
+    is already stored (raw or compressed) writes nothing.
+    """
+    h = hashlib.sha256()
+    with open(source, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK), b""):
+            h.update(block)
+    ref = PREFIX + h.hexdigest()
+    base = Path(root) if root else FIXTURES_DIR
+    try:
+        fixture_path(ref, base)
+        return ref
+    except FixtureError:
+        pass
+
+    base.mkdir(parents=True, exist_ok=True)
+    target = base / f"{h.hexdigest()}{'.gz' if compress else '.bin'}"
+    fd, tmp = tempfile.mkstemp(dir=base, suffix=".tmp")
+    with os.fdopen(fd, "wb") as raw, open(source, "rb") as src:
+        if compress:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as out:
+                shutil.copyfileobj(src, out, CHUNK)
+        else:
+            shutil.copyfileobj(src, raw, CHUNK)
+    os.replace(tmp, target)
+    return ref
+
+
+def open_stream(path: Path) -> IO[bytes]:
+    """Binary stream of a fixture's content, decompressing on the fly."""
+    return gzip.open(path, "rb") if is_compressed(path) else open(path, "rb")
+
+
+@contextmanager
+def as_stdin_file(path: Path, scratch: Path) -> Iterator[str]:
+    """
+    A plain file path holding the fixture content, for use as a process's stdin.
+
+    Raw fixtures are used in place (the child reads them straight from the page
+    cache); compressed ones are streamed into a scratch file first.
+    """
+    if not is_compressed(path):
+        yield str(path)
+        return
+    target = Path(scratch) / ".stdin"
+    with open_stream(path) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, CHUNK)
+    try:
+        yield str(target)
+    finally:
+        target.unlink(missing_ok=True)
+
+
+def content_equals(path: Path, data: bytes) -> bool:
+    """Compare a fixture with data in chunks, without loading the fixture."""
+    if not is_compressed(path):
+        size = path.stat().st_size
+        if size != len(data):
+            return False
+        if size == 0:
+            return True
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return all(mm[i:i + CHUNK] == data[i:i + CHUNK] for i in range(0, size, CHUNK))
+    pos = 0
+    with open_stream(path) as f:
+        for block in iter(lambda: f.read(CHUNK), b""):
+            if data[pos:pos + len(block)] != block:
+                return False
+            pos += len(block)
+    return pos == len(data)
+
+
+def stream_equals(path: Path, chunks: Iterable[bytes]) -> bool:
+    """Compare a fixture with a stream of chunks of any size, holding one chunk at a time."""
+    with open_stream(path) as f:
+        for block in chunks:
+            while block:
+                want = f.read(len(block))
+                if not want or block[:len(want)] != want:
+                    return False
+                block = block[len(want):]
+        return f.read(1) == b""
+
+
+def verify(ref: str, root: Optional[Path] = None) -> bool:
+    """True if the stored content still hashes to its reference."""
+    h = hashlib.sha256()
+    with open_stream(fixture_path(ref, root)) as f:
+        for block in iter(lambda: f.read(CHUNK), b""):
+            h.update(block)
+    return h.hexdigest() == _digest_of(ref)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage content-addressed test fixtures.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Store a file and print its reference")
+    add.add_argument("file")
+    add.add_argument("--compress", action="store_true", help="Store gzip-compressed")
+    sub.add_parser("verify", help="Check every stored fixture against its hash")
+    args = parser.parse_args(argv)
+
+    if args.command == "add":
+        print(add_fixture(Path(args.file), compress=args.compress))
+        return 0
+
+    bad = 0
+    for p in sorted(FIXTURES_DIR.glob("*")) if FIXTURES_DIR.exists() else []:
+        ref = PREFIX + p.name.split(".", 1)[0]
+        if not verify(ref):
+            print(f"CORRUPT  {p.name}")
+            bad += 1
+    print("All fixtures verified." if not bad else f"{bad} corrupt fixture(s).")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Compiled FRQ rubric matching: exact multi-keyword search plus typo tolerance."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9_']+")
+NGRAM = 3
+
+
+def max_edits_for(word: str) -> int:
+    """Typo budget by length: short words must match exactly."""
+    n = len(word)
+    if n <= 4:
+        return 0
+    if n <= 8:
+        return 1
+    return 2
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton: finds all patterns in one pass over the text."""
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for idx, pat in enumerate(self.patterns):
+            if pat:
+                self._insert(pat, idx)
+        self._link()
+
+    def _insert(self, pat: str, idx: int) -> None:
+        node = 0
+        for ch in pat:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(idx)
+
+    def _link(self) -> None:
+        q = deque(self._goto[0].values())
+        while q:
+            node = q.popleft()
+            for ch, child in self._goto[node].items():
+                q.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[child] = cand if cand != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Set[int]:
+        """Indices of all patterns occurring in text."""
+        found: Set[int] = set()
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+def _grams(s: str) -> Set[str]:
+    padded = f"^{s}$"
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+def bounded_edit_distance(a: str, b: str, k: int) -> Optional[int]:
+    """
+    Edit distance (insert, delete, substitute, swap adjacent letters) if it
+    is <= k, otherwise None. Stops as soon as a whole row exceeds k.
+    """
+    if abs(len(a) - len(b)) > k:
+        return None
+    before: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, start=1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cur[j] = min(cur[j], before[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > k:
+            return None
+        before, prev = prev, cur
+    return prev[-1] if prev[-1] <= k else None
+
+
+class NgramIndex:
+    """Character n-gram index over keywords for bounded-edit-distance lookup."""
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(keywords)
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []
+        for idx, kw in enumerate(self.keywords):
+            grams = _grams(kw)
+            self._sizes.append(len(grams))
+            for g in grams:
+                self._postings.setdefault(g, []).append(idx)
+
+    def lookup(self, term: str, candidates: Optional[Set[int]] = None) -> List[Tuple[int, int]]:
+        """
+        Keywords within their typo budget of term, as (keyword index, distance).
+
+        Uses the q-gram lemma as a filter: one edit destroys at most NGRAM
+        grams (NGRAM + 1 for a swap of adjacent letters), so a keyword within
+        k edits shares at least |grams(kw)| - k * (NGRAM + 1) grams with the term.
+        """
+        counts: Dict[int, int] = {}
+        for g in _grams(term):
+            for idx in self._postings.get(g, ()):
+                if candidates is None or idx in candidates:
+                    counts[idx] = counts.get(idx, 0) + 1
+
+        hits = []
+        for idx, shared in counts.items():
+            kw = self.keywords[idx]
+            k = max_edits_for(kw)
+            if k == 0 or shared < self._sizes[idx] - k * (NGRAM + 1):
+                continue
+            d = bounded_edit_distance(term, kw, k)
+            if d is not None:
+                hits.append((idx, d))
+        return hits
+
+
+@dataclass
+class RubricMatch:
+    """Which rubric entries an answer satisfied."""
+    matched: List[str] = field(default_factory=list)      # exact + fuzzy, rubric order
+    fuzzy: Dict[str, str] = field(default_factory=dict)   # keyword -> text that matched it
+    fix_ok: bool = True
+
+
+class CompiledRubric:
+    """
+    An FRQ rubric compiled once: keywords and required-fix strings go into a
+    single Aho-Corasick automaton; keywords also get an n-gram index so
+    misspellings within a small edit distance still count.
+    """
+
+    def __init__(self, keywords: Sequence[str], expected_fix: Sequence[str] = ()):
+        self.keywords = [k.lower() for k in keywords]
+        self.expected_fix = [s.lower() for s in expected_fix]
+        self._automaton = AhoCorasick(self.keywords + self.expected_fix)
+        self._index = NgramIndex(self.keywords)
+        self._widths = sorted({len(k.split()) for k in self.keywords if k.strip()})
+        # The automaton never reports an empty pattern, but "" in text always held.
+        self._empty_kw = {i for i, k in enumerate(self.keywords) if not k}
+        self._empty_fix = "" in self.expected_fix
+
+    def _windows(self, tokens: List[str]) -> Iterable[str]:
+        for w in self._widths:
+            for i in range(len(tokens) - w + 1):
+                yield " ".join(tokens[i:i + w])
+
+    def match(self, text: str) -> RubricMatch:
+        """Match one answer (case-insensitive)."""
+        txt = (text or "").lower().strip()
+        hits = self._automaton.find(txt)
+        n_kw = len(self.keywords)
+
+        exact = {i for i in hits if i < n_kw} | self._empty_kw
+        result = RubricMatch()
+        if self.expected_fix:
+            result.fix_ok = self._empty_fix or any(i >= n_kw for i in hits)
+
+        missing = set(range(n_kw)) - exact
+        if missing:
+            tokens = TOKEN_RE.findall(txt)
+            for term in self._windows(tokens):
+                for idx, _ in self._index.lookup(term, missing):
+                    if idx in missing:
+                        result.fuzzy[self.keywords[idx]] = term
+                        missing.discard(idx)
+                if not missing:
+                    break
+
+        result.matched = [k for i, k in enumerate(self.keywords) if i not in missing]
+        return result
+
+    def match_batch(self, texts: Iterable[str]) -> List[RubricMatch]:
+        """Match many answers against the same compiled rubric."""
+        return [self.match(t) for t in texts]
+
+
+@lru_cache(maxsize=256)
+def _compile(keywords: Tuple[str, ...], expected_fix: Tuple[str, ...]) -> CompiledRubric:
+    logger.debug(f"Compiling FRQ rubric with {len(keywords)} keywords")
+    return CompiledRubric(keywords, expected_fix)
+
+
+def compile_rubric(frq: Dict) -> CompiledRubric:
+    """Compiled rubric for an FRQ spec, cached so repeated grading reuses it."""
+    return _compile(tuple(frq.get("keywords", [])), tuple(frq.get("expected_fix_contains", [])))
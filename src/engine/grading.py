@@ -3,6 +3,8 @@
 import logging
 from typing import Dict, Tuple, Any, List
 
+from .frq_matcher import compile_rubric
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +17,8 @@ def grade_quiz(quiz: Dict[str, Any], answers: Dict[str, Any]) -> Tuple[int, Dict
       - FRQ = 20 pts
       
     FRQ grading:
-      - Keyword rubric with partial credit
+      - Keyword rubric with partial credit (small typos still count;
+        see detail["frq"]["fuzzy"])
       - Must contain valid fix line if expected_fix_contains is specified
     
     Args:
@@ -27,10 +30,10 @@ def grade_quiz(quiz: Dict[str, Any], answers: Dict[str, Any]) -> Tuple[int, Dict
     """
     if not isinstance(quiz, dict) or not isinstance(answers, dict):
         logger.error(f"Invalid quiz or answers type: quiz={type(quiz)}, answers={type(answers)}")
-        return 0, {"mcq": [], "frq": {"points": 0, "matched": [], "fix_ok": False}, "error": "Invalid input"}
+        return 0, {"mcq": [], "frq": {"points": 0, "matched": [], "fuzzy": {}, "fix_ok": False}, "error": "Invalid input"}
     
     points = 0
-    detail: Dict[str, Any] = {"mcq": [], "frq": {"points": 0, "matched": [], "fix_ok": False}}
+    detail: Dict[str, Any] = {"mcq": [], "frq": {"points": 0, "matched": [], "fuzzy": {}, "fix_ok": False}}
 
     # Grade multiple choice questions
     mcq_items = quiz.get("mcq", [])
@@ -58,25 +61,27 @@ def grade_quiz(quiz: Dict[str, Any], answers: Dict[str, Any]) -> Tuple[int, Dict
     frq = quiz.get("frq", {})
     txt = (answers.get("frq", "") or "").lower().strip()
 
-    # Keyword partial credit
-    keywords = [k.lower() for k in frq.get("keywords", [])]
-    matched = [k for k in keywords if k in txt]
+    # Keyword partial credit (exact hits plus typo-tolerant matches)
+    rubric = compile_rubric(frq)
+    keywords = rubric.keywords
+    match = rubric.match(txt)
+    matched = match.matched
     detail["frq"]["matched"] = matched
+    detail["frq"]["fuzzy"] = match.fuzzy
 
     base = 0
     if keywords:
         ratio = len(matched) / max(1, len(keywords))
         base = int(round(20 * ratio))
-        logger.debug(f"FRQ: {len(matched)}/{len(keywords)} keywords matched, base score={base}")
+        logger.debug(f"FRQ: {len(matched)}/{len(keywords)} keywords matched ({len(match.fuzzy)} fuzzy), base score={base}")
     else:
         base = 20 if len(txt) >= 20 else 0
         logger.debug(f"FRQ: no keywords defined, base score={base}")
 
-    # Check for required fix strings
-    expected_fix = [s.lower() for s in frq.get("expected_fix_contains", [])]
-    fix_ok = True
+    # Check for required fix strings (exact: these are code, not prose)
+    expected_fix = rubric.expected_fix
+    fix_ok = match.fix_ok
     if expected_fix:
-        fix_ok = any(s in txt for s in expected_fix)
         logger.debug(f"FRQ: fix_ok={fix_ok}")
 
     detail["frq"]["fix_ok"] = fix_ok
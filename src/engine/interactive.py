@@ -0,0 +1,224 @@
+"""Interactive judging: a judge program and the student's program talk over pipes."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .scratch import get_scratch_pool
+
+logger = logging.getLogger(__name__)
+
+MAX_LINE = 500
+MAX_STDERR_LINES = 50
+
+JUDGE_FUNCTION_WRAPPER = '''
+import sys
+
+def _send(line):
+    print(line, flush=True)
+
+def _recv():
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("student closed its output")
+    return line.rstrip("\\n")
+
+try:
+    _ok = judge(_send, _recv)
+except (AssertionError, EOFError) as _e:
+    print(str(_e) or type(_e).__name__, file=sys.stderr)
+    sys.exit(1)
+sys.exit(0 if _ok in (None, True) else 1)
+'''
+
+
+@dataclass
+class InteractiveResult:
+    """Result of one interactive session."""
+    passed: bool
+    verdict: str  # accepted | rejected | timeout | crash
+    message: str
+    transcript: List[Tuple[str, str]] = field(default_factory=list)
+    dropped_turns: int = 0
+    stderr: str = ""
+
+    def format_transcript(self, last: int = 20) -> str:
+        """Render the tail of the transcript for feedback."""
+        lines = [f"{who}> {text}" for who, text in self.transcript[-last:]]
+        if self.dropped_turns or len(self.transcript) > last:
+            lines.insert(0, "... (earlier turns omitted)")
+        return "\n".join(lines)
+
+
+def judge_script(judge: Optional[str] = None, judge_function: Optional[str] = None) -> str:
+    """
+    Build the judge program source.
+
+    A judge script reads the student's lines on stdin, writes its own lines to
+    stdout and exits 0 to accept. A judge function is code defining
+    judge(send, recv) that returns True/None to accept, False or raises
+    AssertionError to reject.
+    """
+    if judge_function:
+        return judge_function + "\n" + JUDGE_FUNCTION_WRAPPER
+    return judge or ""
+
+
+def _spawn(source: str, workdir: Path) -> subprocess.Popen:
+    script = workdir / "__main__.py"
+    script.write_text(source, encoding="utf-8")
+    return subprocess.Popen(
+        [sys.executable, "-u", script.name],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        cwd=str(workdir),
+    )
+
+
+def _pump(stream, who: str, events: "queue.Queue") -> None:
+    for line in stream:
+        events.put((who, line))
+    events.put((who, None))
+
+
+def _drain(stream, sink: deque) -> None:
+    for line in stream:
+        sink.append(line)
+
+
+def _write(proc: subprocess.Popen, line: str) -> None:
+    try:
+        proc.stdin.write(line)
+        proc.stdin.flush()
+    except (BrokenPipeError, OSError, ValueError):
+        pass
+
+
+def _close_stdin(proc: subprocess.Popen) -> None:
+    try:
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+
+def run_interactive(
+    code: str,
+    judge_source: str,
+    turn_timeout: float = 1.0,
+    total_timeout: float = 10.0,
+    max_transcript: int = 200,
+) -> InteractiveResult:
+    """
+    Run the student's program against a judge, relaying lines turn by turn.
+
+    Every line either side prints is forwarded to the other side's stdin and
+    recorded in a bounded transcript. If neither side says anything for
+    turn_timeout seconds the session fails with a timeout.
+
+    Args:
+        code: Student program
+        judge_source: Judge program (see judge_script)
+        turn_timeout: Max silence between two messages, in seconds
+        total_timeout: Max duration of the whole session, in seconds
+        max_transcript: Number of turns kept in the transcript
+
+    Returns:
+        InteractiveResult with verdict and transcript
+    """
+    transcript: deque = deque(maxlen=max_transcript)
+    turns = 0
+    judge_err: deque = deque(maxlen=MAX_STDERR_LINES)
+    student_err: deque = deque(maxlen=MAX_STDERR_LINES)
+    events: "queue.Queue" = queue.Queue()
+    pool = get_scratch_pool()
+
+    with ExitStack() as stack:
+        # The judge (expected answers included) runs from a private directory
+        # outside the pool root, where the student can't reach it via ../
+        judge_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="codequest-judge-")))
+        judge = _spawn(judge_source, judge_dir)
+        stack.callback(judge.kill)
+        student = _spawn(code, stack.enter_context(pool.lease()))
+        stack.callback(student.kill)
+        peers = {"judge": student, "student": judge}
+
+        drains = []
+        for who, proc, sink in (("judge", judge, judge_err), ("student", student, student_err)):
+            threading.Thread(target=_pump, args=(proc.stdout, who, events), daemon=True).start()
+            drains.append(threading.Thread(target=_drain, args=(proc.stderr, sink), daemon=True))
+            drains[-1].start()
+
+        deadline = time.monotonic() + total_timeout
+        timed_out = ""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = f"Session exceeded {total_timeout}s."
+                break
+            try:
+                who, line = events.get(timeout=min(turn_timeout, remaining))
+            except queue.Empty:
+                timed_out = f"No message from either side within {turn_timeout}s."
+                break
+
+            if line is None:
+                if who == "judge":
+                    break
+                # Student finished: let the judge see EOF and decide.
+                _close_stdin(judge)
+                continue
+
+            turns += 1
+            transcript.append((who, line.rstrip("\n")[:MAX_LINE]))
+            _write(peers[who], line if line.endswith("\n") else line + "\n")
+
+        _close_stdin(student)
+        try:
+            judge_code = judge.wait(timeout=turn_timeout)
+        except subprocess.TimeoutExpired:
+            judge_code = None
+        try:
+            student_code = student.wait(timeout=0.2)
+        except subprocess.TimeoutExpired:
+            student_code = None
+        for t in drains:
+            t.join(timeout=0.2)
+
+    dropped = max(0, turns - len(transcript))
+    stderr = "".join(student_err)
+    judge_msg = "".join(judge_err).strip()
+
+    if timed_out:
+        verdict, message = "timeout", timed_out
+    elif judge_code != 0:
+        verdict, message = "rejected", judge_msg or f"Judge rejected the session (exit code {judge_code})."
+    elif student_code not in (0, None):
+        verdict, message = "crash", f"Your program crashed (exit code {student_code})."
+    else:
+        verdict, message = "accepted", judge_msg or "Judge accepted the session."
+
+    result = InteractiveResult(
+        passed=(verdict == "accepted"),
+        verdict=verdict,
+        message=message,
+        transcript=list(transcript),
+        dropped_turns=dropped,
+        stderr=stderr,
+    )
+    logger.info(f"Interactive session finished: verdict={verdict}, turns={turns}")
+    return result
@@ -0,0 +1,167 @@
+"""Per-module lazy course loading with background prefetch of the next stage.
+
+course.json holds only the outline (id, title, objective, hack_prompt) of each
+module. Everything else lives in one file per stage under src/data/lessons:
+
+    lessons/<module id>/lesson.json      lesson_html, sections, examples, ...
+    lessons/<module id>/quiz.json        {"quiz": {...}}
+    lessons/<module id>/debug.json       {"error_pack": [...]}
+    lessons/<module id>/challenge.json   {"coding_challenge": {...}}
+
+A module whose stage file is missing falls back to fields inlined in
+course.json, so an unsplit course still loads. Run
+
+    python -m src.engine.module_store split
+
+to move inlined fields out into stage files.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.io import load_json
+from .content_loader import DATA, load_course
+from .frq_matcher import compile_rubric
+
+logger = logging.getLogger(__name__)
+
+LESSONS_DIR = DATA / "lessons"
+
+OUTLINE_KEYS = ("id", "title", "objective", "hack_prompt")
+STAGES: Dict[str, Tuple[str, ...]] = {
+    "lesson": ("lesson_html", "lesson_text", "sections", "examples", "starter_task"),
+    "quiz": ("quiz",),
+    "debug": ("error_pack",),
+    "challenge": ("coding_challenge",),
+}
+STAGE_ORDER = ("lesson", "quiz", "debug", "challenge")
+
+
+def next_stage(index: int, stage: str) -> Tuple[int, str]:
+    """The stage a student reaches after this one: quiz -> debug -> challenge -> next module."""
+    pos = STAGE_ORDER.index(stage)
+    if pos + 1 < len(STAGE_ORDER):
+        return index, STAGE_ORDER[pos + 1]
+    return index + 1, STAGE_ORDER[0]
+
+
+def _warm(stage: str, unit: Dict[str, Any]) -> None:
+    """Pre-parse whatever grading a stage will need."""
+    if stage == "quiz":
+        frq = unit.get("quiz", {}).get("frq")
+        if frq:
+            compile_rubric(frq)
+
+
+class ModuleStore:
+    """
+    Loads one module stage at a time and prefetches the next stage on a
+    single background thread. Loaded stages live in the shared content cache,
+    so a prefetched stage costs nothing when the UI asks for it. Returned
+    dicts are shared and must not be mutated.
+
+    on_prefetch(index, stage, unit), if given, runs on the prefetch thread
+    after a stage loads, e.g. to start decoding the images it references.
+    """
+
+    def __init__(self, course: Optional[Dict[str, Any]] = None, lessons_dir: Optional[Path] = None,
+                 on_prefetch: Optional[Callable[[int, str, Dict[str, Any]], None]] = None):
+        self.course = course if course is not None else load_course()
+        self.lessons_dir = Path(lessons_dir) if lessons_dir else LESSONS_DIR
+        self.on_prefetch = on_prefetch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="module-prefetch")
+        self._pending: Dict[Tuple[int, str], Future] = {}
+
+    def modules(self) -> List[Dict[str, Any]]:
+        return self.course.get("modules", [])
+
+    def stage_path(self, module_id: str, stage: str) -> Path:
+        return self.lessons_dir / module_id / f"{stage}.json"
+
+    def load_stage(self, index: int, stage: str) -> Dict[str, Any]:
+        """Fields of one stage of module index (empty if the module doesn't exist)."""
+        mods = self.modules()
+        if not 0 <= index < len(mods):
+            return {}
+        outline = mods[index]
+        path = self.stage_path(str(outline.get("id", index)), stage)
+        try:
+            return load_json(str(path))
+        except FileNotFoundError:
+            return {k: outline[k] for k in STAGES[stage] if k in outline}
+
+    def module(self, index: int, stage: str) -> Dict[str, Any]:
+        """Outline of module index merged with one stage's fields."""
+        mods = self.modules()
+        if not mods:
+            return {}
+        index = max(0, min(index, len(mods) - 1))
+        merged = {k: mods[index][k] for k in OUTLINE_KEYS if k in mods[index]}
+        merged.update(self.load_stage(index, stage))
+        return merged
+
+    def _prefetch(self, index: int, stage: str) -> None:
+        try:
+            unit = self.load_stage(index, stage)
+            _warm(stage, unit)
+            if self.on_prefetch is not None:
+                self.on_prefetch(index, stage, unit)
+            logger.debug(f"Prefetched module {index} stage {stage}")
+        except Exception as e:  # a bad file surfaces again when the UI loads it
+            logger.warning(f"Prefetch of module {index} stage {stage} failed: {e}")
+
+    def prefetch_after(self, index: int, stage: str) -> Optional[Future]:
+        """Start loading the stage after (index, stage) in the background."""
+        key = next_stage(index, stage)
+        if key[0] >= len(self.modules()):
+            return None
+        fut = self._pending.get(key)
+        if fut is None or fut.done():
+            fut = self._pending[key] = self._executor.submit(self._prefetch, *key)
+        return fut
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def split_course(course_path: Path = DATA / "course.json", lessons_dir: Path = LESSONS_DIR) -> int:
+    """
+    Move each module's stage fields out of course.json into stage files.
+
+    Returns:
+        Number of stage files written
+    """
+    course = json.loads(Path(course_path).read_text(encoding="utf-8-sig"))
+    written = 0
+    for mod in course.get("modules", []):
+        for stage, keys in STAGES.items():
+            unit = {k: mod.pop(k) for k in keys if k in mod}
+            if not unit:
+                continue
+            path = Path(lessons_dir) / str(mod["id"]) / f"{stage}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(unit, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            written += 1
+    Path(course_path).write_text(json.dumps(course, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    logger.info(f"Split {course_path} into {written} stage files under {lessons_dir}")
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Split course.json into per-module stage files.")
+    parser.add_argument("command", choices=["split"])
+    parser.add_argument("--course", default=str(DATA / "course.json"))
+    parser.add_argument("--lessons-dir", default=str(LESSONS_DIR))
+    args = parser.parse_args(argv)
+    n = split_course(Path(args.course), Path(args.lessons_dir))
+    print(f"Wrote {n} stage files to {args.lessons_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
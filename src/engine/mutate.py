@@ -0,0 +1,304 @@
+"""Generate debug-mission variants by mutating a reference solution.
+
+Usage:
+    python -m src.engine.mutate src/data/debugs/m1_debug.json [--order 2] [--jobs N] [--out variants.json]
+
+Each single-site AST mutation of the spec's reference_solution is a
+candidate broken_code:
+
+    off_by_one          integer constant +/- 1, < <-> <=, > <-> >=
+    wrong_operator      + <-> -, * -> +, / -> //, == <-> !=, and <-> or, ...
+    missing_return      "return expr" becomes a bare "expr"
+    missing_separator   "Hello, " + name -> "Hello" + name, ", ".join -> "".join
+
+--order 2 also combines pairs of sites. Candidates run against the spec's
+tests in a process pool; a variant is kept only if it fails at least one
+test, never times out, and gives the same verdicts on a second run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import copy
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .worker import WorkerError, WorkerSession, WorkerTimeout
+
+logger = logging.getLogger(__name__)
+
+SEPARATORS = " ,;:-|/"
+
+_BINOP_SWAPS = {
+    ast.Add: (ast.Sub,), ast.Sub: (ast.Add,), ast.Mult: (ast.Add,),
+    ast.Div: (ast.FloorDiv,), ast.FloorDiv: (ast.Div,), ast.Mod: (ast.FloorDiv,),
+}
+_BOUNDARY_SWAPS = {ast.Lt: ast.LtE, ast.LtE: ast.Lt, ast.Gt: ast.GtE, ast.GtE: ast.Gt}
+_EQUALITY_SWAPS = {ast.Eq: ast.NotEq, ast.NotEq: ast.Eq, ast.Is: ast.IsNot, ast.IsNot: ast.Is,
+                   ast.In: ast.NotIn, ast.NotIn: ast.In}
+
+
+@dataclass
+class Mutation:
+    kind: str
+    line: int
+    description: str
+
+
+@dataclass
+class Variant:
+    broken_code: str
+    mutations: List[Mutation]
+    failing_tests: List[int] = field(default_factory=list)
+
+
+# A mutation site: (kind, replacement for the node). The replacement gets the
+# node from a fresh copy of the tree and returns what should stand in its place.
+Site = Tuple[str, Callable[[ast.AST], ast.AST]]
+
+
+def _with_op(node: ast.AST, op_type: type) -> ast.AST:
+    node.op = op_type()
+    return node
+
+
+def _stripped(node: ast.Constant, side: str) -> ast.AST:
+    node.value = node.value.rstrip(SEPARATORS) if side == "right" else node.value.lstrip(SEPARATORS)
+    return node
+
+
+def _sites(node: ast.AST) -> Iterator[Site]:
+    """Every way to mutate this one node."""
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        yield "off_by_one", lambda n: ast.Constant(n.value + 1)
+        if node.value > 0:
+            yield "off_by_one", lambda n: ast.Constant(n.value - 1)
+    elif isinstance(node, ast.Compare) and len(node.ops) == 1:
+        op = type(node.ops[0])
+        if op in _BOUNDARY_SWAPS:
+            yield "off_by_one", lambda n: ast.Compare(n.left, [_BOUNDARY_SWAPS[op]()], n.comparators)
+        if op in _EQUALITY_SWAPS:
+            yield "wrong_operator", lambda n: ast.Compare(n.left, [_EQUALITY_SWAPS[op]()], n.comparators)
+    elif isinstance(node, (ast.BinOp, ast.AugAssign)):
+        for new_op in _BINOP_SWAPS.get(type(node.op), ()):
+            yield "wrong_operator", lambda n, new_op=new_op: _with_op(n, new_op)
+    elif isinstance(node, ast.BoolOp):
+        yield "wrong_operator", lambda n: ast.BoolOp(ast.Or() if isinstance(n.op, ast.And) else ast.And(), n.values)
+    elif isinstance(node, ast.Return) and node.value is not None:
+        yield "missing_return", lambda n: ast.Expr(n.value)
+
+    # String joins: a separator next to the + or as the .join() receiver.
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        for side, operand in (("left", node.left), ("right", node.right)):
+            if isinstance(operand, ast.Constant) and isinstance(operand.value, str):
+                edge = operand.value[-1:] if side == "left" else operand.value[:1]
+                if edge and edge in SEPARATORS and operand.value.strip(SEPARATORS):
+                    strip = "right" if side == "left" else "left"
+                    yield "missing_separator", lambda n, side=side, strip=strip: \
+                        ast.BinOp(_stripped(n.left, strip) if side == "left" else n.left, n.op,
+                                  _stripped(n.right, strip) if side == "right" else n.right)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "join"
+            and isinstance(node.func.value, ast.Constant) and node.func.value.value):
+        yield "missing_separator", lambda n: ast.Call(ast.Attribute(ast.Constant(""), "join", ast.Load()),
+                                                      n.args, n.keywords)
+
+
+def _replace(parent: ast.AST, old: ast.AST, new: ast.AST) -> None:
+    for name, value in ast.iter_fields(parent):
+        if value is old:
+            setattr(parent, name, new)
+            return
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if item is old:
+                    value[i] = new
+                    return
+
+
+def _apply(tree: ast.Module, picks: List[Tuple[int, Site]]) -> str:
+    """Source of a copy of tree with the given (node index, site) mutations applied."""
+    clone = copy.deepcopy(tree)
+    nodes = list(ast.walk(clone))
+    parents = {child: parent for parent in nodes for child in ast.iter_child_nodes(parent)}
+    # Deepest first (a descendant always has a higher ast.walk index), so an
+    # outer replacement is built around already-mutated children.
+    for index, (_, make) in sorted(picks, key=lambda p: -p[0]):
+        old = nodes[index]
+        new = ast.copy_location(make(old), old)
+        if new is not old:
+            _replace(parents[old], old, new)
+    return ast.unparse(ast.fix_missing_locations(clone))
+
+
+def mutants(source: str, order: int = 1) -> List[Tuple[str, List[Mutation]]]:
+    """
+    Distinct mutated versions of source (never source itself).
+
+    Args:
+        source: Reference solution
+        order: 1 for single-site mutations, 2 to also combine pairs of sites
+
+    Returns:
+        (code, mutations applied) pairs, first-order mutants first
+    """
+    tree = ast.parse(source)
+    nodes = list(ast.walk(tree))
+    sites = [(index, site) for index, node in enumerate(nodes) for site in _sites(node)]
+
+    out: List[Tuple[str, List[Mutation]]] = []
+    seen = {ast.unparse(tree)}
+    for k in range(1, max(1, order) + 1):
+        for combo in itertools.combinations(sites, k):
+            if len({index for index, _ in combo}) < k:
+                continue
+            try:
+                code = _apply(tree, list(combo))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if code in seen:
+                continue
+            seen.add(code)
+            out.append((code, [_describe(nodes[index], site) for index, site in combo]))
+    return out
+
+
+def _describe(node: ast.AST, site: Site) -> Mutation:
+    before = ast.unparse(node).splitlines()[0]
+    after = ast.unparse(site[1](copy.deepcopy(node))).splitlines()[0]
+    return Mutation(site[0], getattr(node, "lineno", 0), f"{before} -> {after}")
+
+
+# -------------------- validation (process pool) --------------------
+
+_session: Optional[WorkerSession] = None
+_job: Dict[str, Any] = {}
+
+
+def _init_pool(fn: str, tests: List[Dict[str, Any]], timeout_sec: float) -> None:
+    """Each pool process keeps one grading worker for all the candidates it checks."""
+    global _session, _job
+    # The grading worker exits on its own when this process ends and its stdin closes.
+    _session = WorkerSession(timeout_sec=timeout_sec)
+    _job = {"fn": fn, "tests": tests}
+
+
+def _verdicts(code: str) -> Tuple[str, ...]:
+    """Outcome of every test ("pass", "mismatch", "error:<Type>"), or ("timeout",)."""
+    fn, tests = _job["fn"], _job["tests"]
+    try:
+        # Plain requests, not load()/expect(): nothing is replayed after a restart.
+        loaded = _session.request({"op": "load", "code": code, "ns": "mutant"})
+        if not loaded.get("ok"):
+            return ("error:load",) * len(tests)
+        _session.request({"op": "expect", "fn": fn, "tests": tests})
+        out = []
+        for i in range(len(tests)):
+            r = _session.request({"op": "check", "fn": fn, "index": i, "ns": "mutant"})
+            kind = r.get("kind", "error")
+            out.append(kind if kind != "error" else f"error:{r.get('error', 'worker')}")
+        return tuple(out)
+    except WorkerTimeout:
+        return ("timeout",)
+    except WorkerError:
+        return ("error:worker",)
+
+
+def _evaluate(code: str) -> Tuple[str, List[int]]:
+    """("kept", failing test indices) or (reason it was dropped, [])."""
+    first = _verdicts(code)
+    if "timeout" in first:
+        return "timeout", []
+    if all(v == "pass" for v in first):
+        return "equivalent", []
+    if _verdicts(code) != first:
+        return "flaky", []
+    return "kept", [i for i, v in enumerate(first) if v != "pass"]
+
+
+def _spec_parts(spec: Dict[str, Any]) -> Tuple[str, str, List[Dict[str, Any]]]:
+    fn = spec.get("required_function") or spec.get("function")
+    reference = spec.get("reference_solution")
+    if not fn or not reference or not spec.get("tests"):
+        raise ValueError("Spec needs a function name, a reference_solution and tests")
+    tests = [{"args": list(t["input"]) if isinstance(t.get("input"), (list, tuple)) else [t.get("input")],
+              "expected": t.get("expected")} for t in spec["tests"]]
+    return fn, reference, tests
+
+
+def generate_variants(spec: Dict[str, Any], order: int = 1, jobs: Optional[int] = None,
+                      limit: Optional[int] = None, timeout_sec: float = 1.0) -> Tuple[List[Variant], Dict[str, int]]:
+    """
+    Mutate a spec's reference solution and keep the variants that fail its tests.
+
+    Args:
+        spec: Debug mission or problem spec (function / required_function,
+              reference_solution, tests)
+        order: Mutation order (1 or 2)
+        jobs: Pool processes (default: CPU count)
+        limit: Stop after checking this many candidates
+        timeout_sec: Per-request limit; slower candidates are dropped
+
+    Returns:
+        (kept variants, counts of candidates by outcome)
+
+    Raises:
+        ValueError: If the spec is incomplete or its reference solution fails
+    """
+    fn, reference, tests = _spec_parts(spec)
+    candidates = mutants(reference, order)[:limit]
+    stats = {"candidates": len(candidates), "kept": 0, "equivalent": 0, "flaky": 0, "timeout": 0}
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 4, initializer=_init_pool,
+                             initargs=(fn, tests, timeout_sec)) as pool:
+        if pool.submit(_evaluate, reference).result()[0] != "equivalent":
+            raise ValueError("reference_solution does not pass its own tests")
+        chunk = max(1, len(candidates) // (8 * (jobs or os.cpu_count() or 4)))
+        outcomes = list(pool.map(_evaluate, [code for code, _ in candidates], chunksize=chunk))
+
+    variants: List[Variant] = []
+    for (code, muts), (outcome, failing) in zip(candidates, outcomes):
+        stats[outcome] += 1
+        if outcome == "kept":
+            variants.append(Variant(code + "\n", muts, failing))
+    return variants, stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate debug-mission variants by AST mutation.")
+    parser.add_argument("spec", help="Debug or problem spec JSON with a reference_solution")
+    parser.add_argument("--order", type=int, choices=[1, 2], default=1, help="Combine up to this many mutations")
+    parser.add_argument("--jobs", type=int, default=None, help="Pool processes (default: CPU count)")
+    parser.add_argument("--limit", type=int, default=None, help="Check at most this many candidates")
+    parser.add_argument("--out", default=None, help="Write variants here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    spec = json.loads(Path(args.spec).read_text(encoding="utf-8-sig"))
+    start = time.perf_counter()
+    variants, stats = generate_variants(spec, order=args.order, jobs=args.jobs, limit=args.limit)
+    elapsed = time.perf_counter() - start
+
+    stem = Path(args.spec).stem
+    doc = {"source": args.spec, "function": spec.get("required_function") or spec.get("function"),
+           "variants": [{"id": f"{stem}_mut{i:04d}", **asdict(v)} for i, v in enumerate(variants, 1)]}
+    text = json.dumps(doc, indent=2, ensure_ascii=False) + "\n"
+    if args.out:
+        Path(args.out).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    print(f"{stats['kept']}/{stats['candidates']} variants kept "
+          f"({stats['equivalent']} equivalent, {stats['flaky']} flaky, {stats['timeout']} timed out) "
+          f"in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,88 @@
+import gzip
+import json
 from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
 
-def record_attempt(progress: dict, module_index: int, score: int) -> None:
-    progress.setdefault("history", []).append({
+from ..core.config import get_config
+
+# Attempts kept raw in progress["history"]; older ones are rolled up into
+# progress["stats"] and moved to the archive in batches of this size, so the
+# list saved on every attempt never grows past twice this. The profile
+# database hands out the same number from load(). Config may override it.
+RECENT_ATTEMPTS = 20
+
+def recent_attempts() -> int:
+    return int(get_config().get("progress.recent_attempts", RECENT_ATTEMPTS))
+
+def record_attempt(progress: dict, module_index: int, score: int, passed: Optional[bool] = None,
+                   archive: Optional[Path] = None) -> None:
+    # passed defaults to the configured passing score; archive=None drops
+    # rolled-out attempts (e.g. when the profile database already keeps them all)
+    _upgrade(progress)
+    if passed is None:
+        passed = score >= get_config().get("grading.passing_score", 90)
+    progress["attempts"] = progress.get("attempts", 0) + 1
+    attempt = {
+        "n": progress["attempts"],
         "module_index": module_index,
         "score": score,
         "ts": datetime.now().isoformat(timespec="seconds")
+    }
+    history = progress.setdefault("history", [])
+    history.append(attempt)
+    _roll_up(progress, attempt, passed)
+
+    keep = recent_attempts()
+    if len(history) > 2 * keep:
+        old = history[:-keep]
+        del history[:-keep]
+        if archive is not None:
+            archive_attempts(archive, old)
+
+def _upgrade(progress: dict) -> None:
+    # progress saved before stats existed: roll up the full history once
+    if "stats" in progress:
+        return
+    progress["stats"] = {}
+    history = progress.get("history", [])
+    passing = get_config().get("grading.passing_score", 90)
+    for n, attempt in enumerate(history, 1):
+        attempt.setdefault("n", n)
+        _roll_up(progress, attempt, attempt["score"] >= passing)
+    progress["attempts"] = max(progress.get("attempts", 0), len(history))
+
+def _roll_up(progress: dict, attempt: dict, passed: bool) -> None:
+    s = progress["stats"].setdefault(str(attempt["module_index"]), {
+        "count": 0, "total": 0, "best": 0, "mean": 0.0, "last": 0,
+        "first_ts": attempt["ts"], "time_to_pass": None,
     })
+    # stats saved before "total" existed: best estimate from the rounded mean
+    s.setdefault("total", round(s["mean"] * s["count"]))
+    s["count"] += 1
+    s["total"] += attempt["score"]
+    s["best"] = max(s["best"], attempt["score"])
+    s["mean"] = round(s["total"] / s["count"], 2)
+    s["last"] = attempt["score"]
+    if passed and s["time_to_pass"] is None:
+        # seconds from the first attempt at this module to its first pass
+        first = datetime.fromisoformat(s["first_ts"])
+        s["time_to_pass"] = max(0, int((datetime.fromisoformat(attempt["ts"]) - first).total_seconds()))
+        s["attempts_to_pass"] = s["count"]
+
+def archive_attempts(path: Path, attempts: list) -> None:
+    # one gzip member per batch; gzip readers see the members as one stream
+    lines = "".join(json.dumps(a, ensure_ascii=False) + "\n" for a in attempts)
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        f.write(lines)
+
+def archived_attempts(path: Path) -> Iterator[dict]:
+    if not Path(path).exists():
+        return
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
 def unlock_after_pass(progress: dict, module_index: int) -> None:
     # unlock more terminal commands as the user passes modules
@@ -18,4 +95,4 @@ def unlock_after_pass(progress: dict, module_index: int) -> None:
         cmds.update(["cd", "run"])
     unlocked["commands"] = sorted(cmds)
 
-    progress["module_index"] = module_index + 1
\ No newline at end of file
+    progress["module_index"] = module_index + 1
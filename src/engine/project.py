@@ -0,0 +1,187 @@
+"""Multi-file project execution with incremental file sync."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Tuple, Union
+
+from .runner import RunResult, run_process
+from .scratch import get_scratch_pool
+
+logger = logging.getLogger(__name__)
+
+FileContent = Union[str, bytes]
+
+# Never treated as stale: bytecode caches are what make re-runs fast.
+KEEP_DIRS = {"__pycache__"}
+
+
+@dataclass
+class SyncStats:
+    """What a sync() call had to do."""
+    written: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    def __str__(self) -> str:
+        return f"SyncStats(written={self.written}, deleted={self.deleted}, unchanged={self.unchanged})"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _as_bytes(content: FileContent) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+def _module_name(entry: str) -> str:
+    """'pkg/app.py' -> 'pkg.app'"""
+    path = PurePosixPath(entry.replace("\\", "/"))
+    parts = list(path.with_suffix("").parts) if path.suffix == ".py" else list(path.parts)
+    name = ".".join(parts)
+    if not parts or not all(re.fullmatch(r"[A-Za-z_]\w*", p) for p in parts):
+        raise ValueError(f"Invalid entry module: {entry}")
+    return name
+
+
+class ProjectWorkspace:
+    """
+    A persistent directory holding one multi-file project.
+
+    sync() only rewrites files whose content hash changed (and removes files
+    that are no longer part of the project), so re-running after a one-file
+    edit touches one file and keeps every other module's bytecode cache warm.
+    """
+
+    def __init__(self, name: str, root: Optional[Path] = None):
+        if not re.fullmatch(r"[\w.-]+", name):
+            raise ValueError(f"Invalid project name: {name}")
+        base = Path(root) if root else get_scratch_pool().root / "projects"
+        self.path = base / name
+        self.path.mkdir(parents=True, exist_ok=True)
+        # rel path -> (sha256, mtime_ns, size) as last written by us
+        self._manifest: Dict[str, Tuple[str, int, int]] = {}
+
+    def _target(self, rel: str) -> Path:
+        rel_path = PurePosixPath(rel.replace("\\", "/"))
+        if rel_path.is_absolute() or ".." in rel_path.parts or not rel_path.parts:
+            raise ValueError(f"Invalid project file path: {rel}")
+        return self.path.joinpath(*rel_path.parts)
+
+    def _unchanged(self, rel: str, target: Path, digest: str) -> bool:
+        known = self._manifest.get(rel)
+        if not known or known[0] != digest:
+            return False
+        try:
+            st = target.stat()
+        except OSError:
+            return False
+        # A previous run may have modified the file; stat tells us cheaply.
+        return (st.st_mtime_ns, st.st_size) == known[1:]
+
+    def _write(self, rel: str, target: Path, data: bytes, digest: str) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        previous = self._manifest.get(rel)
+        target.write_bytes(data)
+        # Bytecode caches are validated by (mtime seconds, size): make sure a
+        # same-size edit within the same second still gets a newer mtime.
+        now = time.time_ns()
+        if previous:
+            now = max(now, previous[1] + 1_000_000_000)
+        os.utime(target, ns=(now, now))
+        st = target.stat()
+        self._manifest[rel] = (digest, st.st_mtime_ns, st.st_size)
+
+    def sync(self, files: Dict[str, FileContent]) -> SyncStats:
+        """
+        Make the workspace contain exactly the given files.
+
+        Args:
+            files: Mapping of relative POSIX paths to text or bytes
+
+        Returns:
+            SyncStats describing the work done
+
+        Raises:
+            ValueError: If a path is absolute or escapes the workspace
+        """
+        stats = SyncStats()
+        wanted = set()
+        for rel, content in files.items():
+            target = self._target(rel)
+            key = target.relative_to(self.path).as_posix()
+            wanted.add(key)
+            data = _as_bytes(content)
+            digest = _digest(data)
+            if self._unchanged(key, target, digest):
+                stats.unchanged += 1
+                continue
+            self._write(key, target, data, digest)
+            stats.written += 1
+
+        for dirpath, dirnames, filenames in os.walk(self.path, topdown=True):
+            dirnames[:] = [d for d in dirnames if d not in KEEP_DIRS]
+            for fname in filenames:
+                full = Path(dirpath) / fname
+                key = full.relative_to(self.path).as_posix()
+                if key not in wanted:
+                    full.unlink()
+                    self._manifest.pop(key, None)
+                    stats.deleted += 1
+
+        logger.info(f"Synced project {self.path.name}: {stats}")
+        return stats
+
+    def run(self, entry: str, timeout_sec: float = 2.0) -> RunResult:
+        """
+        Run the project's entry module (e.g. "main.py" or "game/app.py").
+
+        The module is run with "python -m" from the workspace root so the
+        project's modules can import each other.
+        """
+        try:
+            module = _module_name(entry)
+        except ValueError as e:
+            return RunResult(ok=False, stdout="", stderr=f"Error: {e}", exit_code=1)
+        return run_process([sys.executable, "-m", module], timeout_sec=timeout_sec, cwd=str(self.path))
+
+    def clear(self) -> None:
+        """Delete the workspace and forget its manifest."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._manifest.clear()
+
+
+_workspaces: Dict[str, ProjectWorkspace] = {}
+
+
+def run_project(name: str, files: Dict[str, FileContent], entry: str = "main.py", timeout_sec: float = 2.0) -> RunResult:
+    """
+    Sync a project's files into its persistent workspace and run it.
+
+    Args:
+        name: Project identifier (one workspace per name)
+        files: Mapping of relative paths to file contents
+        entry: Entry module path (default: main.py)
+        timeout_sec: Timeout in seconds (default: 2.0)
+
+    Returns:
+        RunResult with execution status and output
+    """
+    ws = _workspaces.get(name)
+    if ws is None:
+        ws = _workspaces[name] = ProjectWorkspace(name)
+    try:
+        ws.sync(files)
+    except (ValueError, OSError) as e:
+        logger.error(f"Could not sync project {name}: {e}")
+        return RunResult(ok=False, stdout="", stderr=f"Error: {e}", exit_code=1)
+    return ws.run(entry, timeout_sec=timeout_sec)
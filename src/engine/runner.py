@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import subprocess
 import sys
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from .scratch import get_scratch_pool
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,8 @@ class RunResult:
         return f"RunResult(ok={self.ok}, exit_code={self.exit_code}, stdout_len={len(self.stdout)}, stderr_len={len(self.stderr)})"
 
 
-def run_python(code: str, timeout_sec: float = 2.0) -> RunResult:
+def run_python(code: str, timeout_sec: float = 2.0, cwd: Optional[str] = None,
+               stdin_path: Optional[str] = None) -> RunResult:
     """
     Run user code in a temporary file using the current interpreter.
     Captures stdout/stderr. Hard timeout to avoid infinite loops.
@@ -34,10 +38,17 @@ def run_python(code: str, timeout_sec: float = 2.0) -> RunResult:
     Args:
         code: Python code to execute
         timeout_sec: Timeout in seconds (default: 2.0)
+        cwd: Working directory for the run (default: a fresh scratch
+             directory leased from the pool for the duration of the run)
+        stdin_path: File to connect to the program's stdin (default: none)
         
     Returns:
         RunResult with execution status and output
     """
+    if cwd is None:
+        with get_scratch_pool().lease() as scratch:
+            return run_python(code, timeout_sec=timeout_sec, cwd=str(scratch), stdin_path=stdin_path)
+
     if not code or not isinstance(code, str):
         logger.error(f"Invalid code: {type(code)}")
         return RunResult(
@@ -58,13 +69,50 @@ def run_python(code: str, timeout_sec: float = 2.0) -> RunResult:
             f.write(code)
             temp_path = f.name
         
-        logger.debug(f"Running code with timeout {timeout_sec}s")
-        p = subprocess.run(
-            [sys.executable, temp_path],
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
+        return run_process([sys.executable, temp_path], timeout_sec=timeout_sec, cwd=cwd, stdin_path=stdin_path)
+    except Exception as e:
+        logger.error(f"Error executing code: {e}")
+        return RunResult(
+            ok=False,
+            stdout="",
+            stderr=f"Error: {str(e)}",
+            exit_code=1,
         )
+    finally:
+        # Clean up temporary file
+        if temp_path:
+            try:
+                Path(temp_path).unlink()
+            except Exception as e:
+                logger.warning(f"Could not delete temp file {temp_path}: {e}")
+
+
+def run_process(argv: List[str], timeout_sec: float = 2.0, cwd: Optional[str] = None,
+                stdin_path: Optional[str] = None) -> RunResult:
+    """
+    Run a Python command line with the same limits and capture as run_python.
+    
+    Args:
+        argv: Command line (normally starting with sys.executable)
+        timeout_sec: Timeout in seconds (default: 2.0)
+        cwd: Working directory for the run
+        stdin_path: File to connect to stdin (default: none)
+        
+    Returns:
+        RunResult with execution status and output
+    """
+    try:
+        logger.debug(f"Running code with timeout {timeout_sec}s")
+        # The child reads a stdin file directly; nothing is piped through this process.
+        with (open(stdin_path, "rb") if stdin_path else contextlib.nullcontext(subprocess.DEVNULL)) as stdin:
+            p = subprocess.run(
+                argv,
+                capture_output=True,
+                stdin=stdin,
+                text=True,
+                timeout=timeout_sec,
+                cwd=cwd,
+            )
         
         result = RunResult(
             ok=(p.returncode == 0),
@@ -77,9 +125,12 @@ def run_python(code: str, timeout_sec: float = 2.0) -> RunResult:
         
     except subprocess.TimeoutExpired as e:
         logger.warning(f"Code execution timed out after {timeout_sec}s")
+        stdout = e.stdout or ""
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", errors="replace")
         return RunResult(
             ok=False,
-            stdout=(e.stdout or ""),
+            stdout=stdout,
             stderr="Timeout: your code took too long (possible infinite loop).\n",
             exit_code=124,
         )
@@ -91,10 +142,3 @@ def run_python(code: str, timeout_sec: float = 2.0) -> RunResult:
             stderr=f"Error: {str(e)}",
             exit_code=1,
         )
-    finally:
-        # Clean up temporary file
-        if temp_path:
-            try:
-                Path(temp_path).unlink()
-            except Exception as e:
-                logger.warning(f"Could not delete temp file {temp_path}: {e}")
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Pool of reusable scratch working directories for student code runs."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TMPFS_CANDIDATES = ("/dev/shm",)
+
+
+def default_scratch_root() -> str:
+    """Prefer a tmpfs mount (RAM-backed) when one is available and writable."""
+    for cand in TMPFS_CANDIDATES:
+        if os.path.isdir(cand) and os.access(cand, os.W_OK):
+            return cand
+    return tempfile.gettempdir()
+
+
+class ScratchPool:
+    """
+    Hands out isolated, empty working directories and recycles them.
+
+    Released directories are emptied and kept for the next run instead of being
+    deleted and recreated; at most max_idle directories are kept around.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_idle: int = 4):
+        self.root = Path(tempfile.mkdtemp(prefix="codequest-scratch-", dir=root or default_scratch_root()))
+        self.max_idle = max_idle
+        self._idle: List[Path] = []
+        self._lock = threading.Lock()
+        self._count = 0
+        logger.info(f"Scratch pool created at {self.root}")
+
+    def acquire(self) -> Path:
+        """Take an empty directory from the pool (creating one if none is idle)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self._count += 1
+            path = self.root / f"run{self._count}"
+        path.mkdir()
+        return path
+
+    def release(self, path: Path) -> None:
+        """Empty a directory and return it to the pool."""
+        try:
+            for child in path.iterdir():
+                if child.is_dir() and not child.is_symlink():
+                    shutil.rmtree(child, ignore_errors=True)
+                else:
+                    child.unlink()
+        except OSError as e:
+            logger.warning(f"Could not recycle scratch dir {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+
+    @contextmanager
+    def lease(self) -> Iterator[Path]:
+        """Context manager wrapping acquire()/release()."""
+        path = self.acquire()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def cleanup(self) -> None:
+        """Remove the pool root and everything in it."""
+        with self._lock:
+            self._idle.clear()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+_pool: Optional[ScratchPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_scratch_pool() -> ScratchPool:
+    """Get the process-wide scratch pool (removed at interpreter exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ScratchPool()
+            atexit.register(_pool.cleanup)
+        return _pool
@@ -0,0 +1,272 @@
+"""Full-text search over lessons, quizzes, error packs, problems and debugs.
+
+An inverted index with BM25 ranking and prefix matching. Documents are
+extracted per source file and the index is persisted with each source's
+(mtime_ns, size), so update() only re-reads files that changed.
+
+Usage:
+    python -m src.engine.search "unterminated string"
+"""
+
+import argparse
+import bisect
+import html
+import json
+import logging
+import math
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .content_loader import DATA
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_PATH = DATA / "search_index.json"
+EXCLUDE = {"progress.json", "settings.json", INDEX_PATH.name}
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+TAG_RE = re.compile(r"<[^>]+>")
+K1 = 1.2
+B = 0.75
+PREFIX_WEIGHT = 0.6     # prefix expansions count less than exact terms
+MAX_EXPANSIONS = 30
+SNIPPET_CHARS = 140
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def _plain(text: Any) -> str:
+    """Flatten strings, lists and dicts of content to plain text."""
+    if isinstance(text, str):
+        return html.unescape(TAG_RE.sub(" ", text))
+    if isinstance(text, dict):
+        return " ".join(_plain(v) for v in text.values())
+    if isinstance(text, list):
+        return " ".join(_plain(v) for v in text)
+    return ""
+
+
+@dataclass
+class SearchHit:
+    """One ranked result."""
+    doc_id: str
+    kind: str           # lesson, quiz, error, challenge, module, problem, debug
+    title: str
+    snippet: str
+    score: float
+    module: Optional[str] = None
+
+
+def _doc(doc_id: str, kind: str, title: str, text: str, module: Optional[str] = None) -> Dict[str, Any]:
+    body = " ".join(text.split())
+    tf = Counter(tokenize(f"{title} {body}"))
+    return {"id": doc_id, "kind": kind, "title": title, "module": module,
+            "snippet": body[:SNIPPET_CHARS], "tf": dict(tf), "len": sum(tf.values())}
+
+
+def _stage_docs(mod_id: str, title: str, stage: str, unit: Dict[str, Any]) -> List[Dict[str, Any]]:
+    docs = []
+    if stage == "lesson" and ("lesson_html" in unit or "lesson_text" in unit):
+        text = _plain([unit.get("lesson_html", ""), unit.get("lesson_text", ""),
+                       unit.get("sections", []), unit.get("examples", []), unit.get("starter_task", "")])
+        docs.append(_doc(f"lesson:{mod_id}", "lesson", title, text, mod_id))
+    elif stage == "quiz" and unit.get("quiz"):
+        docs.append(_doc(f"quiz:{mod_id}", "quiz", f"{title} quiz" if title else "", _plain(unit["quiz"]), mod_id))
+    elif stage == "debug":
+        for n, err in enumerate(unit.get("error_pack", [])):
+            err_title = (err.get("title") or err.get("error") or f"Error {n + 1}") if isinstance(err, dict) else f"Error {n + 1}"
+            docs.append(_doc(f"error:{mod_id}:{n}", "error", err_title, _plain(err), mod_id))
+    elif stage == "challenge" and unit.get("coding_challenge"):
+        ch = unit["coding_challenge"]
+        docs.append(_doc(f"challenge:{mod_id}", "challenge", ch.get("title", ""),
+                         _plain(ch.get("description_html", "")), mod_id))
+    return docs
+
+
+STAGE_FIELDS = {"lesson": ("lesson_html", "lesson_text", "sections", "examples", "starter_task"),
+                "quiz": ("quiz",), "debug": ("error_pack",), "challenge": ("coding_challenge",)}
+
+
+def extract(rel: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Searchable documents in one content file (rel is relative to src/data)."""
+    parts = rel.split("/")
+    stem = Path(rel).stem
+    if rel == "course.json":
+        docs = []
+        for mod in data.get("modules", []):
+            mod_id, title = str(mod.get("id", "")), mod.get("title", "")
+            docs.append(_doc(f"module:{mod_id}", "module", title,
+                             _plain([mod.get("objective", ""), mod.get("hack_prompt", "")]), mod_id))
+            for stage, keys in STAGE_FIELDS.items():  # unsplit courses keep stages inline
+                docs.extend(_stage_docs(mod_id, title, stage, {k: mod[k] for k in keys if k in mod}))
+        return docs
+    if parts[0] == "lessons" and len(parts) == 3:
+        return _stage_docs(parts[1], "", stem, data)  # titled from course.json at query time
+    if parts[0] == "problems":
+        return [_doc(f"problem:{stem}", "problem", data.get("title", stem), _plain(data.get("description_md", "")))]
+    if parts[0] == "quizzes":
+        return [_doc(f"quizfile:{stem}", "quiz", data.get("title", stem), _plain(data.get("questions", [])))]
+    if parts[0] == "debugs":
+        return [_doc(f"debug:{stem}", "debug", data.get("title", stem),
+                     _plain([data.get("description_md", ""), data.get("broken_code", "")]))]
+    return []
+
+
+class SearchIndex:
+    """Inverted index over the content directory; see module docstring."""
+
+    def __init__(self, data_dir: Path = DATA, path: Optional[Path] = None):
+        self.data_dir = Path(data_dir)
+        self.path = Path(path) if path else self.data_dir / INDEX_PATH.name
+        # rel path -> {"sig": [mtime_ns, size], "docs": [...]}
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+        self._build_postings()
+
+    def _load(self) -> None:
+        try:
+            saved = json.loads(self.path.read_text(encoding="utf-8"))
+            if saved.get("version") == INDEX_VERSION:
+                self._sources = saved["sources"]
+        except (OSError, ValueError, KeyError):
+            self._sources = {}
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "sources": self._sources},
+                                  separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def update(self) -> int:
+        """Re-index changed, new and deleted source files. Returns files re-read."""
+        seen = set()
+        changed = 0
+        for src in sorted(self.data_dir.rglob("*.json")):
+            if src.name in EXCLUDE:
+                continue
+            rel = src.relative_to(self.data_dir).as_posix()
+            seen.add(rel)
+            st = src.stat()
+            sig = [st.st_mtime_ns, st.st_size]
+            known = self._sources.get(rel)
+            if known and known["sig"] == sig:
+                continue
+            try:
+                docs = extract(rel, json.loads(src.read_text(encoding="utf-8-sig")))
+            except (ValueError, AttributeError) as e:
+                logger.warning(f"Skipping unindexable content file {rel}: {e}")
+                docs = []
+            self._sources[rel] = {"sig": sig, "docs": docs}
+            changed += 1
+        for rel in set(self._sources) - seen:
+            del self._sources[rel]
+            changed += 1
+        if changed:
+            self._dirty = True
+            self._build_postings()
+            logger.info(f"Search index updated: {changed} files re-indexed, {len(self._docs)} documents")
+        return changed
+
+    def _build_postings(self) -> None:
+        self._docs: List[Dict[str, Any]] = [d for rel in sorted(self._sources) for d in self._sources[rel]["docs"]]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        for i, d in enumerate(self._docs):
+            for term, tf in d["tf"].items():
+                self._postings.setdefault(term, []).append((i, tf))
+        self._vocab = sorted(self._postings)
+        modules = {d["module"]: d["title"] for d in self._docs if d["kind"] == "module"}
+        self._titles = [d["title"] or f"{modules.get(d['module'], d['module'])} ({d['kind']})" for d in self._docs]
+        n = len(self._docs)
+        self._avgdl = (sum(d["len"] for d in self._docs) / n) if n else 0.0
+        self._idf = {t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for t, p in self._postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _expand(self, token: str) -> Iterable[Tuple[str, float]]:
+        if token in self._postings:
+            yield token, 1.0
+        start = bisect.bisect_left(self._vocab, token)
+        taken = 0
+        for j in range(start, len(self._vocab)):
+            term = self._vocab[j]
+            if not term.startswith(token) or taken >= MAX_EXPANSIONS:
+                break
+            if term != token:
+                taken += 1
+                yield term, PREFIX_WEIGHT
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Ranked hits; every query word may match as a prefix (e.g. "untermin")."""
+        scores: Dict[int, float] = {}
+        for token in dict.fromkeys(tokenize(query)):
+            best: Dict[int, float] = {}
+            for term, weight in self._expand(token):
+                idf = self._idf[term]
+                for i, tf in self._postings[term]:
+                    norm = K1 * (1 - B + B * self._docs[i]["len"] / (self._avgdl or 1))
+                    s = weight * idf * tf * (K1 + 1) / (tf + norm)
+                    if s > best.get(i, 0.0):
+                        best[i] = s
+            for i, s in best.items():
+                scores[i] = scores.get(i, 0.0) + s
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        return [SearchHit(doc_id=self._docs[i]["id"], kind=self._docs[i]["kind"], title=self._titles[i],
+                          snippet=self._docs[i]["snippet"], score=round(s, 4), module=self._docs[i]["module"])
+                for i, s in ranked]
+
+
+_index: Optional[SearchIndex] = None
+
+
+def get_search_index(refresh: bool = False) -> SearchIndex:
+    """
+    Process-wide index over src/data, persisted after any change.
+
+    Sources are re-checked on first use and when refresh is True, not on
+    every query, so typing in a search box never touches the disk.
+    """
+    global _index
+    if _index is not None and not refresh:
+        return _index
+    if _index is None:
+        _index = SearchIndex()
+    if _index.update():
+        try:
+            _index.save()
+        except OSError as e:
+            logger.warning(f"Could not persist search index: {e}")
+    return _index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Search course content.")
+    parser.add_argument("query")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    index = get_search_index()
+    start = time.perf_counter()
+    hits = index.search(args.query, limit=args.limit)
+    ms = (time.perf_counter() - start) * 1000
+    for h in hits:
+        print(f"{h.score:7.3f}  {h.kind:<9} {h.title}  [{h.doc_id}]")
+    print(f"{len(hits)} hits from {len(index)} documents in {ms:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
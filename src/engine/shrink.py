@@ -0,0 +1,118 @@
+"""Delta-debugging shrinker for failing function-test inputs."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetExhausted(Exception):
+    """Raised internally when the shrinking time budget runs out."""
+
+
+@dataclass
+class ShrinkResult:
+    """Outcome of a shrinking run."""
+    args: List[Any]
+    probes: int
+    elapsed: float
+    exhausted: bool
+
+    def __str__(self) -> str:
+        return f"ShrinkResult(probes={self.probes}, elapsed={self.elapsed:.3f}s, exhausted={self.exhausted})"
+
+
+def _rebuild(template: Any, items: Sequence[Any]) -> Any:
+    return "".join(items) if isinstance(template, str) else list(items)
+
+
+def ddmin(items: Sequence[Any], fails: Callable[[Sequence[Any]], bool]) -> List[Any]:
+    """
+    Zeller's ddmin: reduce items to a 1-minimal subsequence that still fails.
+
+    Args:
+        items: Failing input, as a sequence of elements
+        fails: Predicate returning True when a candidate still reproduces the failure
+
+    Returns:
+        The smallest failing subsequence found
+    """
+    items = list(items)
+    n = 2
+    while len(items) >= 2:
+        size = len(items)
+        chunk = max(1, size // n)
+        parts = [items[i:i + chunk] for i in range(0, size, chunk)]
+
+        reduced = False
+        for i, part in enumerate(parts):
+            if fails(part):
+                items, n, reduced = part, 2, True
+                break
+            complement = [x for j, p in enumerate(parts) if j != i for x in p]
+            if len(parts) > 2 and fails(complement):
+                items, n, reduced = complement, max(n - 1, 2), True
+                break
+
+        if not reduced:
+            if n >= size:
+                break
+            n = min(size, n * 2)
+
+    if len(items) == 1 and fails([]):
+        return []
+    return items
+
+
+def shrink_args(args: Sequence[Any], fails: Callable[[List[Any]], bool], budget_sec: float = 2.0) -> ShrinkResult:
+    """
+    Shrink every list- or string-valued positional argument of a failing call.
+
+    Arguments are reduced one at a time with the others held fixed. When the
+    time budget runs out the best reproducer found so far is returned.
+
+    Args:
+        args: Positional arguments of the failing call
+        fails: Predicate taking a full argument list; True if it still fails
+        budget_sec: Wall-clock budget for the whole run
+
+    Returns:
+        ShrinkResult with the smallest failing arguments found
+    """
+    start = time.monotonic()
+    deadline = start + budget_sec
+    current = list(args)
+    probes = 0
+    exhausted = False
+
+    def check(candidate: List[Any]) -> bool:
+        nonlocal probes
+        if time.monotonic() > deadline:
+            raise BudgetExhausted()
+        probes += 1
+        return fails(candidate)
+
+    try:
+        for idx, value in enumerate(args):
+            if not isinstance(value, (list, str)) or len(value) < 2:
+                continue
+
+            def fails_at(items: Sequence[Any], idx=idx, template=value) -> bool:
+                candidate = list(current)
+                candidate[idx] = _rebuild(template, items)
+                if check(candidate):
+                    current[idx] = candidate[idx]
+                    return True
+                return False
+
+            ddmin(list(value), fails_at)
+    except BudgetExhausted:
+        exhausted = True
+
+    result = ShrinkResult(args=current, probes=probes, elapsed=time.monotonic() - start, exhausted=exhausted)
+    logger.info(f"Shrinking finished: {result}")
+    return result
@@ -0,0 +1,263 @@
+"""Validate course content by running it.
+
+Usage:
+    python -m src.engine.validate [--jobs N] [--no-cache]
+
+Beyond the schema checks used by the content bundle, this executes:
+  - every reference_solution (problems, debugs, coding challenges), which
+    must pass its own tests
+  - every debug mission's broken_code, which must fail them
+  - every error_pack snippet, which must raise the error it claims
+  - every lesson example, which must run cleanly (and print expected_output
+    when one is given)
+
+Checks run in parallel. Passing verdicts are cached by a hash of exactly
+what was checked, so after a one-file edit only that file's checks rerun.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.bundle import BundleError, DATA_DIR, content_files, validate_document
+from ..core.grader import grade_problem
+from .autograder import grade_code
+from .runner import run_python
+
+logger = logging.getLogger(__name__)
+
+CHECKER_VERSION = 1
+CACHE_PATH = DATA_DIR.parent.parent / ".cache" / "validation.json"
+
+# "SyntaxError: ...", "IndentationError", "SyntaxError (assignment in condition)"
+EXC_NAME_RE = re.compile(r"([A-Za-z_]\w*(?:Error|Exception|Warning|Exit|Interrupt))\b")
+TIMEOUT_EXIT_CODE = 124     # engine.runner's exit code for a timed-out run
+LOOP_TIMEOUT_SEC = 1.0
+
+
+@dataclass
+class Check:
+    """One executable check derived from a content file."""
+    where: str          # e.g. "lessons/m1/debug.json#error_pack[2]"
+    kind: str
+    payload: Dict[str, Any]
+
+    def digest(self) -> str:
+        blob = json.dumps([CHECKER_VERSION, sys.version_info[:2], self.kind, self.payload],
+                          sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Verdict:
+    where: str
+    ok: bool
+    message: str = ""
+    cached: bool = False
+
+
+def _last_line(text: str) -> str:
+    lines = [ln for ln in text.strip().splitlines() if ln.strip()]
+    return lines[-1].strip() if lines else ""
+
+
+def check_solution(p: Dict[str, Any]) -> Tuple[bool, str]:
+    ok, msg = grade_problem(p["code"], p["spec"])
+    return ok, "" if ok else f"reference solution fails: {msg}"
+
+
+def check_broken(p: Dict[str, Any]) -> Tuple[bool, str]:
+    ok, _ = grade_problem(p["code"], p["spec"])
+    return (False, "broken_code already passes the tests") if ok else (True, "")
+
+
+def check_challenge(p: Dict[str, Any]) -> Tuple[bool, str]:
+    r = grade_code(p["challenge"], p["code"])
+    return r.passed, "" if r.passed else f"reference solution fails: {r.feedback}"
+
+
+def check_error(p: Dict[str, Any]) -> Tuple[bool, str]:
+    claimed = p["error"].strip()
+    if "infinite loop" in claimed.lower():
+        r = run_python(p["code"], timeout_sec=LOOP_TIMEOUT_SEC)
+        return (True, "") if r.exit_code == TIMEOUT_EXIT_CODE else (False, "snippet terminates, expected an infinite loop")
+
+    m = EXC_NAME_RE.match(claimed)
+    if not m:
+        return True, f"not an exception, not checked: {claimed}"
+    r = run_python(p["code"])
+    if r.ok:
+        return False, f"snippet runs without error, expected {claimed}"
+    actual = _last_line(r.stderr)
+    if not actual.startswith(m.group(1)):
+        return False, f"raises {actual or 'nothing'}, expected {claimed}"
+    if ":" in claimed and claimed not in r.stderr:
+        # Same exception type, different wording (messages vary between Python versions).
+        return True, f"message differs: {actual}"
+    return True, ""
+
+
+def check_example(p: Dict[str, Any]) -> Tuple[bool, str]:
+    r = run_python(p["code"])
+    if not r.ok:
+        return False, f"example fails: {_last_line(r.stderr) or f'exit code {r.exit_code}'}"
+    expected = p.get("expected_output")
+    if expected is not None and r.stdout.replace("\r\n", "\n") != expected:
+        return False, f"example printed {r.stdout!r}, expected {expected!r}"
+    return True, ""
+
+
+CHECKERS: Dict[str, Callable[[Dict[str, Any]], Tuple[bool, str]]] = {
+    "solution": check_solution,
+    "broken": check_broken,
+    "challenge": check_challenge,
+    "error": check_error,
+    "example": check_example,
+}
+
+
+def collect(rel: str, doc: Dict[str, Any]) -> List[Check]:
+    """Executable checks in one (schema-valid) content document."""
+    checks: List[Check] = []
+    top = rel.split("/", 1)[0]
+
+    if top == "problems" and doc.get("reference_solution"):
+        checks.append(Check(f"{rel}#reference_solution", "solution",
+                            {"code": doc["reference_solution"], "spec": doc}))
+    if top == "debugs":
+        spec = {"function": doc.get("required_function"), "tests": doc.get("tests", [])}
+        if doc.get("reference_solution"):
+            checks.append(Check(f"{rel}#reference_solution", "solution", {"code": doc["reference_solution"], "spec": spec}))
+        if doc.get("broken_code"):
+            checks.append(Check(f"{rel}#broken_code", "broken", {"code": doc["broken_code"], "spec": spec}))
+
+    # Stage content lives in lessons/<id>/<stage>.json, or inline in an unsplit course.json.
+    units: List[Tuple[str, Dict[str, Any]]] = []
+    if top == "lessons":
+        units.append((rel, doc))
+    elif rel == "course.json":
+        units.extend((f"{rel}#{m.get('id')}", m) for m in doc.get("modules", []))
+    for where, unit in units:
+        for i, err in enumerate(unit.get("error_pack", [])):
+            checks.append(Check(f"{where}#error_pack[{i}]", "error", {"code": err["code"], "error": err["error"]}))
+        for i, ex in enumerate(unit.get("examples", [])):
+            payload = {"code": ex["code"]}
+            if "expected_output" in ex:
+                payload["expected_output"] = ex["expected_output"]
+            checks.append(Check(f"{where}#examples[{i}]", "example", payload))
+        ch = unit.get("coding_challenge")
+        if ch and ch.get("reference_solution"):
+            challenge = {k: v for k, v in ch.items() if k != "reference_solution"}
+            checks.append(Check(f"{where}#coding_challenge", "challenge",
+                                {"code": ch["reference_solution"], "challenge": challenge}))
+    return checks
+
+
+def _load_cache(path: Path) -> Dict[str, str]:
+    try:
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        return saved["passed"] if saved.get("version") == CHECKER_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _save_cache(path: Path, passed: Dict[str, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"version": CHECKER_VERSION, "passed": passed}), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _run(check: Check) -> Verdict:
+    try:
+        ok, msg = CHECKERS[check.kind](check.payload)
+    except Exception as e:  # a checker crash is a content problem to report, not a reason to stop
+        ok, msg = False, f"checker error: {e}"
+    return Verdict(check.where, ok, msg)
+
+
+def validate_content(data_dir: Path = DATA_DIR, jobs: Optional[int] = None,
+                     cache_path: Optional[Path] = CACHE_PATH) -> List[Verdict]:
+    """
+    Schema-check and execute all content under data_dir.
+
+    Args:
+        data_dir: Content directory
+        jobs: Parallel checks (default: CPU count)
+        cache_path: Where passing verdicts are cached (None disables caching)
+
+    Returns:
+        One Verdict per schema failure and per executable check
+    """
+    verdicts: List[Verdict] = []
+    checks: List[Check] = []
+    for src in content_files(data_dir):
+        rel = src.relative_to(data_dir).as_posix()
+        try:
+            doc = json.loads(src.read_text(encoding="utf-8-sig"))
+            validate_document(rel, doc)
+        except (ValueError, BundleError) as e:
+            verdicts.append(Verdict(rel, False, f"schema: {e}"))
+            continue
+        checks.extend(collect(rel, doc))
+
+    passed = _load_cache(cache_path) if cache_path else {}
+    todo: List[Tuple[Check, str]] = []
+    for check in checks:
+        digest = check.digest()
+        if digest in passed:
+            verdicts.append(Verdict(check.where, True, passed[digest], cached=True))
+        else:
+            todo.append((check, digest))
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 4) as pool:
+        fresh = list(pool.map(_run, [c for c, _ in todo]))
+    verdicts.extend(fresh)
+
+    if cache_path:
+        still_there = {c.digest() for c in checks}
+        kept = {d: m for d, m in passed.items() if d in still_there}
+        kept.update({digest: v.message for (_, digest), v in zip(todo, fresh) if v.ok})
+        if kept != passed:
+            _save_cache(cache_path, kept)
+
+    logger.info(f"Validated {len(checks)} checks ({len(todo)} run, {len(checks) - len(todo)} cached)")
+    return sorted(verdicts, key=lambda v: v.where)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate course content by executing it.")
+    parser.add_argument("--data", default=str(DATA_DIR), help="Content directory (default: src/data)")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel checks (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    verdicts = validate_content(Path(args.data), jobs=args.jobs, cache_path=None if args.no_cache else CACHE_PATH)
+    elapsed = time.perf_counter() - start
+
+    failed = [v for v in verdicts if not v.ok]
+    for v in verdicts:
+        if not v.ok:
+            print(f"FAIL  {v.where}: {v.message}")
+        elif v.message:
+            print(f"warn  {v.where}: {v.message}")
+    cached = sum(v.cached for v in verdicts)
+    print(f"{len(verdicts) - len(failed)}/{len(verdicts)} checks passed "
+          f"({cached} cached) in {elapsed * 1000:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
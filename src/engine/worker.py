@@ -0,0 +1,173 @@
+"""Persistent worker sessions for running student functions out of process."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).resolve().with_name("worker_main.py")
+
+
+class WorkerError(RuntimeError):
+    """Raised when the worker process dies or answers with a protocol error."""
+
+
+class WorkerTimeout(WorkerError):
+    """Raised when a single request exceeds its time limit."""
+
+
+class WorkerSession:
+    """
+    A long-lived Python subprocess that keeps student code loaded between calls.
+
+    Code is exec'd once per namespace ("student", "reference") and functions are
+    then invoked by name. If a request times out the process is killed and the
+    next request transparently restarts it and replays the loaded code.
+    """
+
+    def __init__(self, timeout_sec: float = 2.0, cwd: Optional[str] = None):
+        self.timeout_sec = timeout_sec
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr: deque = deque(maxlen=200)
+        self._replay: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "WorkerSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def stderr(self) -> str:
+        return "".join(self._stderr)
+
+    def _spawn(self) -> None:
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            [sys.executable, "-u", str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            cwd=self.cwd,
+        )
+        threading.Thread(target=self._pump, args=(self._proc.stdout, self._lines), daemon=True).start()
+        threading.Thread(target=self._drain, args=(self._proc.stderr,), daemon=True).start()
+        logger.debug(f"Started worker pid={self._proc.pid}")
+
+        for payload in self._replay:
+            self._send(payload, self.timeout_sec)
+
+    @staticmethod
+    def _pump(stream, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _drain(self, stream) -> None:
+        for line in stream:
+            self._stderr.append(line)
+
+    def _send(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        assert self._proc is not None and self._proc.stdin is not None
+        try:
+            self._proc.stdin.write(json.dumps(payload) + "\n")
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self._kill()
+            raise WorkerError(f"Worker process is gone: {e}")
+
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning(f"Worker request '{payload.get('op')}' timed out after {timeout}s")
+            self._kill()
+            raise WorkerTimeout(f"Timeout after {timeout}s")
+        if line is None:
+            self._kill()
+            raise WorkerError("Worker process exited unexpectedly")
+        return json.loads(line)
+
+    def request(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Args:
+            payload: Protocol request (must contain "op")
+            timeout: Per-request limit in seconds (default: session timeout)
+
+        Returns:
+            Decoded response dictionary
+
+        Raises:
+            WorkerTimeout: If the worker doesn't answer in time
+            WorkerError: If the worker process died
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self._spawn()
+        return self._send(payload, self.timeout_sec if timeout is None else timeout)
+
+    def load(self, code: str, ns: str = "student") -> Dict[str, Any]:
+        """Exec code into a namespace; remembered so restarts can replay it."""
+        payload = {"op": "load", "code": code, "ns": ns}
+        resp = self.request(payload)
+        if resp.get("ok"):
+            self._replay.append(payload)
+        return resp
+
+    def expect(self, fn: str, tests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Preload expected values once per session so they are never re-sent.
+
+        Args:
+            fn: Function name the tests belong to
+            tests: [{"args": [...], "expected": ...}, ...]
+        """
+        payload = {"op": "expect", "fn": fn, "tests": tests}
+        resp = self.request(payload)
+        if resp.get("ok"):
+            self._replay.append(payload)
+        return resp
+
+    def check(self, fn: str, index: int) -> Dict[str, Any]:
+        """Run preloaded test #index; the comparison happens inside the worker."""
+        return self.request({"op": "check", "fn": fn, "index": index})
+
+    def probe(self, fn: str, args: List[Any], ref_fn: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+        """Run fn(*args) in the worker and return only its outcome classification."""
+        payload = {"op": "probe", "fn": fn, "args": list(args), **extra}
+        if ref_fn:
+            payload["ref_fn"] = ref_fn
+        return self.request(payload)
+
+    def _kill(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.kill()
+            self._proc.wait(timeout=1.0)
+        except Exception as e:
+            logger.warning(f"Could not stop worker: {e}")
+        self._proc = None
+
+    def close(self) -> None:
+        """Shut the worker down."""
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1.0)
+            except Exception:
+                pass
+        self._kill()
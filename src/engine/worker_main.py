@@ -0,0 +1,190 @@
+"""Worker process driver for persistent grading sessions.
+
+Runs as a standalone script (stdlib only) and speaks a JSON-lines protocol:
+one request per line on stdin, one response per line on stdout. Student
+output is captured per request so it can never corrupt the protocol stream.
+"""
+
+import contextlib
+import copy
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import reprlib
+import sys
+import traceback
+
+MAX_CAPTURE = 2000
+
+_summary = reprlib.Repr()
+_summary.maxlist = _summary.maxtuple = _summary.maxset = _summary.maxdict = 10
+_summary.maxstring = _summary.maxother = 80
+_summary.maxlevel = 3
+
+
+def summarize(value):
+    """Bounded description of a value: short repr, length and a content digest."""
+    try:
+        canon = json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        canon = repr(value)
+    info = {"summary": _summary.repr(value),
+            "digest": hashlib.sha256(canon.encode("utf-8", "replace")).hexdigest()[:16]}
+    if isinstance(value, (str, list, tuple, dict, set)):
+        info["len"] = len(value)
+    return info
+
+
+def _protocol_streams():
+    """Detach the protocol pipes from fds 0/1 so student code can't touch them."""
+    proto_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+    os.close(devnull)
+    return proto_in, proto_out
+
+
+def read_fixture(spec):
+    """
+    Decode a fixture file for use as a value. spec: {"path", "decode"} where
+    decode is text (default), bytes, lines, json or buffer (a zero-copy
+    read-only view of the memory-mapped file).
+    """
+    path, decode = spec["path"], spec.get("decode", "text")
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+    elif os.path.getsize(path) == 0:
+        data = b""
+    else:
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if decode == "buffer":
+        return memoryview(data)
+    if decode == "bytes":
+        return bytes(data)
+    text = str(data, "utf-8")
+    if decode == "lines":
+        return text.splitlines()
+    if decode == "json":
+        return json.loads(text)
+    return text
+
+
+class Worker:
+    def __init__(self):
+        self.namespaces = {}
+        self.expected = {}
+        self._fixture = (None, None)   # last decoded fixture: (spec key, value)
+
+    def _fixture_value(self, spec):
+        key = (spec["path"], spec.get("decode", "text"))
+        if self._fixture[0] != key:
+            self._fixture = (None, None)   # release the previous mapping first
+            self._fixture = (key, read_fixture(spec))
+        value = self._fixture[1]
+        # Functions may mutate their argument (xs.sort()); every test gets its own copy.
+        return copy.deepcopy(value) if key[1] in ("lines", "json") else value
+
+    def _test_args(self, test):
+        if "args_fixture" in test:
+            value = self._fixture_value(test["args_fixture"])
+            return value if test["args_fixture"].get("decode") == "json" else [value]
+        return test.get("args", [])
+
+    def _test_expected(self, test):
+        if "expected_fixture" in test:
+            return read_fixture(test["expected_fixture"])
+        return test.get("expected")
+
+    def _capture(self, fn, *args):
+        buf = io.StringIO()
+        sys.stdin = io.StringIO("")
+        with contextlib.redirect_stdout(buf):
+            result = fn(*args)
+        return result, buf.getvalue()[:MAX_CAPTURE]
+
+    def op_load(self, req):
+        env = {"__name__": "__student__"}
+        try:
+            _, out = self._capture(exec, req["code"], env)
+        except BaseException as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}", "message": str(e),
+                    "traceback": traceback.format_exc()[-MAX_CAPTURE:]}
+        self.namespaces[req.get("ns", "student")] = env
+        names = sorted(k for k, v in env.items() if callable(v) and not k.startswith("__"))
+        return {"ok": True, "stdout": out, "functions": names}
+
+    def _func(self, ns, name):
+        env = self.namespaces.get(ns)
+        if env is None:
+            raise LookupError(f"namespace not loaded: {ns}")
+        fn = env.get(name)
+        if not callable(fn):
+            raise LookupError(f"missing function: {name}()")
+        return fn
+
+    def op_probe(self, req):
+        """Call the student function and classify the outcome without shipping the value back."""
+        args = req.get("args", [])
+        fn = self._func(req.get("ns", "student"), req["fn"])
+        try:
+            out, _ = self._capture(fn, *args)
+        except Exception as e:
+            return {"ok": True, "kind": "error", "error": type(e).__name__, "message": str(e)[:200]}
+
+        if req.get("ref_fn"):
+            ref = self._func("reference", req["ref_fn"])
+            expected, _ = self._capture(ref, *args)
+        elif "expected" in req:
+            expected = req["expected"]
+        else:
+            return {"ok": True, "kind": "unknown"}
+        return {"ok": True, "kind": "pass" if out == expected else "mismatch"}
+
+    def op_expect(self, req):
+        """Preload a test table once; later checks refer to tests by index."""
+        self.expected[req.get("fn")] = req.get("tests", [])
+        return {"ok": True, "count": len(self.expected[req.get("fn")])}
+
+    def op_check(self, req):
+        """Run one preloaded test and compare in-process; only a verdict goes back."""
+        test = self.expected[req["fn"]][int(req["index"])]
+        fn = self._func(req.get("ns", "student"), req["fn"])
+        args = self._test_args(test)   # fixtures are only opened when their test runs
+        try:
+            out, _ = self._capture(fn, *args)
+        except Exception as e:
+            return {"ok": True, "kind": "error", "error": type(e).__name__, "message": str(e)[:200]}
+        if out == self._test_expected(test):
+            return {"ok": True, "kind": "pass"}
+        return {"ok": True, "kind": "mismatch", **summarize(out)}
+
+    def handle(self, req):
+        op = getattr(self, "op_" + str(req.get("op")), None)
+        if op is None:
+            return {"ok": False, "error": f"unknown op: {req.get('op')}"}
+        try:
+            return op(req)
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def main():
+    proto_in, proto_out = _protocol_streams()
+    worker = Worker()
+    for line in proto_in:
+        if not line.strip():
+            continue
+        resp = worker.handle(json.loads(line))
+        proto_out.write(json.dumps(resp, default=repr) + "\n")
+        proto_out.flush()
+
+
+if __name__ == "__main__":
+    main()
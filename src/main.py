@@ -21,8 +21,8 @@ class MainWindow(QMainWindow):
 
         self.pages = {}
 
+        # ModulesPage and HackathonsPage follow progress changes themselves (progress bus).
         def show_modules(start_at=None):
-            self.pages["modules"].refresh()
             self.nav.go_to(self.pages["modules"])
 
         def show_lesson(module_id: int):
@@ -50,14 +50,12 @@ class MainWindow(QMainWindow):
         def show_problemset(problem_id: str, module_id: int):
             def after_pass():
                 unlock_next_module(module_id)
-                self.pages["modules"].refresh()
                 self.nav.go_to(self.pages["modules"])
             ps = ProblemSetPage(self.nav, problem_id=problem_id, on_pass=after_pass)
             self.stack.addWidget(ps)
             self.nav.go_to(ps)
 
         def show_hackathons():
-            self.pages["hackathons"].refresh()
             self.nav.go_to(self.pages["hackathons"])
 
         routes = {
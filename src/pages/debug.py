@@ -4,6 +4,7 @@ from PySide6.QtCore import Qt
 from src.core.io import load_json
 from src.core.debug import run_debug
 from src.core.progress import mark_completed, set_last_route
+from src.ui.documents import show_document
 from src.widgets.code_editor import CodeEditor
 
 class DebugPage(QWidget):
@@ -29,7 +30,7 @@ class DebugPage(QWidget):
         splitter = QSplitter(Qt.Horizontal)
 
         left = QTextBrowser()
-        left.setMarkdown(self.spec.get("description_md", "Fix the code."))
+        show_document(left, self.spec.get("description_md", "Fix the code."), "markdown")
         splitter.addWidget(left)
 
         right = QWidget()
@@ -1,6 +1,7 @@
 ﻿# -*- coding: utf-8 -*-
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
 from src.core.progress import hackathons_unlocked, set_last_route
+from src.ui.progress_bus import get_progress_bus
 
 class HackathonsPage(QWidget):
     def __init__(self, nav):
@@ -27,6 +28,10 @@ class HackathonsPage(QWidget):
         set_last_route("hackathons")
         self.refresh()
 
+        bus = get_progress_bus()
+        bus.unlocked.connect(lambda _module: self.refresh())
+        bus.reset.connect(self.refresh)
+
     def refresh(self):
         if hackathons_unlocked():
             self.status.setText("✅ Hackathons unlocked! Pick one and begin.")
@@ -1,6 +1,7 @@
 ﻿# -*- coding: utf-8 -*-
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QListWidget, QListWidgetItem
-from src.core.progress import load_progress, set_last_route
+from src.core.progress import get_progress_store, set_last_route
+from src.ui.progress_bus import get_progress_bus
 
 class ModulesPage(QWidget):
     def __init__(self, nav, routes):
@@ -22,22 +23,48 @@ class ModulesPage(QWidget):
 
         self.list = QListWidget()
         root.addWidget(self.list)
+        self._shown = {}    # module -> (unlocked, percent) currently displayed
         self.refresh()
         self.list.itemClicked.connect(self.open_module)
 
+        bus = get_progress_bus()
+        bus.completed.connect(self._on_completed)
+        bus.unlocked.connect(self._on_unlocked)
+        bus.reset.connect(self.refresh)
+
         set_last_route("modules")
 
     def refresh(self):
-        self.list.clear()
-        p = load_progress()
-        unlocked = p.get("unlocked_module", 1)
-
+        unlocked = get_progress_store().read(lambda p: p.get("unlocked_module", 1))
         for i in range(1, 6):
-            it = QListWidgetItem(f"Module {i}")
-            if i > unlocked:
-                it.setText(f"Module {i}  🔒 Locked")
-                it.setFlags(it.flags() & ~it.flags().__class__.ItemIsEnabled)
-            self.list.addItem(it)
+            self._show_row(i, unlocked)
+
+    def _on_unlocked(self, unlocked):
+        for i in range(1, min(unlocked, 5) + 1):
+            self._show_row(i, unlocked)    # unchanged rows return at once
+
+    def _on_completed(self, kind, item_id):
+        store = get_progress_store()
+        mid = store.completion.catalog.module_of(kind, item_id)
+        if mid and mid[1:].isdigit():
+            self._show_row(int(mid[1:]), store.read(lambda p: p.get("unlocked_module", 1)))
+
+    def _show_row(self, i, unlocked):
+        if not 1 <= i <= 5:
+            return
+        state = (i <= unlocked, round(get_progress_store().completion.module_percent(f"m{i}")))
+        if self._shown.get(i) == state:
+            return      # only rows whose lock or completion changed are touched
+        while self.list.count() < i:
+            self.list.addItem(QListWidgetItem())
+        it = self.list.item(i - 1)
+        if not state[0]:
+            it.setText(f"Module {i}  🔒 Locked")
+            it.setFlags(it.flags() & ~it.flags().__class__.ItemIsEnabled)
+        else:
+            it.setText(f"Module {i}  ✅ {state[1]}%" if state[1] else f"Module {i}")
+            it.setFlags(it.flags() | it.flags().__class__.ItemIsEnabled)
+        self._shown[i] = state
 
     def open_module(self, item):
         mod = int(item.text().split()[1])
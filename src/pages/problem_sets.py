@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTextBrowser, Q
 from src.core.io import load_json
 from src.core.grader import run_code_capture_stdout, grade_problem
 from src.core.progress import mark_completed, set_last_route
+from src.ui.documents import show_document
 from src.widgets.code_editor import CodeEditor
 
 class ProblemSetPage(QWidget):
@@ -35,7 +36,7 @@ class ProblemSetPage(QWidget):
         splitter = QSplitter(Qt.Horizontal)
 
         self.desc = QTextBrowser()
-        self.desc.setMarkdown(self.spec.get("description_md",""))
+        show_document(self.desc, self.spec.get("description_md",""), "markdown")
         splitter.addWidget(self.desc)
 
         right = QWidget()
@@ -1,8 +1,9 @@
 ﻿# -*- coding: utf-8 -*-
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QRadioButton, QButtonGroup, QMessageBox, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox, QScrollArea
 from src.core.io import load_json
 from src.core.quiz import grade_quiz
 from src.core.progress import mark_completed, set_last_route
+from src.widgets.question_pager import QuestionPager
 
 class QuizPage(QWidget):
     def __init__(self, nav, quiz_id: str, routes, on_pass=None):
@@ -12,7 +13,6 @@ class QuizPage(QWidget):
         self.on_pass = on_pass
         self.spec = load_json(f"src/data/quizzes/{quiz_id}.json")
         self.quiz_id = quiz_id
-        self.groups = []
 
         root = QVBoxLayout(self)
 
@@ -26,25 +26,9 @@ class QuizPage(QWidget):
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        container = QWidget()
-        body = QVBoxLayout(container)
-
-        for idx, q in enumerate(self.spec.get("questions", []), start=1):
-            qlbl = QLabel(f"{idx}. {q['prompt']}")
-            qlbl.setWordWrap(True)
-            qlbl.setStyleSheet("font-weight:700; margin-top:10px;")
-            body.addWidget(qlbl)
-
-            group = QButtonGroup(self)
-            self.groups.append(group)
-
-            for ci, choice in enumerate(q["choices"]):
-                rb = QRadioButton(choice)
-                group.addButton(rb, ci)
-                body.addWidget(rb)
-
-        body.addStretch(1)
-        scroll.setWidget(container)
+        self.pager = QuestionPager(page_size=self.spec.get("page_size", 5))
+        self.pager.set_questions([(q["prompt"], q["choices"]) for q in self.spec.get("questions", [])])
+        scroll.setWidget(self.pager)
         root.addWidget(scroll)
 
         submit = QPushButton("Submit Quiz")
@@ -55,13 +39,13 @@ class QuizPage(QWidget):
         set_last_route("modules")
 
     def submit_quiz(self):
-        answers = []
-        for g in self.groups:
-            answers.append(g.checkedId())
+        answers = self.pager.answers()
 
-        # if any unanswered, checkedId() == -1
-        if any(a == -1 for a in answers):
-            QMessageBox.warning(self, "Incomplete", "Answer all questions first.")
+        # unanswered questions are stored as -1
+        missing = self.pager.first_unanswered()
+        if missing != -1:
+            self.pager.go_to_question(missing)
+            QMessageBox.warning(self, "Incomplete", f"Answer all questions first (question {missing + 1} is blank).")
             return
 
         passed, score, msg = grade_quiz(self.spec, answers)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPixmap
+
+from ..engine.assets import ByteLRU, resolve_asset
+
+logger = logging.getLogger(__name__)
+
+class AssetLoader(QObject):
+    """
+    Decodes lesson images off the GUI thread and keeps them as QPixmaps in
+    a byte-bounded LRU.
+
+    pixmap(url) never blocks: it returns the cached pixmap, or None after
+    queueing a decode. Worker threads decode into QImage (safe off the GUI
+    thread); the image is converted to a QPixmap back on the GUI thread,
+    then loaded(url) is emitted so documents showing a placeholder can
+    re-layout.
+    """
+
+    loaded = Signal(str)
+    _decoded = Signal(str, QImage)
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, workers: int = 2, root: Optional[Path] = None, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self._cache = ByteLRU(max_bytes)
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-decode")
+        self._decoded.connect(self._store, Qt.QueuedConnection)
+        self.placeholder = QPixmap(160, 90)
+        self.placeholder.fill(QColor(255, 255, 255, 20))
+
+    def pixmap(self, url: str) -> Optional[QPixmap]:
+        pm = self._cache.get(url)
+        if pm is None:
+            self._request(url)
+        return pm
+
+    def failed(self, url: str) -> bool:
+        return url in self._failed
+
+    def prefetch(self, urls: Iterable[str]):
+        """Queue decodes for images a lesson is about to need (callable from any thread)."""
+        for url in urls:
+            if url not in self._cache:
+                self._request(url)
+
+    def _request(self, url: str):
+        with self._lock:
+            if url in self._pending or url in self._failed:
+                return
+            self._pending.add(url)
+        self._executor.submit(self._decode, url)
+
+    def _decode(self, url: str):
+        path = resolve_asset(url, self.root)
+        image = QImage(str(path)) if path is not None else QImage()
+        if image.isNull():
+            logger.warning(f"Could not load lesson asset: {url}")
+        self._decoded.emit(url, image)
+
+    def _store(self, url: str, image: QImage):
+        with self._lock:
+            self._pending.discard(url)
+            if image.isNull():
+                self._failed.add(url)
+        if not image.isNull():
+            pm = QPixmap.fromImage(image)
+            self._cache.put(url, pm, pm.width() * pm.height() * max(pm.depth(), 8) // 8)
+        self.loaded.emit(url)
+
+    def invalidate(self, url: Optional[str] = None):
+        """Forget one image (or all), e.g. after the file changed on disk."""
+        with self._lock:
+            if url is None:
+                self._failed.clear()
+            else:
+                self._failed.discard(url)
+        if url is None:
+            self._cache.clear()
+        else:
+            self._cache.discard(url)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+_loader: Optional[AssetLoader] = None
+
+def get_asset_loader() -> AssetLoader:
+    """Shared loader; create it on the GUI thread (after QApplication)."""
+    global _loader
+    if _loader is None:
+        _loader = AssetLoader()
+    return _loader
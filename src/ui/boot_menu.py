@@ -1,9 +1,11 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit, QListWidget, QListWidgetItem
 from PySide6.QtCore import Qt
 
 class BootMenu(QWidget):
-    def __init__(self, start_course, review, progress, hack_progress, settings, exit_app):
+    def __init__(self, start_course, review, progress, hack_progress, settings, exit_app, search=None, open_hit=None):
         super().__init__()
+        self._search = search
+        self._open_hit = open_hit
         lay = QVBoxLayout(self)
         lay.setSpacing(18)
 
@@ -19,6 +21,19 @@ class BootMenu(QWidget):
 
         lay.addStretch()
         lay.addWidget(title)
+
+        if search is not None:
+            self.search_box = QLineEdit()
+            self.search_box.setPlaceholderText("Search lessons, errors, quizzes and problems…")
+            self.search_box.setClearButtonEnabled(True)
+            self.search_box.textChanged.connect(self.run_search)
+            self.results = QListWidget()
+            self.results.setMaximumHeight(220)
+            self.results.itemActivated.connect(self._activate)
+            self.results.hide()
+            lay.addWidget(self.search_box)
+            lay.addWidget(self.results)
+
         lay.addStretch()
 
         lay.addWidget(btn("Start / Continue Course", start_course))
@@ -28,4 +43,17 @@ class BootMenu(QWidget):
         lay.addWidget(btn("Settings", settings))
         lay.addWidget(btn("Exit", exit_app))
 
-        lay.addStretch()
\ No newline at end of file
+        lay.addStretch()
+
+    def run_search(self, text: str):
+        self.results.clear()
+        hits = self._search(text) if text.strip() else []
+        for hit in hits:
+            item = QListWidgetItem(f"[{hit.kind}] {hit.title}\n    {hit.snippet}")
+            item.setData(Qt.UserRole, hit)
+            self.results.addItem(item)
+        self.results.setVisible(bool(hits))
+
+    def _activate(self, item: QListWidgetItem):
+        if self._open_hit:
+            self._open_hit(item.data(Qt.UserRole))
@@ -0,0 +1,134 @@
+from __future__ import annotations
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtGui import QTextCursor, QTextDocument
+from PySide6.QtWidgets import QTextBrowser
+
+from ..engine.anchors import AnchorIndex
+from .assets import get_asset_loader
+
+class LessonDocument(QTextDocument):
+    """
+    A QTextDocument whose images come from the shared AssetLoader. Cached
+    documents have no parent browser, so resource loading is overridden here
+    rather than in QTextBrowser.loadResource. A missing image shows a
+    placeholder until it is decoded, then the document re-lays out.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._waiting = set()
+        self._assets = get_asset_loader()
+        self._assets.loaded.connect(self._asset_loaded)
+
+    def loadResource(self, rtype, url):
+        if rtype != QTextDocument.ImageResource:
+            return super().loadResource(rtype, url)
+        key = url.toString()
+        pm = self._assets.pixmap(key)
+        if pm is not None:
+            return pm
+        if not self._assets.failed(key):
+            self._waiting.add(key)
+        return self._assets.placeholder
+
+    def _asset_loaded(self, url: str):
+        if url in self._waiting:
+            self._waiting.discard(url)
+            self.markContentsDirty(0, self.characterCount())
+
+@dataclass
+class CachedDocument:
+    document: QTextDocument
+    anchors: AnchorIndex
+
+def _anchor_index(doc: QTextDocument) -> AnchorIndex:
+    """Headings and <a name> anchors, walked once when the document is built."""
+    entries = []
+    block = doc.begin()
+    while block.isValid():
+        if block.blockFormat().headingLevel() > 0:
+            entries.append((block.text(), block.position()))
+        it = block.begin()
+        while not it.atEnd():
+            frag = it.fragment()
+            for name in frag.charFormat().anchorNames():
+                entries.append((name, frag.position()))
+            it += 1
+        block = block.next()
+
+    def search(text: str) -> Optional[int]:
+        cursor = doc.find(text)
+        return None if cursor.isNull() else cursor.selectionStart()
+
+    return AnchorIndex(entries, search)
+
+class DocumentCache:
+    """
+    Parsed QTextDocuments keyed by a hash of their source, least recently
+    used first out. Re-showing a document skips parsing, and the layout is
+    kept as long as the view width is unchanged.
+
+    GUI thread only. A document stays alive while a view shows it (the view
+    holds a reference), so eviction never pulls one out from under a widget.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._docs: "OrderedDict[str, CachedDocument]" = OrderedDict()
+
+    def get(self, text: str, fmt: str = "html") -> CachedDocument:
+        key = hashlib.sha256(f"{fmt}\0{text}".encode("utf-8")).hexdigest()
+        hit = self._docs.get(key)
+        if hit is not None:
+            self._docs.move_to_end(key)
+            return hit
+        doc = LessonDocument()
+        if fmt == "markdown":
+            doc.setMarkdown(text)
+        elif fmt == "plain":
+            doc.setPlainText(text)
+        else:
+            doc.setHtml(text)
+        entry = CachedDocument(doc, _anchor_index(doc))
+        self._docs[key] = entry
+        while len(self._docs) > self.max_entries:
+            self._docs.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._docs.clear()
+
+_cache: Optional[DocumentCache] = None
+
+def get_document_cache() -> DocumentCache:
+    global _cache
+    if _cache is None:
+        _cache = DocumentCache()
+    return _cache
+
+def show_document(view: QTextBrowser, text: str, fmt: str = "html") -> CachedDocument:
+    """Display text in view from the shared cache (instead of setHtml/setMarkdown)."""
+    entry = get_document_cache().get(text, fmt)
+    if view.document() is not entry.document:
+        entry.document.setDefaultFont(view.font())
+        view.setDocument(entry.document)
+    view._shown_document = entry   # keeps the document alive past eviction
+    view.moveCursor(QTextCursor.Start)
+    return entry
+
+def scroll_to(view: QTextBrowser, entry: CachedDocument, section: str) -> bool:
+    """Scroll so the section's heading is at the top of the view."""
+    pos = entry.anchors.resolve(section)
+    if pos is None:
+        return False
+    doc = entry.document
+    cursor = QTextCursor(doc)
+    cursor.setPosition(pos)
+    view.setTextCursor(cursor)
+    rect = doc.documentLayout().blockBoundingRect(doc.findBlock(pos))
+    view.verticalScrollBar().setValue(int(rect.top()))
+    return True
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer, QFileSystemWatcher, Signal
+
+from ..core.watch import DATA_DIR, PollingWatcher, changed_paths, invalidate, snapshot
+
+class ContentReloader(QObject):
+    """
+    Emits contentChanged(set of paths relative to src/data) after content
+    files are edited, on the GUI thread.
+
+    QFileSystemWatcher (inotify on Linux) only says *something* happened, so
+    every event restarts a short single-shot timer; when it fires, a stat
+    snapshot diff tells exactly which files changed, affected cache entries
+    are dropped, and one signal goes out per save burst. Where the platform
+    watcher can't watch the tree, a core.watch.PollingWatcher does the same
+    on a background thread (the signal is queued to the GUI thread).
+    """
+
+    contentChanged = Signal(object)
+
+    def __init__(self, root: Path = DATA_DIR, debounce_ms: int = 300, poll_ms: int = 1000, parent=None):
+        super().__init__(parent)
+        self.root = Path(root)
+        self._snap = snapshot(self.root)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._check)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(lambda _path: self._debounce.start())
+        self._watcher.fileChanged.connect(lambda _path: self._debounce.start())
+        self._poller = None
+        if not self._watch_tree():
+            poller = PollingWatcher(self.contentChanged.emit, self.root,
+                                    interval_sec=poll_ms / 1000, debounce_sec=debounce_ms / 1000)
+            poller.start()
+            self.destroyed.connect(lambda *_: poller.stop())
+            self._poller = poller
+
+    def _watch_tree(self) -> bool:
+        """(Re)watch every directory and content file; editors that save by rename drop watches."""
+        paths = [str(self.root)] + [str(p) for p in self.root.rglob("*") if p.is_dir()]
+        paths += [str(self.root / rel) for rel in self._snap]
+        current = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [p for p in paths if p not in current]
+        failed = self._watcher.addPaths(missing) if missing else []
+        return len(failed) < len(missing) or not missing
+
+    def _check(self):
+        new = snapshot(self.root)
+        rels = changed_paths(self._snap, new)
+        self._snap = new
+        self._watch_tree()
+        if rels:
+            invalidate(self.root, rels)
+            self.contentChanged.emit(rels)
@@ -1,13 +1,22 @@
 from __future__ import annotations
+import logging
+
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QStackedWidget, QApplication
 
 from .boot_menu import BootMenu
 from .pages import LessonPage, QuizPage, DebugPage, ChallengePage, TerminalPage
 from .pages import LessonPage, QuizPage, DebugPage, ChallengePage, TerminalPage
-from ..engine.content_loader import load_course, load_progress, save_progress
+from ..engine.content_loader import load_course, load_progress, save_progress, history_archive
+from ..engine.assets import asset_urls
+from ..engine.module_store import ModuleStore
+from ..engine.search import get_search_index
+from .assets import get_asset_loader
+from .hot_reload import ContentReloader
 from ..engine.progress import record_attempt, unlock_after_pass
 from ..ui.styles import APP_QSS
 
+logger = logging.getLogger(__name__)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -16,6 +25,13 @@ class MainWindow(QMainWindow):
 
         self.course = load_course()
         self.progress = load_progress()
+        self.assets = get_asset_loader()
+        self.store = ModuleStore(self.course, on_prefetch=self._prefetch_assets)
+        # Module whose lesson -> quiz -> debug -> challenge stages are being
+        # walked, and which module each stage page currently shows.
+        self._stage_index = 0
+        self._loaded = {}
+        self._search_stale = False
 
         self.stack = QStackedWidget()
 
@@ -26,7 +42,9 @@ class MainWindow(QMainWindow):
             progress=self.show_progress,
             hack_progress=self.go_terminal,
             settings=self.show_settings,
-            exit_app=QApplication.quit
+            exit_app=QApplication.quit,
+            search=self.search,
+            open_hit=self.open_search_hit
         )
 
         # Pages (now include back/menu)
@@ -52,13 +70,30 @@ class MainWindow(QMainWindow):
         self.setStyleSheet(APP_QSS)
         self.stack.setCurrentWidget(self.boot)
 
+        # Hot reload: authors see content edits without restarting.
+        self.reloader = ContentReloader(parent=self)
+        self.reloader.contentChanged.connect(self.on_content_changed)
+
+    def closeEvent(self, event):
+        self.store.shutdown()
+        self.assets.shutdown()
+        super().closeEvent(event)
+
     def modules(self):
-        return self.course.get("modules", [])
+        return self.store.modules()
+
+    def _prefetch_assets(self, index: int, stage: str, unit: dict):
+        """Runs on the prefetch thread: start decoding images the next stage shows."""
+        html = unit.get("lesson_html", "") if stage == "lesson" else \
+            unit.get("coding_challenge", {}).get("description_html", "") if stage == "challenge" else ""
+        if html:
+            self.assets.prefetch(asset_urls(html))
 
     def current_module_index(self) -> int:
         return int(self.progress.get("module_index", 0))
 
     def current_module(self) -> dict:
+        """Outline of the current module (id, title, objective, hack_prompt)."""
         mods = self.modules()
         if not mods:
             return {}
@@ -68,12 +103,27 @@ class MainWindow(QMainWindow):
         return mods[i]
 
     def load_current_module(self):
-        mod = self.current_module()
-        self.lesson_page.load_module(mod)
-        self.quiz_page.load_quiz(mod)
-        self.debug_page.load_errors(mod)
+        """Load only the current module's lesson; later stages load on demand."""
+        self._stage_index = self.current_module_index()
+        self._loaded = {}
+        self._load_stage("lesson")
         self.terminal_page.set_objective_text(self.get_hack_prompt())
 
+    def _load_stage(self, stage: str):
+        i = self._stage_index
+        if self._loaded.get(stage) != i:
+            mod = self.store.module(i, stage)
+            if stage == "lesson":
+                self.lesson_page.load_module(mod)
+            elif stage == "quiz":
+                self.quiz_page.load_quiz(mod)
+            elif stage == "debug":
+                self.debug_page.load_errors(mod)
+            elif stage == "challenge":
+                self.challenge_page.load_challenge(mod)
+            self._loaded[stage] = i
+        self.store.prefetch_after(i, stage)
+
     # NAV
     def go_menu(self):
         self.stack.setCurrentWidget(self.boot)
@@ -105,24 +155,36 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentWidget(self.lesson_page)
 
     def go_quiz(self):
+        self._load_stage("quiz")
         self.stack.setCurrentWidget(self.quiz_page)
 
     def quiz_pass(self, score: int):
-        mi = self.current_module_index()
-        record_attempt(self.progress, mi, score)
-        unlock_after_pass(self.progress, mi)
-        save_progress(self.progress)
-
-        # FORCE debug after passing
-        self.load_current_module()
+        mi = self._stage_index
+        record_attempt(self.progress, mi, score, passed=True, archive=history_archive())
+        # Re-taking an earlier module's quiz (opened from search) unlocks nothing.
+        if mi == self.current_module_index():
+            unlock_after_pass(self.progress, mi)
+        self._save_progress()
+
+        # FORCE debug after passing (the debug stage of the module just passed)
+        self._load_stage("debug")
+        self.terminal_page.set_objective_text(self.get_hack_prompt())
         self.stack.setCurrentWidget(self.debug_page)
 
     def quiz_fail(self, score: int):
-        mi = self.current_module_index()
-        record_attempt(self.progress, mi, score)
-        save_progress(self.progress)
+        mi = self._stage_index
+        record_attempt(self.progress, mi, score, passed=False, archive=history_archive())
+        self._save_progress()
         self.go_lesson()
 
+    def _save_progress(self):
+        # a failed save (e.g. the shared profile database stayed locked) must not
+        # break the quiz flow; the attempt is still in memory and the next save keeps it
+        try:
+            save_progress(self.progress)
+        except IOError as e:
+            logger.error(f"Progress not saved: {e}")
+
     def go_terminal(self):
         self.terminal_page.set_objective_text(self.get_hack_prompt())
         self.stack.setCurrentWidget(self.terminal_page)
@@ -134,6 +196,43 @@ class MainWindow(QMainWindow):
             return
         self.go_lesson()
 
+    def search(self, text: str):
+        index = get_search_index(refresh=self._search_stale)
+        self._search_stale = False
+        return index.search(text, limit=15)
+
+    def on_content_changed(self, rels):
+        """Re-render only the stage pages whose content file changed."""
+        self._search_stale = True
+        if "course.json" in rels:
+            self.course = load_course()
+            self.store.course = self.course
+            self._loaded = {}   # titles/objectives may have changed everywhere
+        mods = self.modules()
+        shown = str(mods[self._stage_index].get("id")) if 0 <= self._stage_index < len(mods) else None
+        for rel in rels:
+            parts = rel.split("/")
+            if len(parts) == 3 and parts[0] == "lessons" and parts[1] == shown:
+                self._loaded.pop(parts[2].rsplit(".", 1)[0], None)
+        for stage, page in (("lesson", self.lesson_page), ("quiz", self.quiz_page),
+                            ("debug", self.debug_page), ("challenge", self.challenge_page)):
+            if stage not in self._loaded and self.stack.currentWidget() is page:
+                self._load_stage(stage)
+        self.terminal_page.set_objective_text(self.get_hack_prompt())
+
+    def open_search_hit(self, hit):
+        """Open the lesson a hit belongs to, if the student has reached that module."""
+        ids = [str(m.get("id")) for m in self.modules()]
+        if hit.module not in ids:
+            return
+        i = ids.index(hit.module)
+        if i > self.current_module_index():
+            return
+        self._stage_index = i
+        self._loaded = {}
+        self._load_stage("lesson")
+        self.stack.setCurrentWidget(self.lesson_page)
+
     # TODO: MENU and other menu handlers still need to be implemented
     def show_progress(self):
         self.go_lesson()
@@ -151,8 +250,7 @@ class MainWindow(QMainWindow):
 
     def show_challenge(self):
         # called after debug session
-        module = self.current_module()
-        self.challenge_page.load_challenge(module)
+        self._load_stage("challenge")
         self.stack.setCurrentWidget(self.challenge_page)
 
     def on_challenge_pass(self):
@@ -3,7 +3,7 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFrame, QTextEdit, QTextBrowser, QButtonGroup, QRadioButton,
+    QFrame, QTextEdit, QTextBrowser,
     QMessageBox, QLineEdit, QListWidget, QListWidgetItem, QSplitter, QComboBox
 )
 
@@ -12,6 +12,8 @@ from ..engine.lectures import lecture_for
 from ..engine.scaffold import scaffold
 from ..engine.runner import run_python
 from ..engine.autograder import grade_code
+from .documents import scroll_to, show_document
+from ..widgets.question_pager import QuestionPager
 
 def card():
     f = QFrame()
@@ -26,6 +28,7 @@ class LessonPage(QWidget):
         self._on_back = on_back
         self._on_menu = on_menu
         self._module = {}
+        self._doc = None
 
         root = QVBoxLayout(self)
         root.setSpacing(10)
@@ -130,7 +133,7 @@ class LessonPage(QWidget):
         split.setStretchFactor(0, 1)
         split.setStretchFactor(1, 3)
 
-        # TOC click scrolls content (simple)
+        # TOC click scrolls content to the section heading
         self.toc.itemClicked.connect(self.jump_to_section)
 
         # Basic nicer look
@@ -151,7 +154,8 @@ class LessonPage(QWidget):
             txt = module.get("lesson_text", "")
             html = "<pre>" + (txt.replace("&","&amp;").replace("<","&lt;").replace(">","&gt;")) + "</pre>"
 
-        self.content.setHtml(html)
+        # Parsed once per distinct lesson; re-opening reuses the document and its anchors
+        self._doc = show_document(self.content, html)
 
         # TOC
         self.toc.clear()
@@ -176,9 +180,8 @@ class LessonPage(QWidget):
         self.output.setPlainText("")
 
     def jump_to_section(self, item: QListWidgetItem):
-        # Simple: search for an anchor-like heading text in the HTML and scroll there
-        key = item.text().strip()
-        self.content.find(key)
+        if self._doc is not None:
+            scroll_to(self.content, self._doc, item.text())
 
     def load_selected_example(self):
         if not hasattr(self, "_examples") or not self._examples:
@@ -231,36 +234,16 @@ class QuizPage(QWidget):
 
         title = QLabel("Quiz")
         title.setObjectName("Title")
-        sub = QLabel("2 MCQ + 1 FRQ. You must score 90% or higher to pass.")
-        sub.setObjectName("Subtle")
+        self.sub = QLabel("MCQ + 1 FRQ. You must score 90% or higher to pass.")
+        self.sub.setObjectName("Subtle")
 
         lay.addLayout(nav)
         lay.addWidget(title)
-        lay.addWidget(sub)
-
-        self.mcq_blocks = []
-        for n in range(2):
-            qb = card()
-            ql = QVBoxLayout(qb)
-            qh = QLabel(f"MCQ {n+1}")
-            qh.setStyleSheet("font-weight:800;")
-            qtext = QLabel("")
-            qtext.setWordWrap(True)
-
-            group = QButtonGroup(self)
-            opts = []
-            for i in range(4):
-                rb = QRadioButton("")
-                group.addButton(rb, i)
-                opts.append(rb)
-
-            ql.addWidget(qh)
-            ql.addWidget(qtext)
-            for rb in opts:
-                ql.addWidget(rb)
-
-            lay.addWidget(qb)
-            self.mcq_blocks.append((qtext, group, opts))
+        lay.addWidget(self.sub)
+
+        # Only a page of MCQ slots is built; any number of questions pages through them
+        self.mcq_pager = QuestionPager(page_size=4)
+        lay.addWidget(self.mcq_pager)
 
         frqb = card()
         frql = QVBoxLayout(frqb)
@@ -301,14 +284,8 @@ class QuizPage(QWidget):
         mcq = self.quiz.get("mcq", [])
         frq = self.quiz.get("frq", {})
 
-        for i in range(2):
-            qtext, group, opts = self.mcq_blocks[i]
-            item = mcq[i] if i < len(mcq) else {"question":"(missing)", "choices":["A","B","C","D"], "correct_index":0}
-            qtext.setText(item.get("question",""))
-            choices = item.get("choices", ["A","B","C","D"])
-            for j, rb in enumerate(opts):
-                rb.setText(choices[j] if j < len(choices) else "")
-                rb.setChecked(False)
+        self.mcq_pager.set_questions([(item.get("question", ""), item.get("choices", [])) for item in mcq])
+        self.sub.setText(f"{len(mcq)} MCQ + 1 FRQ. You must score 90% or higher to pass.")
 
         self.frq_prompt.setText(frq.get("prompt", "Explain the syntax error and fix it."))
         self.frq_broken.setPlainText(frq.get("broken_code", "print(\"Hello)\n"))
@@ -319,9 +296,7 @@ class QuizPage(QWidget):
     def submit(self):
         if not self.quiz:
             return
-        mcq_picks = []
-        for (_, group, _) in self.mcq_blocks:
-            mcq_picks.append(group.checkedId())
+        mcq_picks = self.mcq_pager.answers()
 
         answers = {"mcq": mcq_picks, "frq": self.frq_answer.toPlainText()}
         score, detail = grade_quiz(self.quiz, answers)
@@ -658,7 +633,7 @@ class ChallengePage(QWidget):
             }
 
         self.c_title.setText(self.challenge.get("title", "Coding Challenge"))
-        self.c_desc.setHtml(self.challenge.get("description_html", "<p></p>"))
+        show_document(self.c_desc, self.challenge.get("description_html", "<p></p>"))
 
         # scaffolded starter area
         starter = self.challenge.get("starter_code", "")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from ..core.progress import add_listener
+
+class ProgressBus(QObject):
+    """
+    Qt signals for progress changes made through core.progress.
+
+    Pages connect to the signals they care about and update just the
+    affected rows from the in-memory store, instead of being refreshed (and
+    re-reading progress) by whoever made the change. Signals are emitted on
+    the thread that made the change; receivers on the GUI thread get them
+    queued as usual.
+    """
+
+    completed = Signal(str, str)     # kind, item id
+    unlocked = Signal(int)           # new unlocked_module
+    routeChanged = Signal(str)
+    reset = Signal()                 # everything may have changed (profile switch, save_progress)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        remove = add_listener(self._on_event)
+        self.destroyed.connect(lambda *_: remove())
+
+    def _on_event(self, event: str, *args):
+        if event == "completed":
+            self.completed.emit(*args)
+        elif event == "unlocked":
+            self.unlocked.emit(*args)
+        elif event == "route_changed":
+            self.routeChanged.emit(*args)
+        elif event == "reset":
+            self.reset.emit()
+
+_bus: Optional[ProgressBus] = None
+
+def get_progress_bus() -> ProgressBus:
+    """Shared bus; create it on the GUI thread (after QApplication)."""
+    global _bus
+    if _bus is None:
+        _bus = ProgressBus()
+    return _bus
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QRadioButton, QButtonGroup
+
+UNANSWERED = -1
+
+class _QuestionSlot:
+    """One reusable question widget: a prompt label plus radio buttons grown on demand."""
+
+    def __init__(self, parent, layout, on_pick):
+        self.box = QWidget()
+        self.lay = QVBoxLayout(self.box)
+        self.lay.setContentsMargins(0, 0, 0, 0)
+        self.prompt = QLabel("")
+        self.prompt.setWordWrap(True)
+        self.prompt.setStyleSheet("font-weight:700; margin-top:10px;")
+        self.lay.addWidget(self.prompt)
+        self.group = QButtonGroup(parent)
+        self.group.idClicked.connect(on_pick)
+        self.buttons = []
+        layout.addWidget(self.box)
+
+    def show_question(self, number, prompt, choices, picked):
+        self.prompt.setText(f"{number}. {prompt}")
+        while len(self.buttons) < len(choices):
+            rb = QRadioButton("")
+            self.group.addButton(rb, len(self.buttons))
+            self.lay.addWidget(rb)
+            self.buttons.append(rb)
+
+        # Clearing a radio selection requires the group to be non-exclusive.
+        self.group.setExclusive(False)
+        for i, rb in enumerate(self.buttons):
+            if i < len(choices):
+                rb.setText(choices[i])
+                rb.setChecked(i == picked)
+                rb.show()
+            else:
+                rb.setChecked(False)
+                rb.hide()
+        self.group.setExclusive(True)
+        self.box.show()
+
+class QuestionPager(QWidget):
+    """
+    Paginated multiple-choice renderer.
+
+    Only page_size question slots are ever built; paging re-fills them from the
+    question list, and answers live in a compact array (-1 = unanswered), so a
+    200-question exam costs the same to construct as a 5-question quiz.
+    """
+
+    def __init__(self, page_size: int = 5):
+        super().__init__()
+        self.page_size = page_size
+        self.page = 0
+        self._questions = []
+        self._answers = array("h")
+
+        root = QVBoxLayout(self)
+        body = QVBoxLayout()
+        root.addLayout(body)
+
+        self.slots = []
+        for i in range(page_size):
+            self.slots.append(_QuestionSlot(self, body, lambda cid, i=i: self._on_pick(i, cid)))
+        body.addStretch(1)
+
+        nav = QHBoxLayout()
+        self.prev_btn = QPushButton("Previous")
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.page - 1))
+        self.next_btn = QPushButton("Next")
+        self.next_btn.clicked.connect(lambda: self.show_page(self.page + 1))
+        self.position = QLabel("")
+        self.position.setStyleSheet("opacity: 0.8;")
+        nav.addWidget(self.prev_btn)
+        nav.addStretch(1)
+        nav.addWidget(self.position)
+        nav.addStretch(1)
+        nav.addWidget(self.next_btn)
+        root.addLayout(nav)
+
+    def set_questions(self, questions):
+        """questions: sequence of (prompt, choices). Resets all answers."""
+        self._questions = questions
+        self._answers = array("h", [UNANSWERED]) * len(questions)
+        self.show_page(0)
+
+    def page_count(self) -> int:
+        return max(1, -(-len(self._questions) // self.page_size))
+
+    def show_page(self, page: int):
+        self.page = max(0, min(page, self.page_count() - 1))
+        start = self.page * self.page_size
+        for i, slot in enumerate(self.slots):
+            q = start + i
+            if q < len(self._questions):
+                prompt, choices = self._questions[q]
+                slot.show_question(q + 1, prompt, choices, self._answers[q])
+            else:
+                slot.box.hide()
+
+        total = len(self._questions)
+        end = min(total, start + self.page_size)
+        self.position.setText(f"Questions {start + 1 if total else 0}–{end} of {total}")
+        self.prev_btn.setEnabled(self.page > 0)
+        self.next_btn.setEnabled(self.page < self.page_count() - 1)
+        paged = self.page_count() > 1
+        self.prev_btn.setVisible(paged)
+        self.next_btn.setVisible(paged)
+
+    def go_to_question(self, index: int):
+        self.show_page(index // self.page_size)
+
+    def _on_pick(self, slot_index: int, choice: int):
+        q = self.page * self.page_size + slot_index
+        if q < len(self._answers):
+            self._answers[q] = choice
+
+    def answers(self) -> list:
+        return self._answers.tolist()
+
+    def first_unanswered(self) -> int:
+        """Index of the first unanswered question, or -1 if all are answered."""
+        try:
+            return self._answers.index(UNANSWERED)
+        except ValueError:
+            return -1
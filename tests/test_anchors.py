@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Tests for the lesson section anchor index."""
+
+import unittest
+
+from src.engine.anchors import AnchorIndex, section_key
+
+
+class TestAnchorIndex(unittest.TestCase):
+    """Test suite for AnchorIndex."""
+
+    HEADINGS = [
+        ("Module 2: Conditionals and Loops", 0),
+        ("1) if statements (decision making)", 40),
+        ("2) for loops (repeat a known number of times)", 120),
+        ("3) while loops (repeat until the condition becomes false)", 260),
+        ("Indentation matters", 400),
+        ("Mini practice", 520),
+    ]
+
+    def test_section_key(self):
+        """Keys keep words only, lowercased."""
+        self.assertEqual(section_key("What is <b>print()</b>?"), "what is b print b")
+        self.assertEqual(section_key("  Mini   practice! "), "mini practice")
+
+    def test_exact_and_partial_matches(self):
+        """TOC entries match exact headings first, then headings containing their words."""
+        index = AnchorIndex(self.HEADINGS)
+        self.assertEqual(index.resolve("Mini practice"), 520)
+        self.assertEqual(index.resolve("if statements"), 40)
+        self.assertEqual(index.resolve("while loops"), 260)
+        self.assertEqual(index.resolve("Indentation"), 400)
+        self.assertIsNone(index.resolve("Common mistakes"))
+
+    def test_whole_words_only(self):
+        """A section does not match inside a longer word."""
+        index = AnchorIndex([("Strings and things", 10)])
+        self.assertIsNone(index.resolve("ring"))
+
+    def test_search_fallback_is_memoized(self):
+        """Sections without a heading fall back to a text search, once."""
+        calls = []
+
+        def search(text):
+            calls.append(text)
+            return 77
+
+        index = AnchorIndex(self.HEADINGS, search)
+        self.assertEqual(index.resolve("Exact output"), 77)
+        self.assertEqual(index.resolve("exact  output"), 77)
+        self.assertEqual(calls, ["Exact output"])
+
+
+if __name__ == "__main__":
+    unittest.main()
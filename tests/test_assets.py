@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests for lesson asset references and the byte-bounded LRU."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.engine.assets import ByteLRU, asset_urls, resolve_asset
+from src.engine.module_store import ModuleStore
+
+
+class TestAssetUrls(unittest.TestCase):
+    """Test suite for finding and resolving asset references."""
+
+    def test_asset_urls(self):
+        """Local <img> sources are found once each; remote and data: URLs are skipped."""
+        html = ('<p>x</p><img src="assets/a.png" width=10><IMG alt="b" SRC=\'assets/b.png\'>'
+                '<img src="assets/a.png"><img src="https://example.com/c.png"><img src="data:image/png;base64,AA">')
+        self.assertEqual(asset_urls(html), ["assets/a.png", "assets/b.png"])
+
+    def test_resolve_stays_inside_root(self):
+        """Paths that escape the content directory do not resolve."""
+        root = Path(tempfile.gettempdir())
+        self.assertEqual(resolve_asset("assets/a.png", root), (root / "assets/a.png").resolve())
+        self.assertIsNone(resolve_asset("../secret.png", root))
+        self.assertIsNone(resolve_asset("/etc/passwd", root))
+
+
+class TestByteLRU(unittest.TestCase):
+    """Test suite for ByteLRU."""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Inserting past the byte budget drops the least recently used values."""
+        lru = ByteLRU(max_bytes=100)
+        lru.put("a", "A", 40)
+        lru.put("b", "B", 40)
+        self.assertEqual(lru.get("a"), "A")     # b is now least recently used
+        lru.put("c", "C", 40)
+        self.assertNotIn("b", lru)
+        self.assertEqual(lru.get("a"), "A")
+        self.assertEqual(lru.bytes, 80)
+        self.assertEqual(lru.evictions, 1)
+
+    def test_oversized_and_replaced_values(self):
+        """A value larger than the budget is refused; replacing a key updates the total."""
+        lru = ByteLRU(max_bytes=100)
+        self.assertFalse(lru.put("big", "X", 101))
+        lru.put("a", "A", 30)
+        lru.put("a", "A2", 50)
+        self.assertEqual((lru.get("a"), lru.bytes, len(lru)), ("A2", 50, 1))
+
+
+class TestPrefetchHook(unittest.TestCase):
+    """Test suite for ModuleStore's on_prefetch hook."""
+
+    def test_hook_sees_prefetched_stage(self):
+        """The hook runs after the next stage is loaded in the background."""
+        with tempfile.TemporaryDirectory() as tmp:
+            course = {"modules": [{"id": "m1", "title": "One", "lesson_html": "<p>1</p>"},
+                                  {"id": "m2", "title": "Two", "lesson_html": '<img src="assets/m2.png">'}]}
+            seen = []
+            store = ModuleStore(course, Path(tmp), on_prefetch=lambda i, stage, unit: seen.append((i, stage, unit)))
+            store.prefetch_after(0, "challenge").result(timeout=5)
+            store.shutdown()
+        self.assertEqual(seen[0][:2], (1, "lesson"))
+        self.assertEqual(asset_urls(seen[0][2]["lesson_html"]), ["assets/m2.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
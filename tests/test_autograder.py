@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Tests for the code autograder."""
+
+import unittest
+from src.engine.autograder import grade_code
+from src.engine.interactive import run_interactive
+from src.engine.scratch import ScratchPool
+
+
+WRITER = 'with open("out.txt", "w") as f:\n    f.write("line 1\\nline 2\\n")\n'
+
+
+class TestFileTests(unittest.TestCase):
+    """Test suite for file_equals / file_contains tests."""
+
+    def test_file_equals_and_contains(self):
+        """Test that matching output files pass both test types."""
+        challenge = {"tests": [
+            {"type": "file_equals", "path": "out.txt", "value": "line 1\nline 2\n"},
+            {"type": "file_contains", "path": "out.txt", "value": "line 2"},
+        ]}
+        result = grade_code(challenge, WRITER)
+        self.assertTrue(result.passed)
+        self.assertEqual(result.score, 100)
+
+    def test_missing_file_and_wrong_contents(self):
+        """Test that a missing or different file fails with feedback."""
+        challenge = {"tests": [
+            {"type": "file_equals", "path": "out.txt", "value": "line 1\n"},
+            {"type": "file_contains", "path": "other.txt", "value": "x"},
+        ]}
+        result = grade_code(challenge, WRITER)
+        self.assertFalse(result.passed)
+        self.assertIn("does not match", result.feedback)
+        self.assertIn("other.txt", result.feedback)
+
+    def test_path_outside_run_dir_rejected(self):
+        """Test that test paths can't escape the scratch directory."""
+        challenge = {"tests": [{"type": "file_contains", "path": "../out.txt", "value": ""}]}
+        result = grade_code(challenge, WRITER)
+        self.assertFalse(result.passed)
+        self.assertIn("Invalid output file path", result.feedback)
+
+
+GUESS_JUDGE = """
+def judge(send, recv):
+    secret = 37
+    for _ in range(10):
+        guess = int(recv())
+        if guess == secret:
+            send("correct")
+            return True
+        send("higher" if guess < secret else "lower")
+    assert False, "too many guesses"
+"""
+
+BINARY_SEARCH = """
+lo, hi = 1, 100
+while True:
+    mid = (lo + hi) // 2
+    print(mid)
+    reply = input()
+    if reply == "correct":
+        break
+    if reply == "higher":
+        lo = mid + 1
+    else:
+        hi = mid - 1
+"""
+
+
+class TestInteractive(unittest.TestCase):
+    """Test suite for interactive judge tests."""
+
+    def _challenge(self, **extra):
+        test = {"type": "interactive", "judge_function": GUESS_JUDGE, "turn_timeout": 2.0}
+        test.update(extra)
+        return {"tests": [test]}
+
+    def test_guessing_game_accepted(self):
+        """Test that a correct player is accepted by the judge."""
+        result = grade_code(self._challenge(), BINARY_SEARCH)
+        self.assertTrue(result.passed, result.feedback)
+
+    def test_bad_player_rejected_with_transcript(self):
+        """Test that a wrong player is rejected and the transcript is shown."""
+        code = "while True:\n    print(1)\n    input()\n"
+        result = grade_code(self._challenge(), code)
+        self.assertFalse(result.passed)
+        self.assertIn("rejected", result.feedback)
+        self.assertIn("too many guesses", result.feedback)
+        self.assertIn("student> 1", result.feedback)
+
+    def test_silent_player_times_out(self):
+        """Test that a player that never answers hits the per-turn timeout."""
+        code = "import time\ntime.sleep(5)\n"
+        result = grade_code(self._challenge(turn_timeout=0.3), code)
+        self.assertFalse(result.passed)
+        self.assertIn("timeout", result.feedback)
+
+    def test_judge_not_readable_from_student_dir(self):
+        """Test that the judge's script is not in the student's scratch pool."""
+        judge = "import sys\nsys.exit(0 if input() == '0' else 1)\n"
+        code = ("import glob, os\n"
+                "mine = os.path.abspath('__main__.py')\n"
+                "print(len([p for p in glob.glob('../*/__main__.py') if os.path.abspath(p) != mine]))\n")
+        result = run_interactive(code, judge, turn_timeout=2.0)
+        self.assertTrue(result.passed, result.format_transcript())
+
+
+class TestScratchPool(unittest.TestCase):
+    """Test suite for scratch directory recycling."""
+
+    def setUp(self):
+        self.pool = ScratchPool(max_idle=1)
+
+    def tearDown(self):
+        self.pool.cleanup()
+
+    def test_released_dir_is_emptied_and_reused(self):
+        """Test that a released directory comes back empty."""
+        with self.pool.lease() as d:
+            (d / "junk.txt").write_text("x")
+            (d / "sub").mkdir()
+        with self.pool.lease() as again:
+            self.assertEqual(again, d)
+            self.assertEqual(list(again.iterdir()), [])
+
+    def test_concurrent_leases_are_distinct(self):
+        """Test that simultaneous runs get different directories."""
+        a = self.pool.acquire()
+        b = self.pool.acquire()
+        self.assertNotEqual(a, b)
+        self.pool.release(a)
+        self.pool.release(b)
+        self.assertFalse(b.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Tests for bulk quiz grading and item analysis."""
+
+import unittest
+from src.core.quiz import grade_quiz
+from src.engine.bulk_grading import grade_bulk, key_from_quiz, format_report, np
+
+
+QUIZ = {
+    "pass_score": 80,
+    "questions": [
+        {"prompt": "a", "choices": ["x", "y", "z"], "answer_index": 1},
+        {"prompt": "b", "choices": ["x", "y", "z"], "answer_index": 0},
+        {"prompt": "c", "choices": ["x", "y", "z"], "answer_index": 2},
+        {"prompt": "d", "choices": ["x", "y"], "answer_index": 0},
+    ],
+}
+
+ANSWERS = [
+    [1, 0, 2, 0],
+    [1, 0, 2, 1],
+    [1, 1, 0, 0],
+    [0, 1, -1, 1],
+]
+
+
+class TestBulkGrading(unittest.TestCase):
+    """Test suite for grade_bulk."""
+
+    def test_matches_single_student_grader(self):
+        """Test that bulk scores equal core.quiz.grade_quiz per student."""
+        result = grade_bulk(ANSWERS, key_from_quiz(QUIZ), pass_score=QUIZ["pass_score"], use_numpy=False)
+        for row, score, ok in zip(ANSWERS, result.scores, result.passed):
+            single_ok, single_score, _ = grade_quiz(QUIZ, row)
+            self.assertEqual(score, single_score)
+            self.assertEqual(ok, single_ok)
+
+    def test_item_statistics(self):
+        """Test difficulty, discrimination, distractors and omissions."""
+        result = grade_bulk(ANSWERS, key_from_quiz(QUIZ), use_numpy=False)
+        self.assertEqual(result.difficulty, [0.75, 0.5, 0.5, 0.5])
+        # groups of round(0.27 * 4) = 1: best student vs worst student
+        self.assertEqual(result.discrimination, [1.0, 1.0, 1.0, 1.0])
+        self.assertEqual(result.distractors[2], [1, 0, 2])
+        self.assertEqual(result.omitted, [0, 0, 1, 0])
+
+    def test_course_quiz_key(self):
+        """Test reading the key from a course-style quiz."""
+        self.assertEqual(key_from_quiz({"mcq": [{"correct_index": 2}, {"correct_index": 0}]}), [2, 0])
+
+    def test_rejects_ragged_rows(self):
+        """Test that rows with a wrong answer count are rejected."""
+        with self.assertRaises(ValueError):
+            grade_bulk([[0, 1], [0]], [0, 1])
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_matches_fallback(self):
+        """Test that the NumPy path gives identical results."""
+        key = key_from_quiz(QUIZ)
+        self.assertEqual(grade_bulk(ANSWERS, key, use_numpy=True), grade_bulk(ANSWERS, key, use_numpy=False))
+
+    def test_report(self):
+        """Test that the text report lists every item and student."""
+        result = grade_bulk(ANSWERS, key_from_quiz(QUIZ), use_numpy=False)
+        report = format_report(result, ["s1", "s2", "s3", "s4"])
+        self.assertIn("Passed: 1/4", report)
+        self.assertIn("s4  0%  FAIL", report)
+
+
+if __name__ == '__main__':
+    unittest.main()
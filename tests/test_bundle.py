@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Tests for the compiled content bundle."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.bundle import BundleError, ContentBundle, build_bundle
+
+
+class TestContentBundle(unittest.TestCase):
+    """Test suite for build_bundle and ContentBundle."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = Path(self.tmp.name) / "data"
+        (self.data / "quizzes").mkdir(parents=True)
+        self._write("course.json", {"title": "C", "modules": [{"id": "m1"}]})
+        self._write("quizzes/q.json", {"questions": [{"choices": ["a", "b"], "answer_index": 1}]})
+        self._write("progress.json", {"last_route": "boot"})
+        self.out = Path(self.tmp.name) / "content.bundle"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, rel, data):
+        (self.data / rel).write_text(json.dumps(data), encoding="utf-8")
+
+    def test_build_and_lookup(self):
+        """Test that a built bundle serves content files by their data path."""
+        self.assertEqual(build_bundle(self.data, self.out), 2)
+        bundle = ContentBundle(self.out, self.data)
+        self.assertEqual(bundle.paths(), ["course.json", "quizzes/q.json"])
+        self.assertEqual(bundle.lookup(str(self.data / "course.json"))["modules"][0]["id"], "m1")
+        self.assertIsNone(bundle.lookup(str(self.data / "progress.json")))
+
+        # Shipped builds may omit loose files entirely.
+        os.remove(self.data / "course.json")
+        self.assertEqual(bundle.lookup(str(self.data / "course.json"))["title"], "C")
+        bundle.close()
+
+    def test_edited_loose_file_falls_back(self):
+        """Test that a loose file edited after the build is not served from the bundle."""
+        build_bundle(self.data, self.out)
+        self._write("quizzes/q.json", {"questions": [{"choices": ["a", "b", "c"], "answer_index": 2}]})
+        bundle = ContentBundle(self.out, self.data)
+        self.assertIsNone(bundle.lookup(str(self.data / "quizzes/q.json")))
+        bundle.close()
+
+    def test_invalid_content_fails_build(self):
+        """Test that invalid content fails the build and leaves no bundle."""
+        self._write("quizzes/bad.json", {"questions": [{"choices": ["a"], "answer_index": 3}]})
+        with self.assertRaises(BundleError):
+            build_bundle(self.data, self.out)
+        self.assertFalse(self.out.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared content cache."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.cache import ContentCache, get_content_cache
+from src.core.io import load_json
+
+
+class TestContentCache(unittest.TestCase):
+    """Test suite for ContentCache and the cached loaders."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load(self, path):
+        self.calls += 1
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+
+    def _write(self, name, data):
+        p = self.dir / name
+        p.write_text(json.dumps(data), encoding="utf-8")
+        return p
+
+    def test_hit_until_file_changes(self):
+        """Test that a cached file is served until it changes on disk."""
+        cache = ContentCache()
+        p = self._write("a.json", {"v": 1})
+        self.assertEqual(cache.get(str(p), self._load), {"v": 1})
+        self.assertEqual(cache.get(str(p), self._load), {"v": 1})
+        self.assertEqual(self.calls, 1)
+
+        p.write_text(json.dumps({"v": 22}), encoding="utf-8")
+        self.assertEqual(cache.get(str(p), self._load), {"v": 22})
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.stale), (1, 2, 1))
+
+    def test_same_size_edit_detected_by_mtime(self):
+        """Test that an edit keeping the file size is detected by its mtime."""
+        cache = ContentCache()
+        p = self._write("a.json", {"v": 1})
+        cache.get(str(p), self._load)
+        p.write_text(json.dumps({"v": 2}), encoding="utf-8")
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(cache.get(str(p), self._load), {"v": 2})
+
+    def test_bounded_by_entries_and_bytes(self):
+        """Test that the cache evicts past its entry and byte limits."""
+        cache = ContentCache(max_entries=2)
+        paths = [self._write(f"{i}.json", {"i": i}) for i in range(3)]
+        for p in paths:
+            cache.get(str(p), self._load)
+        self.assertEqual(cache.stats().entries, 2)
+        self.assertEqual(cache.stats().evictions, 1)
+
+        big = ContentCache(max_bytes=paths[0].stat().st_size * 2)
+        for p in paths:
+            big.get(str(p), self._load)
+        self.assertLessEqual(big.stats().bytes, big.max_bytes)
+
+    def test_load_json_uses_shared_cache(self):
+        """Test that load_json goes through the shared cache unless told not to."""
+        p = self._write("spec.json", {"title": "Quiz"})
+        before = get_content_cache().stats().hits
+        first = load_json(str(p))
+        self.assertIs(load_json(str(p)), first)
+        self.assertEqual(get_content_cache().stats().hits, before + 1)
+        self.assertIsNot(load_json(str(p), use_cache=False), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
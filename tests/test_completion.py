@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests for bitset completion tracking."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.completion import Catalog, Completion, as_lists, course_items, load_catalog
+
+
+COURSE = {"modules": [
+    {"id": "m1"},
+    {"id": "m2", "problemsets": ["m2_ps1", "m2_ps2"]},
+]}
+
+
+class TestCatalog(unittest.TestCase):
+    """Test suite for the ordinal registry."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.course = self.root / "course.json"
+        self.ordinals = self.root / "ordinals.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_course(self, course):
+        self.course.write_text(json.dumps(course), encoding="utf-8")
+
+    def test_items_follow_course_order(self):
+        """Default ids come from module ids; explicit lists override them."""
+        items = course_items(COURSE)
+        self.assertEqual(items["lessons"], [("m1", "m1_lesson"), ("m2", "m2_lesson")])
+        self.assertEqual([i for _, i in items["problemsets"]], ["m1_ps1", "m2_ps1", "m2_ps2"])
+        self.assertEqual(items["hackathons"], [])
+
+    def test_ordinals_are_append_only(self):
+        """Inserting or removing modules never moves an existing ordinal."""
+        self._write_course(COURSE)
+        first = load_catalog(self.course, self.ordinals)
+        self._write_course({"modules": [{"id": "m0"}, COURSE["modules"][1]]})
+        second = load_catalog(self.course, self.ordinals)
+        self.assertEqual(second.ordinal("lessons", "m2_lesson"), first.ordinal("lessons", "m2_lesson"))
+        self.assertEqual(second.ordinal("lessons", "m0_lesson"), 2)
+        self.assertEqual(second.totals["lessons"], 2)          # m1 is no longer live
+        self.assertEqual(json.loads(self.ordinals.read_text(encoding="utf-8"))["lessons"],
+                         ["m1_lesson", "m2_lesson", "m0_lesson"])
+
+
+class TestCompletion(unittest.TestCase):
+    """Test suite for Completion bitsets."""
+
+    def setUp(self):
+        self.catalog = Catalog({"lessons": [f"l{n}" for n in range(2000)], "quizzes": ["q0", "q1"]})
+
+    def test_add_and_membership(self):
+        """add() reports new items; has() answers from the bitset."""
+        c = Completion(self.catalog)
+        self.assertTrue(c.add("lessons", "l1500"))
+        self.assertFalse(c.add("lessons", "l1500"))
+        self.assertTrue(c.has("lessons", "l1500"))
+        self.assertFalse(c.has("lessons", "l1499"))
+        self.assertFalse(c.has("quizzes", "q0"))
+
+    def test_percent(self):
+        """Percentages count only items of the current course."""
+        c = Completion(self.catalog)
+        for n in range(500):
+            c.add("lessons", f"l{n}")
+        c.add("quizzes", "q1")
+        c.add("quizzes", "unknown")
+        self.assertEqual(c.percent("lessons"), 25.0)
+        self.assertEqual(c.percent("quizzes"), 50.0)
+        self.assertAlmostEqual(c.percent(), 100.0 * 501 / 2002)
+
+    def test_lossless_round_trip(self):
+        """Old lists convert to bitsets and back, unknown ids included."""
+        lists = {"lessons": ["l3", "l1999", "retired"], "quizzes": [], "hackathons": ["h1"]}
+        c = Completion.from_lists(lists, self.catalog)
+        encoded = json.loads(json.dumps(c.encode()))
+        back = Completion.decode(encoded, self.catalog)
+        self.assertEqual(back.to_lists(), lists)
+        self.assertEqual(back.count("lessons"), 2)
+        self.assertEqual(as_lists(encoded, self.catalog), lists)
+        self.assertEqual(as_lists(lists, self.catalog), lists)
+
+    def test_encoding_is_compact(self):
+        """A thousand completions fit in a few hundred bytes."""
+        c = Completion.from_lists({"lessons": [f"l{n}" for n in range(0, 2000, 2)]}, self.catalog)
+        self.assertLess(len(json.dumps(c.encode())), 400)
+
+    def test_module_percent(self):
+        """Per-module progress uses the catalog's module masks."""
+        items = course_items(COURSE)
+        catalog = Catalog({kind: [i for _, i in pairs] for kind, pairs in items.items()}, items)
+        c = Completion.from_lists({"lessons": ["m2_lesson"], "problemsets": ["m2_ps2"]}, catalog)
+        self.assertEqual(c.module_percent("m2"), 40.0)
+        self.assertEqual(c.module_percent("m1"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Tests for content-addressed test fixtures."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core.grader import grade_problem
+from src.engine import fixtures
+from src.engine.autograder import grade_code
+from src.engine.fixtures import FixtureError, add_fixture, content_equals, fixture_path, verify
+
+
+class TestFixtures(unittest.TestCase):
+    """Test suite for fixture storage and grading with fixtures."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "fixtures"
+        patcher = mock.patch.object(fixtures, "FIXTURES_DIR", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _add(self, data, compress=False):
+        src = Path(self.tmp.name) / "src.dat"
+        src.write_bytes(data)
+        return add_fixture(src, compress=compress)
+
+    def test_add_is_content_addressed(self):
+        """Same content gives the same reference and is stored once."""
+        ref = self._add(b"1 2 3\n")
+        self.assertTrue(ref.startswith("sha256:"))
+        self.assertEqual(self._add(b"1 2 3\n", compress=True), ref)
+        self.assertEqual(len(list(self.root.iterdir())), 1)
+        self.assertTrue(verify(ref))
+
+    def test_compressed_fixture(self):
+        """Compressed fixtures compare and verify on their uncompressed content."""
+        data = b"x" * 200_000
+        ref = self._add(data, compress=True)
+        path = fixture_path(ref)
+        self.assertEqual(path.suffix, ".gz")
+        self.assertTrue(content_equals(path, data))
+        self.assertFalse(content_equals(path, data + b"x"))
+        self.assertTrue(verify(ref))
+
+    def test_content_equals_raw(self):
+        """Raw fixtures compare chunk by chunk."""
+        data = bytes(range(256)) * 1000
+        path = fixture_path(self._add(data))
+        self.assertTrue(content_equals(path, data))
+        self.assertFalse(content_equals(path, data[:-1] + b"\x00"))
+
+    def test_bad_reference(self):
+        """Malformed and unknown references raise FixtureError."""
+        with self.assertRaises(FixtureError):
+            fixture_path("md5:abc")
+        with self.assertRaises(FixtureError):
+            fixture_path("sha256:" + "0" * 64)
+
+    def test_grade_problem_with_input_fixture(self):
+        """Function problems can take their argument from a fixture."""
+        numbers = list(range(50_000))
+        ref = self._add(json.dumps([numbers]).encode("utf-8"))
+        spec = {"function": "total", "tests": [
+            {"input_fixture": ref, "decode": "json", "expected": sum(numbers)},
+        ]}
+        ok, _ = grade_problem("def total(xs):\n    return sum(xs)\n", spec)
+        self.assertTrue(ok)
+        ok, msg = grade_problem("def total(xs):\n    return 0\n", spec)
+        self.assertFalse(ok)
+        self.assertIn("<fixture sha256:", msg)
+
+    def test_grade_problem_buffer_decode(self):
+        """The buffer decode hands the function a read-only view of the data."""
+        ref = self._add(b"a\nb\nc\n")
+        spec = {"function": "count_lines", "tests": [{"input_fixture": ref, "decode": "buffer", "expected": 3}]}
+        ok, msg = grade_problem("def count_lines(buf):\n    return bytes(buf).count(b'\\n')\n", spec)
+        self.assertTrue(ok, msg)
+
+    def test_fixture_input_not_shared_between_tests(self):
+        """A function that mutates its argument can't change the input of later tests."""
+        lines_ref = self._add(b"a\nb\nc\n")
+        json_ref = self._add(json.dumps([[3, 1, 2]]).encode("utf-8"))
+        code = "def drain(xs):\n    n = len(xs)\n    xs.clear()\n    return n\n"
+        for ref, decode in ((lines_ref, "lines"), (json_ref, "json")):
+            spec = {"function": "drain", "tests": [
+                {"input_fixture": ref, "decode": decode, "expected": 3},
+                {"input_fixture": ref, "decode": decode, "expected": 3},
+            ]}
+            ok, msg = grade_problem(code, spec)
+            self.assertTrue(ok, msg)
+
+    def test_grade_problem_missing_fixture(self):
+        """A missing fixture is reported as a problem configuration error."""
+        spec = {"function": "f", "tests": [{"input_fixture": "sha256:" + "1" * 64, "expected": 1}]}
+        ok, msg = grade_problem("def f(x):\n    return 1\n", spec)
+        self.assertFalse(ok)
+        self.assertIn("misconfigured", msg)
+
+    def test_grade_code_with_stdin_and_expected_fixtures(self):
+        """Challenges can read stdin from a fixture and compare stdout against one."""
+        lines = "".join(f"{i}\n" for i in range(20_000)).encode("utf-8")
+        doubled = "".join(f"{2 * i}\n" for i in range(20_000)).encode("utf-8")
+        challenge = {
+            "stdin_fixture": self._add(lines, compress=True),
+            "tests": [{"type": "stdout_exact", "fixture": self._add(doubled)}],
+        }
+        code = "import sys\nfor line in sys.stdin:\n    print(2 * int(line))\n"
+        r = grade_code(challenge, code)
+        self.assertTrue(r.passed, r.feedback)
+        r = grade_code(challenge, "import sys\nfor line in sys.stdin:\n    print(int(line))\n")
+        self.assertFalse(r.passed)
+
+    def test_file_equals_fixture_streams(self):
+        """Output files are compared with a fixture chunk by chunk, CRLF read as LF."""
+        text = "".join(f"line {i}\n" for i in range(30_000))
+        ref = self._add(text.encode("utf-8"), compress=True)
+        challenge = {"tests": [{"type": "file_equals", "path": "out.txt", "fixture": ref}]}
+        write = "with open('out.txt', 'w', newline={nl!r}) as f:\n    f.write({text!r})\n"
+        for nl in ("\n", "\r\n"):
+            r = grade_code(challenge, write.format(nl=nl, text=text))
+            self.assertTrue(r.passed, r.feedback)
+        r = grade_code(challenge, write.format(nl="\n", text=text[:-1]))
+        self.assertFalse(r.passed)
+
+
+if __name__ == "__main__":
+    unittest.main()
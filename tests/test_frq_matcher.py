@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Tests for the compiled FRQ rubric matcher."""
+
+import unittest
+from src.engine.frq_matcher import AhoCorasick, CompiledRubric, bounded_edit_distance, compile_rubric
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Test suite for exact multi-pattern search."""
+
+    def test_overlapping_patterns(self):
+        """Test that overlapping and nested patterns are all found."""
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        self.assertEqual(ac.find("ushers"), {0, 1, 3})
+
+    def test_substring_semantics(self):
+        """Test that patterns match inside longer words like `in` did."""
+        ac = AhoCorasick(["store", "print('hello')"])
+        self.assertEqual(ac.find("it stores x; print('hello')"), {0, 1})
+
+
+class TestFuzzyMatching(unittest.TestCase):
+    """Test suite for typo-tolerant keyword matching."""
+
+    def test_bounded_edit_distance(self):
+        """Test the early-exit edit distance, including swapped letters."""
+        self.assertEqual(bounded_edit_distance("unterminted", "unterminated", 2), 1)
+        self.assertEqual(bounded_edit_distance("variabel", "variable", 1), 1)
+        self.assertIsNone(bounded_edit_distance("variable", "value", 1))
+
+    def test_short_keywords_stay_exact(self):
+        """Test that short keywords get no typo budget."""
+        match = CompiledRubric(["loop"]).match("a lop")
+        self.assertEqual(match.matched, [])
+
+    def test_multiword_keyword(self):
+        """Test that multi-word keywords are matched across token windows."""
+        match = CompiledRubric(["missing quote"]).match("there is a mising quote here")
+        self.assertEqual(match.fuzzy, {"missing quote": "mising quote"})
+
+    def test_fix_strings_are_exact(self):
+        """Test that required fix strings never match fuzzily."""
+        rubric = CompiledRubric(["syntax"], ['print("hello")'])
+        self.assertFalse(rubric.match('print("helo")').fix_ok)
+        self.assertTrue(rubric.match('PRINT("Hello")').fix_ok)
+
+    def test_compiled_once(self):
+        """Test that identical rubrics share one compiled automaton."""
+        frq = {"keywords": ["a", "b"], "expected_fix_contains": ["c"]}
+        self.assertIs(compile_rubric(frq), compile_rubric(dict(frq)))
+
+    def test_batch(self):
+        """Test matching a batch of answers."""
+        rubric = CompiledRubric(["variable", "string"])
+        results = rubric.match_batch(["a variabel", "a string", ""])
+        self.assertEqual([r.matched for r in results], [["variable"], ["string"], []])
+
+
+if __name__ == '__main__':
+    unittest.main()
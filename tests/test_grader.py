@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests for function-problem grading."""
+
+import unittest
+from src.core.grader import grade_problem
+
+
+SPEC = {
+    "function": "check_positive",
+    "tests": [
+        {"input": [1], "expected": "YES"},
+        {"input": [-1], "expected": "NO"},
+    ],
+}
+
+
+class TestGradeProblem(unittest.TestCase):
+    """Test suite for grade_problem."""
+
+    def test_correct_solution_passes(self):
+        """Test that a correct solution passes all tests."""
+        code = "def check_positive(x):\n    return 'YES' if x > 0 else 'NO'\n"
+        ok, msg = grade_problem(code, SPEC)
+        self.assertTrue(ok)
+        self.assertIn("All tests passed", msg)
+
+    def test_missing_function(self):
+        """Test that a missing required function is reported."""
+        ok, msg = grade_problem("def other(x):\n    return x\n", SPEC)
+        self.assertFalse(ok)
+        self.assertIn("Missing required function: check_positive()", msg)
+
+    def test_crash_before_tests(self):
+        """Test that top-level crashes are reported before any test runs."""
+        ok, msg = grade_problem("raise ValueError('boom')\n", SPEC)
+        self.assertFalse(ok)
+        self.assertIn("crashed before tests ran", msg)
+        self.assertIn("boom", msg)
+
+    def test_large_return_value_is_summarized(self):
+        """Test that a large wrong result comes back as a bounded summary and digest."""
+        code = "def check_positive(x):\n    return list(range(100000))\n"
+        ok, msg = grade_problem(code, SPEC)
+        self.assertFalse(ok)
+        self.assertIn("len 100000", msg)
+        self.assertIn("digest", msg)
+        self.assertLess(len(msg), 400)
+
+    def test_infinite_loop_times_out(self):
+        """Test that a hanging function fails instead of blocking the grader."""
+        code = "def check_positive(x):\n    while True:\n        pass\n"
+        ok, msg = grade_problem(code, dict(SPEC, timeout_sec=0.5))
+        self.assertFalse(ok)
+        self.assertIn("Timed out", msg)
+
+    def test_forbidden_keyword(self):
+        """Test that forbidden keywords are rejected."""
+        code = "def check_positive(x):\n    for _ in [1]:\n        return 'YES' if x > 0 else 'NO'\n"
+        ok, msg = grade_problem(code, dict(SPEC, forbidden_keywords=["for "]))
+        self.assertFalse(ok)
+        self.assertIn("forbids using: for ", msg)
+
+
+    def test_runs_outside_the_app_directory(self):
+        """Test that student code runs in a scratch directory, away from the app's files."""
+        code = ("import os\n"
+                "def check_positive(x):\n"
+                "    return 'NO' if os.path.exists('src') else ('YES' if x > 0 else 'NO')\n")
+        ok, msg = grade_problem(code, SPEC)
+        self.assertTrue(ok, msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -100,6 +100,35 @@ class TestGrading(unittest.TestCase):
         score_pass, _ = grade_quiz(quiz, answers_pass)
         self.assertGreater(score_pass, 0)
     
+    def test_grade_misspelled_keyword(self):
+        """Test that a small typo in a keyword still earns credit."""
+        quiz = {
+            "mcq": [],
+            "frq": {"keywords": ["unterminated", "string"]}
+        }
+        answers = {
+            "mcq": [],
+            "frq": "The strng is unterminted"
+        }
+        score, details = grade_quiz(quiz, answers)
+        self.assertEqual(score, 20)
+        self.assertEqual(details["frq"]["fuzzy"], {"unterminated": "unterminted", "string": "strng"})
+    
+    def test_grade_empty_rubric_entries(self):
+        """Test that empty keywords and fix strings always match, as a substring check did."""
+        quiz = {
+            "mcq": [],
+            "frq": {"keywords": ["string", ""], "expected_fix_contains": [""]}
+        }
+        answers = {
+            "mcq": [],
+            "frq": "The string is missing a quote"
+        }
+        score, details = grade_quiz(quiz, answers)
+        self.assertEqual(score, 20)
+        self.assertEqual(details["frq"]["matched"], ["string", ""])
+        self.assertTrue(details["frq"]["fix_ok"])
+    
     def test_grade_invalid_input(self):
         """Test grading with invalid input."""
         score, details = grade_quiz(None, {})
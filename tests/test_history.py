@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Tests for rolled-up quiz attempt history."""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from src.engine import progress
+from src.engine.progress import archived_attempts, record_attempt
+
+
+class TestRecordAttempt(unittest.TestCase):
+    """Test suite for the recent-attempts ring, stats and archive."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = Path(self.tmp.name) / "history.gz"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_stats_roll_up(self):
+        """count, best, mean and last are kept per module."""
+        p = {}
+        for score in (40, 80, 60):
+            record_attempt(p, 0, score, passed=False)
+        record_attempt(p, 1, 95, passed=True)
+        s = p["stats"]["0"]
+        self.assertEqual((s["count"], s["best"], s["mean"], s["last"]), (3, 80, 60.0, 60))
+        self.assertIsNone(s["time_to_pass"])
+        self.assertEqual(p["stats"]["1"]["attempts_to_pass"], 1)
+        self.assertEqual(p["attempts"], 4)
+
+    def test_mean_does_not_drift(self):
+        """The mean is exact however many attempts are rolled into it."""
+        p = {}
+        scores = [(i * 37) % 101 for i in range(500)]
+        for score in scores:
+            record_attempt(p, 0, score, passed=False)
+        s = p["stats"]["0"]
+        self.assertEqual(s["total"], sum(scores))
+        self.assertEqual(s["mean"], round(sum(scores) / len(scores), 2))
+
+    def test_time_to_pass(self):
+        """Seconds from the first attempt to the first pass; later passes don't change it."""
+        times = iter([datetime(2024, 1, 1, 10, 0), datetime(2024, 1, 1, 10, 5), datetime(2024, 1, 1, 11, 0)])
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(times)
+
+        p = {}
+        with mock.patch.object(progress, "datetime", Clock):
+            record_attempt(p, 0, 50)
+            record_attempt(p, 0, 95)
+            record_attempt(p, 0, 100)
+        self.assertEqual(p["stats"]["0"]["time_to_pass"], 300)
+        self.assertEqual(p["stats"]["0"]["attempts_to_pass"], 2)
+
+    def test_history_stays_bounded(self):
+        """Old attempts move to the gzip archive in batches; none are lost."""
+        p = {}
+        for i in range(100):
+            record_attempt(p, i % 3, i, archive=self.archive)
+        self.assertLessEqual(len(p["history"]), 2 * progress.recent_attempts())
+        archived = list(archived_attempts(self.archive))
+        self.assertEqual([a["n"] for a in archived + p["history"]], list(range(1, 101)))
+        self.assertEqual(sum(s["count"] for s in p["stats"].values()), 100)
+        self.assertLess(len(json.dumps(p["history"])), 5000)
+
+    def test_legacy_history_upgraded(self):
+        """Progress saved before stats existed is rolled up on the next attempt."""
+        p = {"history": [{"module_index": 0, "score": s, "ts": "2024-01-01T10:00:00"} for s in (20, 95)]}
+        record_attempt(p, 0, 70)
+        s = p["stats"]["0"]
+        self.assertEqual((s["count"], s["best"], s["last"], s["attempts_to_pass"]), (3, 95, 70, 2))
+        self.assertEqual([a["n"] for a in p["history"]], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
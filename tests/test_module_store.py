@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Tests for per-module lazy loading and stage prefetch."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.cache import get_content_cache
+from src.engine.module_store import ModuleStore, next_stage, split_course
+
+
+COURSE = {
+    "title": "T",
+    "modules": [
+        {"id": "m1", "title": "One", "hack_prompt": "h1", "lesson_html": "<p>1</p>",
+         "quiz": {"mcq": [], "frq": {"keywords": ["colon"]}}, "error_pack": [{"title": "e"}]},
+        {"id": "m2", "title": "Two", "lesson_html": "<p>2</p>", "coding_challenge": {"title": "c"}},
+    ],
+}
+
+
+class TestModuleStore(unittest.TestCase):
+    """Test suite for ModuleStore and split_course."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.course_path = self.dir / "course.json"
+        self.course_path.write_text(json.dumps(COURSE), encoding="utf-8")
+        self.lessons = self.dir / "lessons"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_next_stage_order(self):
+        """Test that stages follow lesson, quiz, debug, challenge, then the next module."""
+        self.assertEqual(next_stage(0, "lesson"), (0, "quiz"))
+        self.assertEqual(next_stage(0, "debug"), (0, "challenge"))
+        self.assertEqual(next_stage(0, "challenge"), (1, "lesson"))
+
+    def test_split_then_load_one_stage(self):
+        """Test that a split course loads only the requested stage of a module."""
+        self.assertEqual(split_course(self.course_path, self.lessons), 5)
+        outline = json.loads(self.course_path.read_text(encoding="utf-8"))
+        self.assertEqual(outline["modules"][0], {"id": "m1", "title": "One", "hack_prompt": "h1"})
+
+        store = ModuleStore(outline, self.lessons)
+        lesson = store.module(0, "lesson")
+        self.assertEqual(lesson["lesson_html"], "<p>1</p>")
+        self.assertNotIn("quiz", lesson)
+        self.assertEqual(store.module(1, "challenge")["coding_challenge"], {"title": "c"})
+        self.assertEqual(store.module(1, "debug"), {"id": "m2", "title": "Two"})
+        store.shutdown()
+
+    def test_unsplit_course_falls_back_to_inline_fields(self):
+        """Test that a course that was never split serves its inline fields."""
+        store = ModuleStore(COURSE, self.lessons)
+        self.assertEqual(store.module(0, "debug")["error_pack"], [{"title": "e"}])
+        store.shutdown()
+
+    def test_prefetch_warms_cache(self):
+        """Test that prefetching the next stage makes its load a cache hit."""
+        split_course(self.course_path, self.lessons)
+        store = ModuleStore(json.loads(self.course_path.read_text(encoding="utf-8")), self.lessons)
+        store.prefetch_after(0, "lesson").result(timeout=5)
+        hits = get_content_cache().stats().hits
+        self.assertIn("frq", store.module(0, "quiz")["quiz"])
+        self.assertEqual(get_content_cache().stats().hits, hits + 1)
+        self.assertIsNone(store.prefetch_after(1, "challenge"))
+        store.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
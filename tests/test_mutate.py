@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Tests for AST-mutation debug variant generation."""
+
+import unittest
+
+from src.engine.mutate import generate_variants, mutants
+
+
+class TestMutants(unittest.TestCase):
+    """Test suite for candidate generation."""
+
+    def test_mutation_kinds(self):
+        """Each mutation family produces its expected rewrite."""
+        found = {m[0].description: code for code, m in mutants(
+            "def f(xs, n):\n"
+            "    if len(xs) < n and n == 2:\n"
+            "        return ', '.join(xs) + '!'\n"
+            "    return 'x: ' + str(n)\n")}
+        self.assertIn("len(xs) < n -> len(xs) <= n", found)
+        self.assertIn("n == 2 -> n != 2", found)
+        self.assertIn("2 -> 3", found)
+        self.assertIn("len(xs) < n and n == 2 -> len(xs) < n or n == 2", found)
+        self.assertIn("', '.join(xs) -> ''.join(xs)", found)
+        self.assertIn("'x: ' + str(n) -> 'x' + str(n)", found)
+        self.assertIn("return 'x: ' + str(n) -> 'x: ' + str(n)", found)
+
+    def test_distinct_and_second_order(self):
+        """Candidates are unique, never the original, and pairs add more."""
+        source = "def f(a, b):\n    return a + b * 2\n"
+        first = mutants(source)
+        codes = [code for code, _ in first]
+        self.assertEqual(len(codes), len(set(codes)))
+        self.assertNotIn("def f(a, b):\n    return a + b * 2", codes)
+        second = mutants(source, order=2)
+        self.assertGreater(len(second), len(first))
+        self.assertTrue(any(len(muts) == 2 for _, muts in second))
+
+
+class TestGenerateVariants(unittest.TestCase):
+    """Test suite for pool validation of candidates."""
+
+    SPEC = {
+        "required_function": "count_to",
+        "reference_solution": "def count_to(n):\n    i = 0\n    while i < n:\n        i += 1\n    return i\n",
+        "tests": [{"input": [3], "expected": 3}, {"input": [0], "expected": 0}],
+    }
+
+    def test_keeps_failing_drops_timeouts(self):
+        """Only deterministic failures are kept, with their failing tests listed."""
+        variants, stats = generate_variants(self.SPEC, jobs=2, timeout_sec=0.5)
+        self.assertEqual(stats["kept"], len(variants))
+        self.assertEqual(stats["candidates"],
+                         stats["kept"] + stats["equivalent"] + stats["flaky"] + stats["timeout"])
+        self.assertGreaterEqual(stats["timeout"], 1)        # i -= 1 never finishes
+        codes = {v.broken_code: v for v in variants}
+        broken = "def count_to(n):\n    i = 0\n    while i < n:\n        i += 2\n    return i\n"
+        self.assertIn(broken, codes)
+        self.assertEqual(codes[broken].failing_tests, [0])
+
+    def test_equivalent_mutants_dropped(self):
+        """Mutants the tests cannot tell apart from the reference are not kept."""
+        spec = {"function": "last_digit", "reference_solution": "def last_digit(x):\n    return x % 10\n",
+                "tests": [{"input": [3], "expected": 3}, {"input": [7], "expected": 7}]}
+        variants, stats = generate_variants(spec, jobs=1, timeout_sec=0.5)
+        self.assertEqual(stats["equivalent"], 2)           # x % 11 and x % 9
+        self.assertNotIn("def last_digit(x):\n    return x % 11\n", [v.broken_code for v in variants])
+
+    def test_reference_must_pass(self):
+        """A reference solution that fails its own tests is rejected."""
+        spec = dict(self.SPEC, tests=[{"input": [3], "expected": 4}])
+        with self.assertRaises(ValueError):
+            generate_variants(spec, jobs=1, timeout_sec=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
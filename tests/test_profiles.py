@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite multi-profile progress store."""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core import profiles, progress
+from src.core.journal import Journal
+from src.core.profiles import ProfileBackend, ProfileDB, ProfileError
+from src.engine.progress import recent_attempts
+
+
+class TestProfileDB(unittest.TestCase):
+    """Test suite for ProfileDB and its backend adapter."""
+
+    PAGE_APP = {"last_route": "modules", "unlocked_module": 3,
+                "completed": {"lessons": ["m1_lesson", "m2_lesson"], "quizzes": ["m1_quiz"], "debugs": []},
+                "hackathons_unlock_after_module": 3}
+    MAIN_APP = {"module_index": 2, "terminal_unlocked": {"commands": ["help", "status", "run"]},
+                "history": [{"module_index": 0, "score": 95, "ts": "2024-01-01T10:00:00"},
+                            {"module_index": 1, "score": 80, "ts": "2024-01-02T10:00:00"}]}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.db = ProfileDB(self.root / "profiles.db")
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_wal_mode(self):
+        """The database is opened in WAL mode."""
+        mode = self.db._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_migrates_both_schemas(self):
+        """A progress.json holding both apps' keys round-trips into a profile."""
+        path = self.root / "progress.json"
+        Journal(path).compact({**self.PAGE_APP, **self.MAIN_APP})
+        self.assertTrue(self.db.migrate_json(path, "alice"))
+        state = self.db.load("alice")
+        self.assertEqual([h.pop("n") for h in state["history"]], [1, 2])
+        self.assertEqual(state.pop("attempts"), 2)
+        self.assertEqual(state, {**self.PAGE_APP, **self.MAIN_APP})
+        self.assertFalse(self.db.migrate_json(self.root / "missing.json", "bob"))
+
+    def test_profiles_are_isolated(self):
+        """Saving one profile leaves the others untouched."""
+        self.db.save("alice", self.PAGE_APP)
+        self.db.save("bob", {"last_route": "boot", "unlocked_module": 1, "completed": {"lessons": []}})
+        self.assertEqual(self.db.load("bob")["completed"], {"lessons": []})
+        self.assertEqual(self.db.load("alice")["unlocked_module"], 3)
+        self.db.delete("alice")
+        self.assertEqual(self.db.profiles(), ["bob"])
+        with self.assertRaises(ProfileError):
+            self.db.load("alice")
+
+    def test_saves_merge_across_instances(self):
+        """Two instances on one profile keep each other's completions and attempts."""
+        other = ProfileDB(self.root / "profiles.db")
+        self.addCleanup(other.close)
+        self.db.save("alice", {**self.PAGE_APP, **self.MAIN_APP})
+        mine, theirs = self.db.load("alice"), other.load("alice")
+        mine["completed"]["debugs"].append("m1_debug")
+        mine["history"].append({"module_index": 2, "score": 70, "ts": "a"})
+        theirs["completed"]["lessons"].append("m3_lesson")
+        theirs["unlocked_module"] = 2       # stale: must not move progress back
+        theirs["history"].append({"module_index": 2, "score": 100, "ts": "b"})
+        self.db.save("alice", mine)
+        other.save("alice", theirs)
+        merged = self.db.load("alice")
+        self.assertIn("m1_debug", merged["completed"]["debugs"])
+        self.assertIn("m3_lesson", merged["completed"]["lessons"])
+        self.assertEqual(merged["unlocked_module"], 3)
+        self.assertEqual([h["ts"] for h in merged["history"][2:]], ["a", "b"])
+        self.db.save("alice", merged)       # re-saving what was loaded adds nothing
+        self.assertEqual(len(self.db.load("alice")["history"]), 4)
+
+    def test_recent_attempts_only(self):
+        """Once stats are kept, load() returns just the recent attempts, numbered."""
+        history = [{"module_index": 0, "score": i, "ts": str(i)} for i in range(30)]
+        self.db.save("alice", {"stats": {}, "history": history})
+        state = self.db.load("alice")
+        self.assertEqual(len(state["history"]), recent_attempts())
+        self.assertEqual((state["history"][-1]["n"], state["attempts"]), (30, 30))
+        state["history"] = state["history"][-5:] + [{"n": 31, "module_index": 0, "score": 99, "ts": "x"}]
+        self.db.save("alice", state)
+        self.assertEqual(self.db.load("alice")["history"][-1]["score"], 99)
+        self.assertEqual(self.db.load("alice")["attempts"], 31)
+
+    def test_concurrent_writers(self):
+        """Writes from several threads and connections are all kept."""
+        dbs = [ProfileDB(self.root / "profiles.db") for _ in range(3)]
+        for db in dbs:
+            self.addCleanup(db.close)
+
+        def work(n, db):
+            for i in range(20):
+                db.save("alice", {"completed": {"lessons": [f"{n}-{i}"]}})
+
+        threads = [threading.Thread(target=work, args=(n, db)) for n, db in enumerate(dbs + [self.db])]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self.db.load("alice")["completed"]["lessons"]), 80)
+
+    def test_active_profile(self):
+        """The active profile is remembered and can be overridden per session."""
+        self.assertEqual(self.db.active(), "default")
+        self.db.set_active("bob")
+        other = ProfileDB(self.root / "profiles.db")
+        self.addCleanup(other.close)
+        self.assertEqual(other.active(), "bob")
+        with mock.patch.dict("os.environ", {"CODEQUEST_PROFILE": "carol"}):
+            self.assertEqual(self.db.active(), "carol")
+            with self.assertRaises(ProfileError):
+                progress.switch_profile("bob")
+
+    def test_backend_imports_legacy_file(self):
+        """Only the first new profile starts from the existing progress.json."""
+        legacy = self.root / "progress.json"
+        legacy.write_text(json.dumps(self.MAIN_APP), encoding="utf-8")
+        with mock.patch.object(profiles, "LEGACY_PROGRESS", legacy):
+            state = ProfileBackend(self.db, "alice").load({"module_index": 0, "history": [], "extra": 1})
+            self.assertEqual(state["module_index"], 2)
+            self.assertEqual(state["extra"], 1)
+            for name in ("bob", "carol"):
+                state = ProfileBackend(self.db, name).load({"module_index": 0, "history": []})
+                self.assertEqual((state["module_index"], state["history"]), (0, []))
+
+    def test_locked_database_fails_flush_and_retries(self):
+        """A write lock held by another instance fails the flush cleanly and leaves a retry scheduled."""
+        db = ProfileDB(self.root / "profiles.db", timeout=0.1)
+        self.addCleanup(db.close)
+        backend = ProfileBackend(db, "alice")
+        with mock.patch.object(progress, "progress_backend", return_value=backend):
+            store = progress.ProgressStore(self.root / "progress.json", delay_sec=60)
+        store.update(lambda p: p.__setitem__("last_route", "quiz"))
+        self.db._conn.execute("BEGIN IMMEDIATE")
+        try:
+            with self.assertRaises(OSError):
+                backend.save({"last_route": "debug"})
+            self.assertFalse(store.flush())
+            self.assertTrue(store.dirty)
+            self.assertIsNotNone(store._timer)
+        finally:
+            self.db._conn.execute("ROLLBACK")
+        self.assertTrue(store.flush())
+        self.assertEqual(self.db.load("alice")["last_route"], "quiz")
+
+    def test_backend_selected_by_config(self):
+        """progress_backend returns a profile only when sqlite is configured."""
+        path = self.root / "progress.json"
+        self.assertIsInstance(profiles.progress_backend(path), Journal)
+        with mock.patch.object(profiles, "get_config") as cfg, \
+                mock.patch.object(profiles, "get_profile_db", return_value=self.db):
+            cfg.return_value.get.return_value = "sqlite"
+            backend = profiles.progress_backend(path)
+        self.assertIsInstance(backend, ProfileBackend)
+        self.assertEqual(backend.name, "default")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Tests for the in-memory progress store and its journal."""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core import progress
+from src.core.journal import Journal, apply, diff
+from src.core.progress import ProgressStore
+
+
+class TestProgressStore(unittest.TestCase):
+    """Test suite for ProgressStore and the module-level helpers."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "progress.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _on_disk(self):
+        return Journal(self.path).load()
+
+    def test_creates_defaults(self):
+        """A missing file is created with the default progress."""
+        store = ProgressStore(self.path)
+        self.assertEqual(store.snapshot()["unlocked_module"], 1)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["last_route"], "boot")
+
+    def test_writes_are_coalesced(self):
+        """A burst of changes becomes one write after the quiet period."""
+        store = ProgressStore(self.path, delay_sec=0.05)
+        store.snapshot()
+        writes = store.writes
+        for i in range(50):
+            store.update(lambda p, i=i: p.__setitem__("last_route", f"r{i}"))
+        self.assertEqual(self._on_disk()["last_route"], "boot")   # nothing written yet
+        time.sleep(0.3)
+        self.assertEqual(store.writes, writes + 1)
+        self.assertEqual(self._on_disk()["last_route"], "r49")
+
+    def test_max_delay_bounds_staleness(self):
+        """Continuous changes are still written once max_delay_sec has passed."""
+        store = ProgressStore(self.path, delay_sec=0.1, max_delay_sec=0.2)
+        store.snapshot()
+        writes = store.writes
+        for i in range(12):     # never quiet for delay_sec
+            store.update(lambda p, i=i: p.__setitem__("last_route", f"r{i}"))
+            time.sleep(0.04)
+        self.assertGreater(store.writes, writes)
+        store.flush()
+
+    def test_flush_and_no_op_updates(self):
+        """flush() writes pending changes; updates returning False write nothing."""
+        store = ProgressStore(self.path, delay_sec=60)
+        store.update(lambda p: p.__setitem__("unlocked_module", 4))
+        self.assertTrue(store.flush())
+        self.assertEqual(self._on_disk()["unlocked_module"], 4)
+        store.update(lambda p: False)
+        self.assertFalse(store.dirty)
+        self.assertFalse(store.flush())
+
+    def test_snapshot_is_private(self):
+        """Editing a snapshot does not change the store."""
+        store = ProgressStore(self.path)
+        snap = store.snapshot()
+        snap["completed"]["lessons"].append("m1_lesson")
+        self.assertEqual(store.snapshot()["completed"]["lessons"], [])
+
+    def test_helpers_use_the_store(self):
+        """The module helpers read from memory and write behind."""
+        store = ProgressStore(self.path, delay_sec=60)
+        with mock.patch.object(progress, "_store", store):
+            progress.mark_completed("lessons", "m1_lesson")
+            progress.mark_completed("lessons", "m1_lesson")
+            progress.unlock_next_module(3)
+            progress.set_last_route("modules")
+            self.assertTrue(progress.hackathons_unlocked())
+            self.assertEqual(progress.load_progress()["completed"]["lessons"], ["m1_lesson"])
+            self.assertEqual(self._on_disk()["unlocked_module"], 1)
+            store.flush()
+        saved = self._on_disk()
+        self.assertEqual((saved["unlocked_module"], saved["last_route"]), (4, "modules"))
+
+    def test_completions_saved_as_bitsets(self):
+        """Old completion lists load unchanged and are written back encoded."""
+        Journal(self.path).compact({"unlocked_module": 2, "completed": {"lessons": ["m1_lesson", "old"]}})
+        store = ProgressStore(self.path, delay_sec=60)
+        with mock.patch.object(progress, "_store", store):
+            self.assertTrue(progress.is_completed("lessons", "old"))
+            progress.mark_completed("quizzes", "m1_quiz")
+            self.assertTrue(progress.is_completed("quizzes", "m1_quiz"))
+            store.flush()
+        completed = self._on_disk()["completed"]
+        self.assertIn("bits", completed)
+        self.assertEqual(ProgressStore(self.path).snapshot()["completed"],
+                         {"lessons": ["m1_lesson", "old"], "quizzes": ["m1_quiz"]})
+
+    def test_listeners_see_changes_only(self):
+        """Listeners get one event per real change, and none for no-ops."""
+        store = ProgressStore(self.path, delay_sec=60)
+        events = []
+        with mock.patch.object(progress, "_store", store):
+            remove = progress.add_listener(lambda *event: events.append(event))
+            progress.mark_completed("lessons", "m1_lesson")
+            progress.mark_completed("lessons", "m1_lesson")
+            progress.unlock_next_module(1)
+            progress.unlock_next_module(1)
+            progress.set_last_route("quiz")
+            progress.set_last_route("quiz")
+            progress.save_progress(store.snapshot())
+            remove()
+            progress.set_last_route("modules")
+            store.flush()
+        self.assertEqual(events, [("completed", "lessons", "m1_lesson"), ("unlocked", 2),
+                                  ("route_changed", "quiz"), ("reset",)])
+
+
+class TestJournal(unittest.TestCase):
+    """Test suite for snapshot + journal persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "state.json"
+        self.state = {"unlocked_module": 1, "completed": {"lessons": [], "quizzes": []}, "last_route": "boot"}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_diff_and_apply_round_trip(self):
+        """Applying a diff to the old state gives the new state."""
+        new = {"unlocked_module": 2, "completed": {"lessons": ["m1"], "debugs": []}}
+        ops = diff(self.state, new)
+        self.assertIn({"p": ["completed", "lessons"], "v": ["m1"]}, ops)
+        self.assertIn({"p": ["last_route"], "d": 1}, ops)
+        self.assertEqual(apply(json.loads(json.dumps(self.state)), ops), new)
+
+    def test_saves_append_only_changes(self):
+        """A save journals just the changed keys, and a reload replays them."""
+        j = Journal(self.path)
+        j.load(self.state)
+        j.compact(self.state)
+        snapshot = self.path.read_bytes()
+        self.state["last_route"] = "quiz"
+        self.assertEqual(j.save(self.state), 1)
+        self.assertEqual(j.save(self.state), 0)
+        self.assertEqual(self.path.read_bytes(), snapshot)
+        self.assertLess(j.journal_path.stat().st_size, 100)
+        self.assertEqual(Journal(self.path).load()["last_route"], "quiz")
+
+    def test_torn_record_is_dropped_and_compacted(self):
+        """A half-written last record is ignored and the journal rewritten."""
+        j = Journal(self.path)
+        j.load(self.state)
+        self.state["unlocked_module"] = 3
+        j.save(self.state)
+        with open(j.journal_path, "ab") as f:
+            f.write(b'{"ops": [{"p": ["unlocked_mod')
+        state = Journal(self.path).load()
+        self.assertEqual(state["unlocked_module"], 3)
+        self.assertEqual(j.journal_path.read_bytes(), b"")
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["unlocked_module"], 3)
+
+    def test_corrupt_middle_record_keeps_journal_aside(self):
+        """A bad record followed by valid ones moves the journal aside before compacting."""
+        j = Journal(self.path)
+        j.load(self.state)
+        self.state["unlocked_module"] = 2
+        j.save(self.state)
+        with open(j.journal_path, "ab") as f:
+            f.write(b'{"ops": [garbage\n{"ops": [{"p": ["unlocked_module"], "v": 5}]}\n')
+        state = Journal(self.path).load()
+        self.assertEqual(state["unlocked_module"], 2)
+        kept = list(self.path.parent.glob("state.json.journal.corrupt-*"))
+        self.assertEqual(len(kept), 1)
+        self.assertIn(b'"v": 5', kept[0].read_bytes())
+        self.assertEqual(j.journal_path.read_bytes(), b"")
+
+    def test_replay_after_compaction_is_idempotent(self):
+        """Records already folded into the snapshot can be replayed safely."""
+        j = Journal(self.path)
+        j.load(self.state)
+        self.state["completed"]["lessons"].append("m1")
+        j.save(self.state)
+        records = j.journal_path.read_bytes()
+        j.compact(self.state)
+        j.journal_path.write_bytes(records)     # crash between rename and truncate
+        self.assertEqual(Journal(self.path).load(), self.state)
+
+    def test_corrupt_snapshot_is_kept_aside(self):
+        """An unreadable snapshot is renamed, not overwritten."""
+        self.path.write_text('{"unlocked_module": 4, "compl', encoding="utf-8")
+        state = Journal(self.path).load({"unlocked_module": 1})
+        self.assertEqual(state, {"unlocked_module": 1})
+        kept = list(self.path.parent.glob("state.json.corrupt-*"))
+        self.assertEqual(len(kept), 1)
+        self.assertIn("unlocked_module", kept[0].read_text(encoding="utf-8"))
+
+    def test_compaction_threshold(self):
+        """The journal is folded into the snapshot after enough records."""
+        j = Journal(self.path, compact_records=5)
+        j.load(self.state)
+        for i in range(5):
+            self.state["last_route"] = f"r{i}"
+            j.save(self.state)
+        self.assertEqual(j.journal_path.read_bytes(), b"")
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["last_route"], "r4")
+
+
+if __name__ == "__main__":
+    unittest.main()
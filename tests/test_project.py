@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Tests for multi-file project execution."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from src.engine.project import ProjectWorkspace
+
+
+FILES = {
+    "main.py": "from game.rules import score\nprint(score(open('data/words.txt').read().split()))\n",
+    "game/__init__.py": "",
+    "game/rules.py": "def score(words):\n    return sum(len(w) for w in words)\n",
+    "data/words.txt": "ab cde f\n",
+}
+
+
+class TestProjectWorkspace(unittest.TestCase):
+    """Test suite for ProjectWorkspace."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ws = ProjectWorkspace("demo", root=Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_run_entry_with_imports_and_data(self):
+        """Test that modules import each other and read data files."""
+        self.ws.sync(FILES)
+        res = self.ws.run("main.py")
+        self.assertTrue(res.ok, res.stderr)
+        self.assertEqual(res.stdout.strip(), "6")
+
+    def test_incremental_sync(self):
+        """Test that only changed files are rewritten and removed files deleted."""
+        first = self.ws.sync(FILES)
+        self.assertEqual(first.written, 4)
+
+        edited = dict(FILES)
+        edited["game/rules.py"] = "def score(words):\n    return len(words)\n"
+        del edited["data/words.txt"]
+        edited["data/more.txt"] = "x"
+        second = self.ws.sync(edited)
+        self.assertEqual((second.written, second.deleted, second.unchanged), (2, 1, 2))
+        self.assertFalse((self.ws.path / "data" / "words.txt").exists())
+
+    def test_same_size_edit_is_not_stale(self):
+        """Test that a same-length edit is picked up despite bytecode caching."""
+        files = {"main.py": "import mod\nprint(mod.X)\n", "mod.py": "X = 1\n"}
+        self.ws.sync(files)
+        self.assertEqual(self.ws.run("main.py").stdout.strip(), "1")
+        files["mod.py"] = "X = 2\n"
+        self.ws.sync(files)
+        self.assertEqual(self.ws.run("main.py").stdout.strip(), "2")
+
+    def test_files_modified_by_a_run_are_restored(self):
+        """Test that sync repairs files the program changed while running."""
+        files = {"main.py": "open('state.txt', 'w').write('dirty')\n", "state.txt": "clean"}
+        self.ws.sync(files)
+        self.ws.run("main.py")
+        stats = self.ws.sync(files)
+        self.assertEqual(stats.written, 1)
+        self.assertEqual((self.ws.path / "state.txt").read_text(), "clean")
+
+    def test_rejects_escaping_paths(self):
+        """Test that paths outside the workspace are rejected."""
+        with self.assertRaises(ValueError):
+            self.ws.sync({"../evil.py": "x"})
+
+
+if __name__ == '__main__':
+    unittest.main()
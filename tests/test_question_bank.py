@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Tests for indexed question banks and quiz assembly."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.question_bank import QuestionBank, assemble_quiz, attempt_seed, as_course_quiz, index_path_for
+from src.core.quiz import grade_quiz
+
+
+def _write_bank(path, n=30):
+    levels = ["easy", "medium", "hard"]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            q = {
+                "id": f"q{i}",
+                "module": "m1" if i % 2 == 0 else "m2",
+                "tags": ["loops"] if i % 3 == 0 else ["print"],
+                "difficulty": levels[i % 3],
+                "prompt": f"Question {i}?",
+                "choices": ["a", "b", "c"],
+                "answer_index": i % 3,
+            }
+            f.write(json.dumps(q) + "\n")
+
+
+class TestQuestionBank(unittest.TestCase):
+    """Test suite for QuestionBank and assemble_quiz."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bank_path = Path(self.tmp.name) / "bank.jsonl"
+        _write_bank(self.bank_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_index_filters_and_lazy_get(self):
+        """Test that the index is built once and select/get filter and load questions lazily."""
+        bank = QuestionBank(str(self.bank_path))
+        self.assertEqual(len(bank), 30)
+        self.assertTrue(index_path_for(str(self.bank_path)).exists())
+
+        m1_loops = bank.select(module="m1", tags=["loops"])
+        self.assertEqual(m1_loops, [0, 6, 12, 18, 24])
+        self.assertTrue(all(bank.get(i)["module"] == "m1" for i in m1_loops))
+        self.assertEqual(bank.get(7)["id"], "q7")
+
+    def test_stale_index_is_rebuilt(self):
+        """Test that an index older than its bank is rebuilt."""
+        QuestionBank(str(self.bank_path))
+        _write_bank(self.bank_path, n=9)
+        st = os.stat(self.bank_path)
+        os.utime(self.bank_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(len(QuestionBank(str(self.bank_path))), 9)
+
+    def test_assembly_is_stratified_and_reproducible(self):
+        """Test that a seeded quiz is reproducible and spread across difficulty levels."""
+        bank = QuestionBank(str(self.bank_path))
+        seed = attempt_seed("alice", "m1_quiz", 1)
+        quiz = assemble_quiz(bank, 6, seed)
+        self.assertEqual(quiz, assemble_quiz(bank, 6, seed))
+        self.assertNotEqual(quiz, assemble_quiz(bank, 6, attempt_seed("alice", "m1_quiz", 2)))
+
+        levels = sorted(bank.get(int(q["id"][1:]))["difficulty"] for q in quiz["questions"])
+        self.assertEqual(levels, ["easy", "easy", "hard", "hard", "medium", "medium"])
+        self.assertEqual(len(assemble_quiz(bank, 0, seed, strata={"hard": 3})["questions"]), 3)
+        with self.assertRaises(ValueError):
+            assemble_quiz(bank, 0, seed, strata={"hard": 11})
+
+    def test_pool_too_small_raises(self):
+        """Test that asking for more questions than the filtered pool holds raises ValueError."""
+        bank = QuestionBank(str(self.bank_path))
+        with self.assertRaises(ValueError):
+            assemble_quiz(bank, 16, seed=1, module="m1")
+        with self.assertRaises(ValueError):
+            assemble_quiz(bank, 1, seed=1, module="m9")
+        with self.assertRaises(ValueError):
+            assemble_quiz(bank, 1, seed=1, tags=["no-such-tag"])
+        self.assertEqual(len(assemble_quiz(bank, 15, seed=1, module="m1")["questions"]), 15)
+
+    def test_assembled_quiz_feeds_graders(self):
+        """Test that an assembled quiz is graded like a course quiz."""
+        bank = QuestionBank(str(self.bank_path))
+        quiz = assemble_quiz(bank, 5, seed=7, module="m2")
+        answers = [q["answer_index"] for q in quiz["questions"]]
+        self.assertEqual(grade_quiz(quiz, answers), (True, 100, "5/5 correct (100%)."))
+        self.assertEqual(len(as_course_quiz(quiz)["mcq"]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Tests for the content search index."""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.engine.search import SearchIndex
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test suite for SearchIndex."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = Path(self.tmp.name)
+        self._write("course.json", {"modules": [
+            {"id": "m1", "title": "Python Basics", "objective": "print and strings"},
+            {"id": "m2", "title": "Loops", "objective": "for and while loops"},
+        ]})
+        self._write("lessons/m1/debug.json", {"error_pack": [
+            {"code": "print('Hi)", "error": "SyntaxError: unterminated string literal", "why": "missing quote"},
+            {"code": "prin('x')", "error": "NameError: name 'prin' is not defined", "why": "typo"},
+        ]})
+        self._write("lessons/m2/lesson.json", {"lesson_html": "<h2>Loops</h2><p>A <b>for</b> loop repeats.</p>"})
+        self._write("problems/p1.json", {"title": "Positive Checker", "description_md": "Return YES if x > 0"})
+        self._write("progress.json", {"last_route": "loops"})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, rel, data):
+        p = self.data / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(data), encoding="utf-8")
+
+    def _index(self):
+        index = SearchIndex(self.data)
+        index.update()
+        return index
+
+    def test_ranked_hits_across_content_types(self):
+        """Test that lessons, problems and error packs are searched and ranked together."""
+        index = self._index()
+        hits = index.search("unterminated string")
+        self.assertEqual(hits[0].doc_id, "error:m1:0")
+        self.assertEqual(hits[0].module, "m1")
+        self.assertEqual(index.search("positive")[0].kind, "problem")
+        self.assertEqual(index.search("loop")[0].module, "m2")
+        titles = {h.doc_id: h.title for h in index.search("repeats")}
+        self.assertEqual(titles["lesson:m2"], "Loops (lesson)")
+        self.assertFalse(any(h.doc_id.startswith("progress") for h in index.search("loops")))
+
+    def test_prefix_matching(self):
+        """Test that a partial last word matches by prefix."""
+        index = self._index()
+        self.assertEqual(index.search("untermin")[0].doc_id, "error:m1:0")
+        self.assertEqual(index.search("")[:1], [])
+
+    def test_challenge_solution_is_not_indexed(self):
+        """Test that a challenge is found by its description but not by its solution or starter code."""
+        self._write("lessons/m2/challenge.json", {"coding_challenge": {
+            "title": "Countdown", "description_html": "<p>Print numbers down to zero.</p>",
+            "starter_code": "def scaffold():\n    pass\n", "tests": [],
+            "reference_solution": "def countdown(tally):\n    for n in range(tally, -1, -1):\n        print(n)\n"}})
+        index = self._index()
+        self.assertEqual(index.search("zero")[0].doc_id, "challenge:m2")
+        self.assertEqual(index.search("scaffold"), [])
+        self.assertEqual(index.search("tally"), [])
+
+    def test_incremental_update_and_persistence(self):
+        """Test that a saved index is reopened and only changed files are re-indexed."""
+        index = self._index()
+        index.save()
+        self.assertEqual(index.update(), 0)
+
+        self._write("problems/p2.json", {"title": "Vowel Counter", "description_md": "count vowels"})
+        reopened = SearchIndex(self.data)
+        self.assertEqual(len(reopened), len(index))
+        self.assertEqual(reopened.update(), 1)
+        self.assertEqual(reopened.search("vowel")[0].doc_id, "problem:p2")
+
+        (self.data / "problems/p2.json").unlink()
+        self.assertEqual(reopened.update(), 1)
+        self.assertEqual(reopened.search("vowel"), [])
+
+    def test_large_course_query_is_fast(self):
+        """Test that queries on a thousand-module course stay fast."""
+        modules = [{"id": f"m{i}", "title": f"Module {i}", "objective": f"topic{i % 50} strings loops print",
+                    "lesson_html": f"<p>lesson {i} about topic{i % 50} and variables</p>",
+                    "error_pack": [{"error": "SyntaxError: unterminated string literal", "why": f"case {i}"}]}
+                   for i in range(1000)]
+        self._write("course.json", {"modules": modules})
+        index = self._index()
+        self.assertTrue(index.search("topic7 strin"))
+        # best of several runs, so a busy machine doesn't fail it
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            index.search("topic7 strin")
+            timings.append(time.perf_counter() - start)
+        self.assertLess(min(timings), 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
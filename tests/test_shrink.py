@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Tests for failing-input shrinking."""
+
+import unittest
+from src.engine.shrink import ddmin, shrink_args
+from src.core.grader import grade_problem
+
+
+class TestDdmin(unittest.TestCase):
+    """Test suite for the delta-debugging core."""
+
+    def test_single_culprit(self):
+        """Test that a list shrinks to the one element causing failure."""
+        result = ddmin(list(range(100)), lambda xs: 42 in xs)
+        self.assertEqual(result, [42])
+
+    def test_pair_of_culprits(self):
+        """Test that two interacting elements are both kept."""
+        result = ddmin(list(range(64)), lambda xs: 3 in xs and 60 in xs)
+        self.assertEqual(sorted(result), [3, 60])
+
+    def test_shrink_string_argument(self):
+        """Test shrinking a string argument while other args stay fixed."""
+        result = shrink_args(["abc-def-ghi", 5], lambda a: "-" in a[0] and a[1] == 5)
+        self.assertEqual(result.args, ["-", 5])
+        self.assertFalse(result.exhausted)
+
+    def test_budget_exhausted_keeps_best(self):
+        """Test that an exhausted budget still returns a failing input."""
+        result = shrink_args([list(range(50))], lambda a: 7 in a[0], budget_sec=0.0)
+        self.assertTrue(result.exhausted)
+        self.assertIn(7, result.args[0])
+
+
+class TestGradeProblemShrinking(unittest.TestCase):
+    """Test suite for minimal reproducers in grade_problem feedback."""
+
+    def test_crash_is_shrunk(self):
+        """Test that a crashing list input is reduced in the feedback."""
+        code = "def total(xs):\n    return sum(100 // x for x in xs)\n"
+        spec = {"function": "total", "tests": [{"input": [list(range(5, -40, -1))], "expected": 0}]}
+        ok, msg = grade_problem(code, spec)
+        self.assertFalse(ok)
+        self.assertIn("Minimal failing input: [[0]]", msg)
+
+    def test_mismatch_needs_reference(self):
+        """Test that wrong answers shrink only against a reference solution."""
+        code = "def longest(s):\n    return len(s) if 'x' not in s else 0\n"
+        spec = {"function": "longest", "tests": [{"input": ["aaxaa" * 20], "expected": 100}]}
+        ok, msg = grade_problem(code, spec)
+        self.assertFalse(ok)
+        self.assertNotIn("Minimal failing input", msg)
+
+        spec["reference_solution"] = "def longest(s):\n    return len(s)\n"
+        ok, msg = grade_problem(code, spec)
+        self.assertIn("Minimal failing input: ['x']", msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
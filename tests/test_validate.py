@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Tests for executable content validation."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.engine.validate import check_error, validate_content
+
+
+class TestValidateContent(unittest.TestCase):
+    """Test suite for validate_content."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = Path(self.tmp.name) / "data"
+        self.cache = Path(self.tmp.name) / "cache.json"
+        self._write("problems/good.json", {
+            "function": "double", "tests": [{"input": [2], "expected": 4}],
+            "reference_solution": "def double(x):\n    return 2 * x\n",
+        })
+        self._write("lessons/m1/debug.json", {"error_pack": [
+            {"code": "print('Hi)", "error": "SyntaxError: unterminated string literal"},
+            {"code": "x = 1\nprint(x)", "error": "NameError: name 'y' is not defined"},
+        ]})
+        self._write("lessons/m1/lesson.json", {"examples": [
+            {"code": "print(1 + 1)\n", "expected_output": "2\n"},
+        ]})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, rel, data):
+        p = self.data / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(data), encoding="utf-8")
+
+    def _run(self):
+        return {v.where: v for v in validate_content(self.data, jobs=4, cache_path=self.cache)}
+
+    def test_executes_and_reports(self):
+        """Test that content snippets are executed and a verdict reported per snippet."""
+        verdicts = self._run()
+        self.assertTrue(verdicts["problems/good.json#reference_solution"].ok)
+        self.assertTrue(verdicts["lessons/m1/debug.json#error_pack[0]"].ok)
+        self.assertFalse(verdicts["lessons/m1/debug.json#error_pack[1]"].ok)
+        self.assertTrue(verdicts["lessons/m1/lesson.json#examples[0]"].ok)
+
+    def test_wrong_reference_and_bad_schema_fail(self):
+        """Test that a wrong reference solution and a malformed quiz fail validation."""
+        self._write("problems/bad.json", {
+            "function": "double", "tests": [{"input": [2], "expected": 5}],
+            "reference_solution": "def double(x):\n    return 2 * x\n",
+        })
+        self._write("quizzes/q.json", {"questions": [{"choices": ["a"], "answer_index": 4}]})
+        verdicts = self._run()
+        self.assertFalse(verdicts["problems/bad.json#reference_solution"].ok)
+        self.assertIn("schema", verdicts["quizzes/q.json"].message)
+
+    def test_passing_verdicts_are_cached_by_content(self):
+        """Test that passing verdicts are reused until the snippet changes."""
+        self._run()
+        again = self._run()
+        self.assertTrue(again["problems/good.json#reference_solution"].cached)
+        self.assertFalse(again["lessons/m1/debug.json#error_pack[1]"].cached)
+
+        self._write("lessons/m1/lesson.json", {"examples": [{"code": "print(3)\n", "expected_output": "3\n"}]})
+        edited = self._run()
+        self.assertFalse(edited["lessons/m1/lesson.json#examples[0]"].cached)
+        self.assertTrue(edited["problems/good.json#reference_solution"].cached)
+
+    def test_error_claims_without_message(self):
+        """Test that error claims are checked by type, and ones naming no error type pass with a note."""
+        self.assertEqual(check_error({"code": "for i in range(3):\nprint(i)", "error": "IndentationError"}), (True, ""))
+        ok, msg = check_error({"code": "x = 1", "error": "Off-by-one (logic error)"})
+        self.assertTrue(ok)
+        self.assertIn("not checked", msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Tests for content change detection."""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from src.core.cache import get_content_cache
+from src.core.io import load_json
+from src.core.watch import PollingWatcher, changed_paths, snapshot
+
+
+class TestContentWatch(unittest.TestCase):
+    """Test suite for snapshot diffs and PollingWatcher."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "problems").mkdir()
+        self._write("course.json", {"modules": []})
+        self._write("problems/p1.json", {"title": "P1"})
+        self._write("progress.json", {"last_route": "boot"})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, rel, data):
+        (self.root / rel).write_text(json.dumps(data), encoding="utf-8")
+
+    def test_snapshot_diff_is_per_file(self):
+        """Test that snapshots report just the content files that changed."""
+        before = snapshot(self.root)
+        self.assertEqual(set(before), {"course.json", "problems/p1.json"})
+        self._write("problems/p1.json", {"title": "Problem one"})
+        self._write("problems/p2.json", {"title": "P2"})
+        self._write("progress.json", {"last_route": "quiz"})
+        self.assertEqual(changed_paths(before, snapshot(self.root)), {"problems/p1.json", "problems/p2.json"})
+
+    def test_save_burst_is_one_reload_and_invalidates_cache(self):
+        """Test that a burst of saves triggers one reload and drops stale cache entries."""
+        path = str(self.root / "problems/p1.json")
+        self.assertEqual(load_json(path)["title"], "P1")
+        batches = []
+        done = threading.Event()
+
+        def on_change(rels):
+            batches.append(rels)
+            done.set()
+
+        watcher = PollingWatcher(on_change, self.root, interval_sec=0.02, debounce_sec=0.15)
+        watcher.start()
+        try:
+            for i in range(4):
+                self._write("problems/p1.json", {"title": f"edit {i}" + " " * i})
+                time.sleep(0.03)
+            self.assertTrue(done.wait(3))
+            time.sleep(0.3)
+        finally:
+            watcher.stop()
+
+        self.assertEqual(batches, [{"problems/p1.json"}])
+        entries = get_content_cache().stats().entries
+        self.assertEqual(load_json(path)["title"], "edit 3   ")
+        self.assertEqual(get_content_cache().stats().entries, entries + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()